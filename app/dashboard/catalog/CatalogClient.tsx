@@ -13,6 +13,7 @@ import { QuickViewModal } from "@/components/cars/QuickViewModal"
 import { EnquiryModal } from "@/components/cars/EnquiryModal"
 import { getContrastText, getReadableAccent } from "@/lib/utils/color-contrast"
 import { getVehicleImageUrls } from "@/lib/utils/brand-model-images"
+import { loadCatalogSearchIndex, searchCatalog, type CatalogSearchIndex } from "@/lib/utils/catalog-search"
 
 type CategoryKey = CatalogCategory
 
@@ -339,6 +340,16 @@ function normalizeCatalogKey(value: string) {
     return value.toLowerCase().replace(/[^a-z0-9]+/g, " ").replace(/\s+/g, " ").trim()
 }
 
+// Catalog tab → search-index category (the index has no 3W catalog)
+const SEARCH_INDEX_CATEGORY: Partial<Record<CategoryKey, string>> = { "4w": "4w", "2w": "2w" }
+
+/** Same brand under the catalog's and the index's naming ("Honda" / "Honda Motorcycle & Scooter India"). */
+function sameBrand(a: string, b: string) {
+    const x = normalizeCatalogKey(a)
+    const y = normalizeCatalogKey(b)
+    return x === y || x.startsWith(`${y} `) || y.startsWith(`${x} `)
+}
+
 function modelIdentity(model: Pick<CatalogModel, "category" | "brand" | "model">) {
     return `${model.category}:${normalizeCatalogKey(model.brand)}:${normalizeCatalogKey(model.model)}`
 }
@@ -536,6 +547,7 @@ export function CatalogClient({ models: initialModels }: Props) {
     const [isLoading, setIsLoading] = useState(!initialModels)
     const [activeTab, setActiveTab] = useState<CategoryKey>("4w")
     const [search, setSearch]       = useState("")
+    const [searchIndex, setSearchIndex] = useState<CatalogSearchIndex | null>(null)
     const [addOpen, setAddOpen] = useState(false)
     const [addForm, setAddForm] = useState<AddModelForm>(() => blankAddModelForm("4w"))
     const [savingModel, setSavingModel] = useState(false)
@@ -589,6 +601,25 @@ export function CatalogClient({ models: initialModels }: Props) {
         "3w": models.filter((m) => m.category === "3w").length,
     }), [models])
 
+    // Typo-tolerant matches from the prebuilt index, fetched on first search;
+    // the substring filter below keeps working if it cannot be loaded
+    useEffect(() => {
+        if (searchIndex || !search.trim()) return
+        let cancelled = false
+        loadCatalogSearchIndex()
+            .then((index) => { if (!cancelled) setSearchIndex(index) })
+            .catch(() => {})
+        return () => {
+            cancelled = true
+        }
+    }, [search, searchIndex])
+
+    const indexHits = useMemo(() => {
+        const category = SEARCH_INDEX_CATEGORY[activeTab]
+        if (!searchIndex || !category || !search.trim()) return []
+        return searchCatalog(searchIndex, search, { limit: 50, category })
+    }, [searchIndex, search, activeTab])
+
     const brandSections = useMemo(() => {
         const q = search.toLowerCase().trim()
         return brands
@@ -598,9 +629,15 @@ export function CatalogClient({ models: initialModels }: Props) {
                     model.category === brand.category &&
                     normalizeCatalogKey(model.brand) === normalizeCatalogKey(brand.brand)
                 )
-                const brandMatches = !q || brand.brand.toLowerCase().includes(q)
+                const brandMatches = !q || brand.brand.toLowerCase().includes(q) ||
+                    indexHits.some((hit) => hit.kind === "brand" && sameBrand(hit.brand, brand.brand))
                 const filteredModels = brandModels.filter((model) =>
-                    !q || brandMatches || model.model.toLowerCase().includes(q)
+                    !q || brandMatches || model.model.toLowerCase().includes(q) ||
+                    indexHits.some((hit) =>
+                        hit.model !== null &&
+                        sameBrand(hit.brand, brand.brand) &&
+                        normalizeCatalogKey(hit.model) === normalizeCatalogKey(model.model)
+                    )
                 )
 
                 if (q && !brandMatches && filteredModels.length === 0) return null
@@ -611,7 +648,7 @@ export function CatalogClient({ models: initialModels }: Props) {
                 }
             })
             .filter((section): section is CatalogBrand & { models: CatalogModel[] } => Boolean(section))
-    }, [models, brands, activeTab, search])
+    }, [models, brands, activeTab, search, indexHits])
 
     const selectedCount = brands.length
     const activeCategoryBrands = brands.filter((brand) => brand.category === activeTab)
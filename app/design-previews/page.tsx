@@ -63,7 +63,7 @@ const designs: DesignOption[] = [
         tone: "Fast, bright, high-converting",
         bestFor: "Aggressive lead-generation",
         palette: "White / Signal Red / Indigo",
-        image: "/assets/hero/tata-motors.jpg",
+        image: "/assets/hero/tata-motors.webp",
     },
     {
         id: "local",
@@ -46,6 +46,7 @@ import { createPortal } from "react-dom";
 
 import { Button } from "@/components/ui/button";
 import { getBrandLogo } from "@/lib/data/brand-logos";
+import { getBrandLogoSprite } from "@/lib/utils/brand-logos";
 import { useOnboardingStore } from "@/lib/store/onboarding-store";
 import type { Car as CarType } from "@/lib/types/car";
 import { cn } from "@/lib/utils";
@@ -982,6 +983,19 @@ function PremiumInventorySection() {
     );
 }
 
+// Logo area inside the 96×64 tile chip (px-3, max-h-12)
+const BRAND_TILE_LOGO_BOX = { width: 72, height: 48 };
+
+// Packed logos render from their segment's sprite sheet (one request per grid);
+// anything not packed (SVGs) falls back to its own image.
+function BrandTileLogo({ name, logo }: { name: string; logo: string }) {
+    const sprite = getBrandLogoSprite(logo, BRAND_TILE_LOGO_BOX);
+    if (sprite) {
+        return <span role="img" aria-label={name} style={sprite} className="block transition group-hover:scale-105" />;
+    }
+    return <Image src={logo} alt={name} width={96} height={64} unoptimized className="max-h-12 w-auto object-contain transition group-hover:scale-105" />;
+}
+
 function BrandTile({ name, logo }: { name: string; logo: string | null }) {
     return (
         <Link href="/brands" className="group flex flex-col items-center gap-4 rounded-xl p-3 transition hover:bg-white hover:shadow-[0_16px_40px_rgba(7,20,54,0.08)] dark:hover:bg-slate-900">
@@ -990,7 +1004,7 @@ function BrandTile({ name, logo }: { name: string; logo: string | null }) {
                 from opaque-bg PNGs, no low contrast on the dark section). */}
             <div className="flex h-16 w-24 items-center justify-center rounded-xl border border-slate-200 bg-white px-3 dark:border-slate-700">
                 {logo ? (
-                    <Image src={logo} alt={name} width={96} height={64} unoptimized className="max-h-12 w-auto object-contain transition group-hover:scale-105" />
+                    <BrandTileLogo name={name} logo={logo} />
                 ) : (
                     <span className="flex h-12 w-12 items-center justify-center rounded-full bg-[#EEF4FF] text-lg font-black text-[#155EEF]">
                         {name.slice(0, 2).toUpperCase()}
@@ -1009,7 +1023,7 @@ function BeyondBrandTile({ name, logo, href, caption }: { name: string; logo: st
     return (
         <Link href={href} className="group flex flex-col items-center gap-4 rounded-xl p-3 text-center transition hover:bg-white hover:shadow-[0_16px_40px_rgba(7,20,54,0.08)] dark:hover:bg-slate-900">
             <div className="flex h-16 w-24 items-center justify-center rounded-xl border border-slate-200 bg-white px-3 dark:border-slate-700">
-                <Image src={logo} alt={name} width={96} height={64} unoptimized className="max-h-12 w-auto object-contain transition group-hover:scale-105" />
+                <BrandTileLogo name={name} logo={logo} />
             </div>
             <div>
                 <span className="block text-sm font-semibold text-[#35445C] dark:text-slate-300">{name}</span>
@@ -4,7 +4,7 @@ import type { Car, CarVariant } from '@/lib/types/car'
 import { CAR_MODEL_COLORS } from '@/lib/data/car-colors'
 import { fetchCardekhoGallery } from '@/lib/data/cardekho-gallery'
 import { get4WPriceMaxInr, get4WPriceMinInr } from '@/lib/data/four-wheelers'
-import { brandNameToId, getVehicleImageUrls } from '@/lib/utils/brand-model-images'
+import { brandNameToId, getVehicleImageUrls, modelToSlug } from '@/lib/utils/brand-model-images'
 import { getRequestOrigin } from '@/lib/utils/request-origin'
 
 const MAKE_TO_JSON: Record<string, string> = {
@@ -210,7 +210,27 @@ async function getBrandVariants(make: string): Promise<Record<string, unknown>[]
     return raw ? flattenBrandVariants(raw) : []
 }
 
+// brand jsonKey → model slug → shard path; written by scripts/build_model_shards.py,
+// whose --check step in CI fails when a brand file changed without rebuilding its shards
+type ModelShardManifest = Record<string, Record<string, string>>
+
+// One model's variants from its hashed shard (a few KB) instead of the whole brand file
+async function getModelShardVariants(make: string, model: string): Promise<Record<string, unknown>[]> {
+    const jsonKey = MAKE_TO_JSON[make.toLowerCase()]
+    if (!jsonKey) return []
+
+    const manifest = await getPublicJson<ModelShardManifest>('/data/model-shards/manifest.json')
+    const shardPath = manifest?.[jsonKey]?.[modelToSlug(model)]
+    if (!shardPath) return []
+
+    const raw = await getPublicJson<unknown>(`/data/model-shards/${shardPath}`)
+    return raw ? flattenBrandVariants(raw) : []
+}
+
 async function getMatchingModelVariants(make: string, model: string): Promise<Record<string, unknown>[]> {
+    const shardVariants = await getModelShardVariants(make, model)
+    if (shardVariants.length > 0) return shardVariants
+
     const normalizedModel = normalizeText(model)
     const variants = await getBrandVariants(make)
     const exactMatches = variants.filter(entry => {
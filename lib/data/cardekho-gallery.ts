@@ -6,6 +6,13 @@ import { cache } from 'react'
 import { brandNameToId, modelToSlug } from '@/lib/utils/brand-model-images'
 import { getRequestOrigin } from '@/lib/utils/request-origin'
 
+export interface GalleryImagePlaceholder {
+    width: number
+    height: number
+    color: string
+    lqip: string
+}
+
 export interface CardekhoGalleryData {
     sourceUrl: string
     hero: string | null
@@ -13,7 +20,21 @@ export interface CardekhoGalleryData {
     interior: string[]
     colorNames: string[]
     colorImages: string[]
+    // Paint hex per colorImages entry; written by scripts/build_color_swatches.py
+    colorSwatches?: (string | null)[]
     feature: string[]
+    // Keyed by image URL; written by scripts/build_gallery_placeholders.py
+    placeholders?: Record<string, GalleryImagePlaceholder>
+}
+
+interface GalleryColorSwatch {
+    hex: string
+    palette: string[]
+}
+
+type GalleryMetadata = Omit<Partial<CardekhoGalleryData>, 'colorSwatches'> & {
+    sourceUrl?: string
+    colorSwatches?: (GalleryColorSwatch | null)[]
 }
 
 interface GalleryLookupOptions {
@@ -32,10 +53,28 @@ function normalizeLocalGalleryAssetUrl(url: string, publicBase: string): string
     return `${publicBase}/${tail}`.replace(/\/+/g, '/')
 }
 
+function swatchHexes(values: (GalleryColorSwatch | null)[] | undefined): (string | null)[] | undefined {
+    return values?.map((value) => value?.hex ?? null)
+}
+
 function normalizeLocalGalleryAssetUrls(values: string[] | undefined, publicBase: string): string[] {
     return (values ?? []).map((value) => normalizeLocalGalleryAssetUrl(value, publicBase))
 }
 
+// metadata.json keys placeholders by path relative to the gallery folder,
+// or by full URL for images published under content-hashed keys
+function normalizeGalleryPlaceholders(
+    values: Record<string, GalleryImagePlaceholder> | undefined,
+    publicBase: string,
+): Record<string, GalleryImagePlaceholder> {
+    const placeholders: Record<string, GalleryImagePlaceholder> = {}
+    for (const [tail, value] of Object.entries(values ?? {})) {
+        const key = /^https?:\/\//.test(tail) ? tail : `${publicBase}/${tail}`.replace(/\/+/g, '/')
+        placeholders[key] = value
+    }
+    return placeholders
+}
+
 function slugify(value: string): string {
     return String(value || '')
         .toLowerCase()
@@ -256,7 +295,7 @@ async function loadLocalGallery(sourceUrl: string, options?: GalleryLookupOption
                 : null
             const metadata = JSON.parse(
                 await fs.readFile(candidate, 'utf8')
-            ) as Partial<CardekhoGalleryData> & { sourceUrl?: string }
+            ) as GalleryMetadata
 
             return {
                 sourceUrl: metadata.sourceUrl ?? sourceUrl,
@@ -265,7 +304,9 @@ async function loadLocalGallery(sourceUrl: string, options?: GalleryLookupOption
                 interior: publicBase ? normalizeLocalGalleryAssetUrls(metadata.interior, publicBase) : metadata.interior ?? [],
                 colorNames: metadata.colorNames ?? [],
                 colorImages: publicBase ? normalizeLocalGalleryAssetUrls(metadata.colorImages, publicBase) : metadata.colorImages ?? [],
+                colorSwatches: swatchHexes(metadata.colorSwatches),
                 feature: publicBase ? normalizeLocalGalleryAssetUrls(metadata.feature, publicBase) : metadata.feature ?? [],
+                placeholders: publicBase ? normalizeGalleryPlaceholders(metadata.placeholders, publicBase) : undefined,
             }
         } catch {
             continue
@@ -285,7 +326,7 @@ async function loadLocalGallery(sourceUrl: string, options?: GalleryLookupOption
             })
             if (!response.ok) continue
 
-            const metadata = await response.json() as Partial<CardekhoGalleryData> & { sourceUrl?: string }
+            const metadata = await response.json() as GalleryMetadata
             const normalizedBase = `/${publicPath.split(path.sep).join('/').replace(/\/metadata\.json$/, '')}`
             return {
                 sourceUrl: metadata.sourceUrl ?? sourceUrl,
@@ -294,7 +335,9 @@ async function loadLocalGallery(sourceUrl: string, options?: GalleryLookupOption
                 interior: normalizeLocalGalleryAssetUrls(metadata.interior, normalizedBase),
                 colorNames: metadata.colorNames ?? [],
                 colorImages: normalizeLocalGalleryAssetUrls(metadata.colorImages, normalizedBase),
+                colorSwatches: swatchHexes(metadata.colorSwatches),
                 feature: normalizeLocalGalleryAssetUrls(metadata.feature, normalizedBase),
+                placeholders: normalizeGalleryPlaceholders(metadata.placeholders, normalizedBase),
             }
         } catch {
             continue
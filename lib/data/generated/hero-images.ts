@@ -0,0 +1,85 @@
+// Generated by scripts/build_hero_images.py from scripts/hero_manifest.json. Do not edit.
+
+// 2W brands that have their own dedicated hero images in /assets/hero/
+export const HERO_2W: Record<string, string> = {
+    'ather': 'jpg',
+    'ola': 'jpg',
+};
+
+// 4W hero images in /assets/hero/
+export const HERO_4W: Record<string, string> = {
+    'audi': 'jpg',
+    'bentley': 'jpg',
+    'bmw': 'webp',
+    'byd': 'webp',
+    'citroen': 'jpg',
+    'force-motors': 'png',
+    'hyundai': 'png',
+    'isuzu': 'webp',
+    'jaguar': 'jpg',
+    'jeep': 'jpg',
+    'kia': 'jpg',
+    'lamborghini': 'webp',
+    'land-rover': 'webp',
+    'lexus': 'jpg',
+    'mahindra': 'jpg',
+    'maruti-suzuki': 'jpg',
+    'mercedes-benz': 'jpg',
+    'mg': 'webp',
+    'mini': 'jpg',
+    'nissan': 'jpg',
+    'porsche': 'webp',
+    'renault': 'webp',
+    'skoda': 'webp',
+    'tata-motors': 'webp',
+    'toyota': 'jpg',
+    'vinfast': 'jpg',
+    'volkswagen': 'jpg',
+    'volvo': 'jpg',
+};
+
+// Brand display name → hero image path
+export const HERO_IMAGES: Record<string, string> = {
+    'Ather Energy': '/assets/hero/ather.jpg',
+    'Audi': '/assets/hero/audi.jpg',
+    'Bentley': '/assets/hero/bentley.jpg',
+    'BMW': '/assets/hero/bmw.webp',
+    'BYD': '/assets/hero/byd.webp',
+    'Citroen': '/assets/hero/citroen.jpg',
+    'Force Motors': '/assets/hero/force-motors.png',
+    'Hyundai': '/assets/hero/hyundai.png',
+    'Isuzu': '/assets/hero/isuzu.webp',
+    'Jaguar': '/assets/hero/jaguar.jpg',
+    'Jeep': '/assets/hero/jeep.jpg',
+    'Kia': '/assets/hero/kia.jpg',
+    'Lamborghini': '/assets/hero/lamborghini.webp',
+    'Land Rover': '/assets/hero/land-rover.webp',
+    'Lexus': '/assets/hero/lexus.jpg',
+    'Mahindra': '/assets/hero/mahindra.jpg',
+    'Maruti Suzuki': '/assets/hero/maruti-suzuki.jpg',
+    'Mercedes-Benz': '/assets/hero/mercedes-benz.jpg',
+    'MG': '/assets/hero/mg.webp',
+    'MINI': '/assets/hero/mini.jpg',
+    'Nissan': '/assets/hero/nissan.jpg',
+    'Ola Electric': '/assets/hero/ola.jpg',
+    'Porsche': '/assets/hero/porsche.webp',
+    'Renault': '/assets/hero/renault.webp',
+    'Skoda': '/assets/hero/skoda.webp',
+    'Tata Motors': '/assets/hero/tata-motors.webp',
+    'Toyota': '/assets/hero/toyota.jpg',
+    'VinFast': '/assets/hero/vinfast.jpg',
+    'Volkswagen': '/assets/hero/volkswagen.jpg',
+    'Volvo': '/assets/hero/volvo.jpg',
+};
+
+export interface HeroSource {
+    media: string;
+    type: string;
+    srcSet: string;
+    width: number;
+    height: number;
+}
+
+// Breakpoint renditions per slug, in <picture> source order (scripts/build_hero_renditions.py)
+export const HERO_SRCSET: Record<string, HeroSource[]> = {
+};
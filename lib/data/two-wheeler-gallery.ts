@@ -9,6 +9,8 @@ import { brandNameToId, build2WColorMetadataSlugCandidates, modelToSlug } from '
 interface BikeWaleColorImage {
     name: string
     image: string
+    // Paint hex from scripts/build_color_swatches.py (local colour galleries only)
+    swatch?: string
 }
 
 interface BikeWaleColorGallery {
@@ -22,6 +24,7 @@ interface LocalColorMetadata {
         name?: string | null
         image?: string | null
         file?: string | null
+        swatch?: { hex?: string } | null
     }>
 }
 
@@ -254,6 +257,7 @@ function loadLocalColorGallery(brandId: string, model: string): BikeWaleColorGal
                     return {
                         name: color.name?.trim() ?? '',
                         image: image ?? '',
+                        ...(color.swatch?.hex ? { swatch: color.swatch.hex } : {}),
                     }
                 })
                 .filter(color => color.name && color.image && localPublicFileExists(color.image))
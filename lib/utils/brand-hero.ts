@@ -3,72 +3,49 @@
  * Returns the hero image path for a given brand
  */
 
+import { HERO_2W, HERO_4W, HERO_SRCSET, type HeroSource } from '@/lib/data/generated/hero-images';
+
 // Aliases: long/variant brand names → the hero image slug (4W only)
 const BRAND_ALIASES_4W: Record<string, string> = {
     'bmw-motorrad-india': 'bmw',  // fallback only if no 2W hero exists
 };
 
-// 2W brands that have their own dedicated hero images in /assets/hero/
-const HERO_2W: Record<string, string> = {
-    'ather': 'jpg',
-    'ola': 'jpg',
-};
-
-// 4W hero images in /assets/hero/
-const HERO_4W: Record<string, string> = {
-    'audi': 'jpg',
-    'bentley': 'jpg',
-    'bmw': 'png',
-    'byd': 'webp',
-    'citroen': 'jpg',
-    'force-motors': 'png',
-    'honda': 'jpg',
-    'hyundai': 'png',
-    'isuzu': 'jpg',
-    'jaguar': 'jpg',
-    'jeep': 'jpg',
-    'kia': 'jpg',
-    'lamborghini': 'jpg',
-    'land-rover': 'jpg',
-    'lexus': 'png',
-    'mahindra': 'jpg',
-    'maruti-suzuki': 'jpg',
-    'mercedes-benz': 'jpg',
-    'mg': 'jpg',
-    'mini': 'jpg',
-    'nissan': 'jpg',
-    'porsche': 'jpg',
-    'renault': 'webp',
-    'skoda': 'jpg',
-    'tata-motors': 'jpg',
-    'tesla': 'jpg',
-    'toyota': 'jpg',
-    'vinfast': 'jpg',
-    'volkswagen': 'jpg',
-    'volvo': 'jpg',
-};
-
-export function getBrandHeroImage(brandName: string, vehicleType?: '2w' | '3w' | '4w'): string {
+// Slug of the brand's own hero image, or null when it has none
+function resolveHeroSlug(brandName: string, vehicleType?: '2w' | '3w' | '4w'): string | null {
     const slug = brandName.toLowerCase().replace(/\s+/g, '-');
 
-    // For 2W/3W brands: use a dedicated hero if available, else use a scraped model image
     if (vehicleType === '2w' || vehicleType === '3w') {
-        // Check for dedicated 2W hero image first
+        // Check for dedicated 2W hero image
         const alias2w = slug.replace(/-energy$/, '').replace(/-electric$/, '');
-        if (HERO_2W[alias2w]) {
-            return `/assets/hero/${alias2w}.${HERO_2W[alias2w]}`;
-        }
-        // No dedicated hero — return empty so the template can use its own fallback
-        // (e.g. scraped brand image or gradient-only hero)
-        return '';
+        return HERO_2W[alias2w] ? alias2w : null;
     }
 
-    // 4W: resolve aliases and look up hero image
+    // 4W: resolve aliases
     const resolved = BRAND_ALIASES_4W[slug] ?? slug;
-    if (HERO_4W[resolved]) {
-        return `/assets/hero/${resolved}.${HERO_4W[resolved]}`;
+    return HERO_4W[resolved] ? resolved : null;
+}
+
+export function getBrandHeroImage(brandName: string, vehicleType?: '2w' | '3w' | '4w'): string {
+    const slug = resolveHeroSlug(brandName, vehicleType);
+    const is2w = vehicleType === '2w' || vehicleType === '3w';
+
+    if (slug) {
+        return `/assets/hero/${slug}.${is2w ? HERO_2W[slug] : HERO_4W[slug]}`;
     }
-    return DEFAULT_HERO_IMAGE;
+    // 2W/3W: no dedicated hero — return empty so the template can use its own fallback
+    // (e.g. scraped brand image or gradient-only hero)
+    return is2w ? '' : DEFAULT_HERO_IMAGE;
+}
+
+/**
+ * Breakpoint <picture> sources (AVIF/WebP, art-directed crops) for the brand hero.
+ * Empty when the brand has no hero or its renditions are not built (they are
+ * build output of scripts/build_hero_renditions.py, not committed); render
+ * getBrandHeroImage() as the <img> fallback either way.
+ */
+export function getBrandHeroSources(brandName: string, vehicleType?: '2w' | '3w' | '4w'): HeroSource[] {
+    const slug = resolveHeroSlug(brandName, vehicleType);
+    return slug ? HERO_SRCSET[slug] ?? [] : [];
 }
 
 // Fallback hero image if brand not found (4W only)
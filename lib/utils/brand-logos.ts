@@ -1,3 +1,6 @@
+import type { CSSProperties } from "react";
+
+import logoSprites from "@/lib/data/generated/logo-sprites.json";
 import type { OnboardingVehicleSegment } from "@/lib/types";
 
 const anyBrandLogos: Record<string, string> = {
@@ -61,6 +64,44 @@ export function getBrandLogoPath(brand?: string, segment?: OnboardingVehicleSegm
     return (segment ? segmentBrandLogos[segment]?.[key] : undefined) ?? anyBrandLogos[key];
 }
 
+type LogoSpriteTier = keyof typeof logoSprites.tiers;
+
+type LogoSpriteSheets = {
+    sheets: string[];
+    sheetSizes: number[][];
+    logos: Record<string, { sheet: number; x: number; y: number; w: number; h: number }>;
+};
+
+/**
+ * Sprite-sheet background for a logo path (scripts/build_logo_sprites.py packs
+ * the logos the brand grids render, one sheet per segment). With a box, the
+ * logo is scaled down to fit it like object-contain. Undefined for SVGs and
+ * unpacked logos, so callers fall back to the plain image.
+ */
+export function getBrandLogoSprite(
+    logoPath?: string | null,
+    box?: { width: number; height: number },
+    tier: LogoSpriteTier = "md"
+): CSSProperties | undefined {
+    if (!logoPath) return undefined;
+
+    const sheet = logoSprites.tiers[tier] as LogoSpriteSheets;
+    const spot = sheet.logos[logoPath];
+    if (!spot) return undefined;
+
+    const [sheetWidth, sheetHeight] = sheet.sheetSizes[spot.sheet];
+    const scale = box ? Math.min(1, (box.width * logoSprites.density) / spot.w, (box.height * logoSprites.density) / spot.h) : 1;
+    const px = (value: number) => (value * scale) / logoSprites.density;
+    return {
+        backgroundImage: `url(${sheet.sheets[spot.sheet]})`,
+        backgroundSize: `${px(sheetWidth)}px ${px(sheetHeight)}px`,
+        backgroundPosition: `${-px(spot.x)}px ${-px(spot.y)}px`,
+        backgroundRepeat: "no-repeat",
+        width: px(spot.w),
+        height: px(spot.h),
+    };
+}
+
 export function getBrandInitials(brand?: string) {
     if (!brand) return "DS";
 
@@ -0,0 +1,211 @@
+/**
+ * Typeahead over every brand, model and variant in the catalog.
+ *
+ * Reads the precomputed index from `scripts/build_search_index.py`
+ * (`/data/search-index.json`, fetched once per page load) and runs the same
+ * query as its Python `search()`: every query word must match a doc token
+ * exactly, as a prefix, or — for words of 4+ letters with no prefix match —
+ * within one or two typos: swapped adjacent letters are tried as prefixes,
+ * other typos are found through the trigram table and an OSA distance check.
+ * Docs are numbered by static rank (brands, models, variants, each by
+ * popularity), so ties keep index order.
+ */
+
+export type SearchResultKind = "brand" | "model" | "variant";
+
+export type CatalogSearchResult = {
+    kind: SearchResultKind;
+    name: string;
+    brand: string;
+    model: string | null;
+    category: string;
+    slug: string;
+    price: number | null;
+    band: number;
+};
+
+export type CatalogSearchIndex = {
+    version: number;
+    categories: string[];
+    bandEdges: number[];
+    docs: {
+        kind: number[];
+        name: string[];
+        brand: number[];
+        model: number[];
+        category: number[];
+        slug: string[];
+        price: (number | null)[];
+        band: number[];
+        popularity: number[];
+    };
+    tokens: string[];
+    postings: number[][];
+    trigrams: Record<string, number[]>;
+};
+
+const INDEX_URL = "/data/search-index.json";
+const KINDS: SearchResultKind[] = ["brand", "model", "variant"];
+const MATCH_EXACT = 3;
+const MATCH_PREFIX = 2;
+const MATCH_FUZZY = 1;
+const KIND_BOOST = [0.6, 0.4, 0];
+const FUZZY_MIN = 4;
+
+let indexPromise: Promise<CatalogSearchIndex> | null = null;
+
+/** The search index, fetched on first use and shared afterwards. */
+export function loadCatalogSearchIndex(): Promise<CatalogSearchIndex> {
+    if (!indexPromise) {
+        indexPromise = fetch(INDEX_URL)
+            .then((res) => {
+                if (!res.ok) throw new Error(`search index: HTTP ${res.status}`);
+                return res.json() as Promise<CatalogSearchIndex>;
+            })
+            .catch((err) => {
+                indexPromise = null; // let the next keystroke retry
+                throw err;
+            });
+    }
+    return indexPromise;
+}
+
+/** Lower-case ASCII words — "Citroën C3" → ["citroen", "c3"]. */
+function tokenize(text: string): string[] {
+    return text.normalize("NFKD").replace(/[^\x00-\x7f]/g, "").toLowerCase().match(/[a-z0-9]+/g) ?? [];
+}
+
+function trigrams(token: string): string[] {
+    const grams: string[] = [];
+    for (let i = 0; i + 3 <= token.length; i++) grams.push(token.slice(i, i + 3));
+    return grams;
+}
+
+/** First index in the sorted array whose value is >= target. */
+function lowerBound(sorted: string[], target: string): number {
+    let lo = 0;
+    let hi = sorted.length;
+    while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (sorted[mid] < target) lo = mid + 1;
+        else hi = mid;
+    }
+    return lo;
+}
+
+/** [first, end) ids of the tokens starting with term. */
+function prefixRange(tokens: string[], term: string): [number, number] {
+    return [lowerBound(tokens, term), lowerBound(tokens, term + "\x7f")];
+}
+
+/** Optimal-string-alignment distance, abandoned once it must exceed limit. */
+function editDistance(a: string, b: string, limit: number): number {
+    if (Math.abs(a.length - b.length) > limit) return limit + 1;
+    let previous2: number[] | null = null;
+    let previous = Array.from({ length: b.length + 1 }, (_, j) => j);
+    for (let i = 1; i <= a.length; i++) {
+        const current = [i];
+        let rowMin = i;
+        for (let j = 1; j <= b.length; j++) {
+            const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+            let value = Math.min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost);
+            if (previous2 && i > 1 && j > 1 && a[i - 1] === b[j - 2] && a[i - 2] === b[j - 1]) {
+                value = Math.min(value, previous2[j - 2] + 1);
+            }
+            current.push(value);
+            rowMin = Math.min(rowMin, value);
+        }
+        if (rowMin > limit) return limit + 1;
+        previous2 = previous;
+        previous = current;
+    }
+    return previous[b.length];
+}
+
+/** Token id → match quality for one query word. */
+function matchTokens(index: CatalogSearchIndex, term: string): Map<number, number> {
+    const { tokens } = index;
+    const matched = new Map<number, number>();
+    const [lo, hi] = prefixRange(tokens, term);
+    for (let t = lo; t < hi; t++) matched.set(t, tokens[t] === term ? MATCH_EXACT : MATCH_PREFIX);
+    if (matched.size > 0 || term.length < FUZZY_MIN) return matched;
+
+    // an adjacent swap ("swfit") can break every trigram of a short word, so
+    // each swapped spelling is looked up as a prefix directly
+    for (let i = 0; i + 1 < term.length; i++) {
+        if (term[i] === term[i + 1]) continue;
+        const swapped = term.slice(0, i) + term[i + 1] + term[i] + term.slice(i + 2);
+        const [from, to] = prefixRange(tokens, swapped);
+        for (let t = from; t < to; t++) matched.set(t, MATCH_FUZZY);
+    }
+
+    const limit = term.length < 7 ? 1 : 2;
+    const grams = trigrams(term);
+    const shared = new Map<number, number>();
+    for (const gram of grams) {
+        for (const t of index.trigrams[gram] ?? []) shared.set(t, (shared.get(t) ?? 0) + 1);
+    }
+    // an insertion, deletion or substitution breaks at most three trigrams
+    const floor = Math.max(1, grams.length - 3 * limit);
+    for (const [t, count] of shared) {
+        if (count < floor || matched.has(t)) continue;
+        const token = tokens[t];
+        // whole token, or the typed part of a longer one ("nexn" → "nexon")
+        const distance = Math.min(
+            editDistance(term, token, limit),
+            editDistance(term, token.slice(0, term.length + 1), limit),
+        );
+        if (distance <= limit) matched.set(t, MATCH_FUZZY);
+    }
+    return matched;
+}
+
+/** Docs matching every word of the query, best first. */
+export function searchCatalog(
+    index: CatalogSearchIndex,
+    query: string,
+    { limit = 10, category }: { limit?: number; category?: string } = {},
+): CatalogSearchResult[] {
+    const terms = tokenize(query);
+    if (terms.length === 0) return [];
+
+    let scores: Map<number, number> | null = null;
+    for (const term of terms) {
+        const best = new Map<number, number>();
+        for (const [t, quality] of matchTokens(index, term)) {
+            for (const doc of index.postings[t]) {
+                if (quality > (best.get(doc) ?? 0)) best.set(doc, quality);
+            }
+        }
+        if (scores === null) {
+            scores = best;
+        } else {
+            const next = new Map<number, number>();
+            for (const [doc, score] of scores) {
+                const add = best.get(doc);
+                if (add !== undefined) next.set(doc, score + add);
+            }
+            scores = next;
+        }
+        if (scores.size === 0) return [];
+    }
+
+    const { docs } = index;
+    const wanted = category ? index.categories.indexOf(category) : -1;
+    const rank = (d: number) => scores!.get(d)! + KIND_BOOST[docs.kind[d]] + docs.popularity[d] / 100;
+    const ranked = [...scores!.keys()]
+        .filter((d) => wanted < 0 || docs.category[d] === wanted)
+        .sort((a, b) => rank(b) - rank(a) || a - b)
+        .slice(0, limit);
+
+    return ranked.map((d) => ({
+        kind: KINDS[docs.kind[d]],
+        name: docs.name[d],
+        brand: docs.name[docs.brand[d]],
+        model: docs.model[d] >= 0 ? docs.name[docs.model[d]] : null,
+        category: index.categories[docs.category[d]],
+        slug: docs.slug[d],
+        price: docs.price[d],
+        band: docs.band[d],
+    }));
+}
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+adaptive_concurrency.py
+
+Feedback-driven concurrency for the upload/migration scripts.
+
+  - AIMDLimiter: per-host concurrency limit that grows additively while
+    responses are fast and healthy, and halves on 429/503/5xx or network
+    errors (TCP-style AIMD). Latency drift above the observed baseline
+    stops growth before the server starts throttling.
+  - HostLimiters: lazily creates one limiter per host.
+  - RetryLater / run_with_retries: a task signals "try again" by raising
+    RetryLater; the runner parks it in a timer heap with a jittered
+    exponential delay and re-submits when due, so retries never sleep
+    inside a worker thread.
+
+Usage:
+  LIMITERS = HostLimiters(initial=4, maximum=32)
+
+  with LIMITERS.slot(url) as slot:
+      status, body = _http_raw(...)
+      slot.status = status
+
+  def task(item, attempt):
+      ...
+      if is_retryable(status):
+          raise RetryLater(status, "upload", url)
+      return result
+
+  for item, result in run_with_retries(items, task, max_workers=32):
+      ...
+"""
+
+import heapq
+import itertools
+import random
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+THROTTLE_STATUSES = {429, 503}
+RETRYABLE_STATUSES = {0, 408, 429, 500, 502, 503, 504}
+
+
+def is_retryable(status: int) -> bool:
+    """0 is how the scripts' _http helpers report network errors/timeouts."""
+    return status in RETRYABLE_STATUSES
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 60.0) -> float:
+    """Full-jitter exponential back-off: uniform(0, min(cap, base * 2**attempt))."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+# ── Per-host AIMD limiter ─────────────────────────────────────────────────────
+
+class _Slot:
+    __slots__ = ("status",)
+
+    def __init__(self):
+        self.status = 200
+
+
+class AIMDLimiter:
+    """
+    Concurrency limit for one host.
+
+    Increase: +1/limit per healthy response (≈ +1 per full window), only while
+    smoothed latency stays within `latency_tolerance` × the best seen.
+    Decrease: limit × `decrease` on throttling or failure, at most once per
+    `cooldown` seconds so a burst of 429s from one window counts once.
+    """
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 32,
+                 decrease: float = 0.5, latency_tolerance: float = 2.0,
+                 cooldown: float = 1.0):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.throttled = 0
+        self._ewma = None
+        self._baseline = None
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            while self.in_flight >= int(self.limit):
+                self._cond.wait()
+            self.in_flight += 1
+
+    def release(self, status: int, latency: float):
+        with self._cond:
+            self.in_flight -= 1
+            if status in THROTTLE_STATUSES or status == 0 or status >= 500:
+                self._on_congestion(status)
+            else:
+                self._on_success(latency)
+            self._cond.notify_all()
+
+    @contextmanager
+    def slot(self):
+        """Hold one unit of concurrency; set .status on the yielded object."""
+        self.acquire()
+        slot = _Slot()
+        start = time.monotonic()
+        try:
+            yield slot
+        except Exception:
+            slot.status = 0
+            raise
+        finally:
+            self.release(slot.status, time.monotonic() - start)
+
+    def _on_success(self, latency: float):
+        self._ewma = latency if self._ewma is None else 0.8 * self._ewma + 0.2 * latency
+        if self._baseline is None or self._ewma < self._baseline:
+            self._baseline = self._ewma
+        if self._ewma <= self.latency_tolerance * self._baseline:
+            self.limit = min(self.maximum, self.limit + 1.0 / self.limit)
+
+    def _on_congestion(self, status: int):
+        if status in THROTTLE_STATUSES:
+            self.throttled += 1
+        now = time.monotonic()
+        if now - self._last_decrease >= self.cooldown:
+            self.limit = max(self.minimum, self.limit * self.decrease)
+            self._last_decrease = now
+
+
+class HostLimiters:
+    """One AIMDLimiter per URL host, created on first use with shared defaults."""
+
+    def __init__(self, **limiter_kwargs):
+        self._kwargs = limiter_kwargs
+        self._limiters: "dict[str, AIMDLimiter]" = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> AIMDLimiter:
+        host = urlparse(url).netloc or url
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self._limiters[host] = AIMDLimiter(**self._kwargs)
+            return limiter
+
+    def slot(self, url: str):
+        return self.get(url).slot()
+
+    def describe(self) -> str:
+        with self._lock:
+            return ", ".join(
+                f"{host} limit {lim.limit:.1f} (429/503 ×{lim.throttled})"
+                for host, lim in sorted(self._limiters.items())
+            )
+
+
+# ── Retry scheduling ─────────────────────────────────────────────────────────
+
+class RetryLater(Exception):
+    """
+    Raised by a task to be re-run after a back-off delay. stage/url are
+    optional context passed through to run_with_retries' on_retry hook.
+    """
+
+    def __init__(self, status: int = 0, stage: str = "", url: str = ""):
+        super().__init__(f"{stage or 'request'} got retryable status {status}")
+        self.status = status
+        self.stage = stage
+        self.url = url
+
+
+def run_with_retries(items, task, max_workers: int, max_attempts: int = 3,
+                     base_delay: float = 1.0, max_delay: float = 60.0,
+                     on_retry=None, on_queue_depth=None):
+    """
+    Run task(item, attempt) for every item and yield (item, result) as each
+    finishes. A task raising RetryLater is re-queued after backoff_delay()
+    (longer for 429/503); once max_attempts is reached it yields (item, None).
+    Any other exception is logged to stderr and also yields (item, None), so
+    one bad item never abandons the rest of the run.
+    Waiting retries sit in a timer heap, not in a worker thread.
+
+    on_retry(retry, delay) and on_queue_depth(n) are optional progress hooks.
+    """
+    seq = itertools.count()
+    delayed = []  # (due, seq, item, attempt)
+    queue = list(items)
+    queue.reverse()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        running = {}
+
+        def submit(item, attempt):
+            running[pool.submit(task, item, attempt)] = (item, attempt)
+
+        # Keep a bounded backlog in the executor so new work and due retries
+        # interleave instead of retries waiting behind the whole input.
+        def top_up():
+            now = time.monotonic()
+            while delayed and delayed[0][0] <= now:
+                _, _, item, attempt = heapq.heappop(delayed)
+                submit(item, attempt)
+            while queue and len(running) < max_workers * 2:
+                submit(queue.pop(), 1)
+            if on_queue_depth:
+                on_queue_depth(len(queue) + len(delayed) + max(0, len(running) - max_workers))
+
+        top_up()
+        while running or delayed:
+            timeout = None
+            if delayed:
+                timeout = max(0.0, delayed[0][0] - time.monotonic())
+            if running:
+                finished, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+            else:
+                time.sleep(timeout or 0)
+                finished = ()
+
+            for future in finished:
+                item, attempt = running.pop(future)
+                try:
+                    result = future.result()
+                except RetryLater as retry:
+                    if attempt >= max_attempts:
+                        yield item, None
+                        continue
+                    base = base_delay * (2 if retry.status in THROTTLE_STATUSES else 1)
+                    delay = backoff_delay(attempt, base, max_delay)
+                    if on_retry:
+                        on_retry(retry, delay)
+                    heapq.heappush(delayed, (time.monotonic() + delay, next(seq), item, attempt + 1))
+                    continue
+                except Exception as exc:
+                    print(f"  ERROR {item!r:.80}: {type(exc).__name__}: {exc}", file=sys.stderr)
+                    yield item, None
+                    continue
+                yield item, result
+            top_up()
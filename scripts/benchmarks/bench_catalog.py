@@ -0,0 +1,67 @@
+"""Brand JSON ingestion (in-memory vs streaming extraction, URL collection, CAR_DATA rows) and catalog search."""
+
+import heapq
+import json
+
+import pytest
+
+import build_car_data
+import build_search_index
+import migrate_car_images_to_supabase as migrate
+
+
+@pytest.fixture
+def data_dir(brand_data_dir, monkeypatch):
+    monkeypatch.setattr(migrate, "DATA_DIR", brand_data_dir)
+    monkeypatch.setattr(migrate, "SKIP_FILES", set())
+    return brand_data_dir
+
+
+def test_extract_items(benchmark, brand_data_dir):
+    docs = [(p.name, json.loads(p.read_text())) for p in sorted(brand_data_dir.glob("*.json"))]
+
+    def extract_all():
+        return sum(len(migrate.extract_items(name, data)) for name, data in docs)
+
+    assert benchmark(extract_all) > 0
+
+
+def test_iter_items(benchmark, brand_data_dir):
+    paths = sorted(brand_data_dir.glob("*.json"))
+
+    def iterate_all():
+        return sum(1 for p in paths for _ in migrate.iter_items(p))
+
+    assert benchmark(iterate_all) > 0
+
+
+@pytest.mark.parametrize("stream", [True, False], ids=["stream", "whole-file"])
+def test_collect_all_urls(benchmark, data_dir, capsys, stream):
+    urls = benchmark(migrate.collect_all_urls, stream=stream)
+    assert urls
+
+
+@pytest.fixture
+def search_index(brand_data_dir, tmp_path, monkeypatch):
+    tsv = tmp_path / "CAR_DATA.tsv"
+    tsv.write_text("Brand\tModel\tVariant\tPrice (INR)\n" + "".join(
+        f"Audi\tA{i % 9}\tPremium {i}\t{4000000 + i * 1000}\n" for i in range(300)))
+    monkeypatch.setattr(build_search_index, "DATA_DIR", brand_data_dir)
+    monkeypatch.setattr(build_search_index, "CAR_DATA_TSV", tsv)
+    return build_search_index.build_index()
+
+
+@pytest.mark.parametrize("query", ["model3", "tata model3 v1", "modle3", "mdoel3", "mercedez"],
+                         ids=["prefix", "multi-word", "typo", "swap", "typo-long"])
+def test_search_index_query(benchmark, search_index, query):
+    assert benchmark(build_search_index.search, search_index, query)
+
+
+def test_car_data_rows(benchmark, brand_data_dir):
+    paths = sorted(brand_data_dir.glob("*.json"))
+
+    def extract_and_merge():
+        runs = [build_car_data.extract_rows(p) for p in paths]
+        return sum(1 for _ in heapq.merge(*runs, key=build_car_data.sort_key))
+
+    assert benchmark(extract_and_merge) > 0
@@ -0,0 +1,31 @@
+"""Image pipeline hot paths: background removal, background check, hashing, swatches."""
+
+import build_color_swatches
+import dedupe_4w_gallery_metadata as dedupe
+import detect_non_white_bg
+import remove_bg
+
+
+def test_flood_fill_transparent(benchmark, logo_image):
+    result = benchmark(remove_bg.flood_fill_transparent, logo_image, remove_bg.TOLERANCE)
+    assert result.mode == "RGBA"
+
+
+def test_is_white_background(benchmark, car_image_path):
+    is_white, reason, _ = benchmark(detect_non_white_bg.is_white_background, car_image_path)
+    assert "error" not in reason
+
+
+def test_average_hash(benchmark, car_image_path):
+    digest = benchmark(dedupe.average_hash, car_image_path)
+    assert len(digest) == 64
+
+
+def test_sha256(benchmark, car_image_path):
+    digest = benchmark(dedupe.sha256, car_image_path)
+    assert len(digest) == 64
+
+
+def test_color_swatch(benchmark, car_image_path):
+    result = benchmark(build_color_swatches.swatch, car_image_path)
+    assert result["hex"].startswith("#") and result["palette"]
@@ -0,0 +1,54 @@
+"""Upload loops end to end against the local Supabase/CDN stub."""
+
+import shutil
+
+import blob_cache
+import migrate_car_images_to_supabase as migrate
+import upload_brand_images_to_supabase as brand_upload
+
+
+def test_upload_brand_images(benchmark, http_stub, image_dir, tmp_path, monkeypatch):
+    checkpoint = tmp_path / "bmi_done.json"
+    monkeypatch.setattr(brand_upload, "SUPABASE_URL", http_stub)
+    monkeypatch.setattr(brand_upload, "BASE_DIR", image_dir)
+    monkeypatch.setattr(brand_upload, "CHECKPOINT", checkpoint)
+
+    def reset():
+        checkpoint.unlink(missing_ok=True)
+
+    benchmark.pedantic(brand_upload.run, setup=reset, rounds=5)
+    assert checkpoint.exists()
+
+
+def test_upload_brand_images_with_faults(benchmark, flaky_supabase, image_dir, tmp_path, monkeypatch):
+    """Same loop through injected 429/503s: measures the retry path, not just the happy one."""
+    checkpoint = tmp_path / "bmi_done.json"
+    monkeypatch.setattr(brand_upload, "SUPABASE_URL", flaky_supabase.url)
+    monkeypatch.setattr(brand_upload, "BASE_DIR", image_dir)
+    monkeypatch.setattr(brand_upload, "CHECKPOINT", checkpoint)
+    monkeypatch.setattr(brand_upload, "RETRY_DELAY", 0.05)
+    monkeypatch.setattr(brand_upload, "MAX_ATTEMPTS", 6)
+
+    def reset():
+        checkpoint.unlink(missing_ok=True)
+
+    benchmark.pedantic(brand_upload.run, setup=reset, rounds=3)
+    uploaded = list((flaky_supabase.root / "brand-model-images").rglob("*.*"))
+    assert len(uploaded) == len([p for p in image_dir.rglob("*") if p.is_file()])
+    assert flaky_supabase.conditions.injected > 0
+
+
+def test_migrate_run(benchmark, http_stub, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "img_cache"
+    blob_dir = tmp_path / "blob_cache"
+    monkeypatch.setattr(migrate, "SUPABASE_URL", http_stub)
+    monkeypatch.setattr(migrate, "CACHE_DIR", cache_dir)
+
+    def reset():
+        # Cold caches every round, so each round measures real downloads
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        shutil.rmtree(blob_dir, ignore_errors=True)
+        monkeypatch.setattr(blob_cache, "_SHARED", blob_cache.BlobCache(blob_dir))
+
+    benchmark.pedantic(migrate.run, setup=reset, rounds=5)
+    assert (cache_dir / "url_mapping.json").exists()
@@ -0,0 +1,202 @@
+"""
+Shared fixtures for the media/catalog pipeline benchmarks.
+
+Everything is synthetic and seeded, so runs are comparable across machines
+and over time: images are drawn with NumPy from a fixed seed, brand JSON
+files cover every shape extract_items understands, and all HTTP goes to a
+local stub that mimics the Supabase Storage/REST and CDN endpoints (or to
+scripts/local_supabase.py, when a benchmark needs latency or faults).
+"""
+
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+LOGOS_DIR = SCRIPTS_DIR.parent / "public" / "assets" / "logos"
+for path in (SCRIPTS_DIR, LOGOS_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+# The stubs accept any key; never hand them a real one from the environment
+os.environ["SUPABASE_SERVICE_ROLE_KEY"] = "bench-service-key"
+
+SEED = 20260419
+CDN_PREFIX = "/images/carexteriorimages/630x420"
+
+
+# ── Synthetic images ─────────────────────────────────────────────────────────
+
+def synthetic_image(width: int, height: int, seed: int = SEED,
+                    background=(255, 255, 255)) -> Image.Image:
+    """Studio-style shot: flat background, noisy coloured body in the middle."""
+    rng = np.random.default_rng(seed)
+    pixels = np.empty((height, width, 3), dtype=np.uint8)
+    pixels[:] = background
+    top, left = height // 4, width // 6
+    body = rng.integers(0, 200, size=(height // 2, width - 2 * left, 3), dtype=np.uint8)
+    pixels[top:top + body.shape[0], left:left + body.shape[1]] = body
+    return Image.fromarray(pixels, "RGB")
+
+
+@pytest.fixture(scope="session")
+def image_dir(tmp_path_factory):
+    """A brand-model-images style tree: {cat}/{brand}/{model}.jpg|png."""
+    root = tmp_path_factory.mktemp("brand-model-images")
+    for index in range(24):
+        cat = ("2w", "3w", "4w")[index % 3]
+        brand_dir = root / cat / f"brand-{index % 4}"
+        brand_dir.mkdir(parents=True, exist_ok=True)
+        background = (255, 255, 255) if index % 2 else (40, 60, 90)
+        img = synthetic_image(630, 420, SEED + index, background)
+        suffix = ".png" if index % 5 == 0 else ".jpg"
+        img.save(brand_dir / f"model-{index}{suffix}")
+    return root
+
+
+@pytest.fixture(scope="session")
+def car_image_path(image_dir) -> Path:
+    return sorted(image_dir.rglob("*.jpg"))[0]
+
+
+@pytest.fixture(scope="session")
+def logo_image() -> Image.Image:
+    return synthetic_image(400, 200, SEED).convert("RGBA")
+
+
+# ── Synthetic brand JSON ─────────────────────────────────────────────────────
+
+def _variant(brand: str, index: int) -> dict:
+    model = f"Model{index % 7}"
+    return {
+        "make": brand,
+        "model": model,
+        "variant_name": f"{model} V{index}",
+        "ex_showroom_price": 500000 + index * 12345,
+        "specs": {"engine": "1497 cc", "power": "113 bhp", "notes": "x" * 400},
+        "image_urls": [{
+            "value": f"https://stimg.cardekho.com{CDN_PREFIX}/{brand}/{model}/{1000 + index}/"
+                     f"{1700000000000 + index}/front-left-side-47.jpg?tr=w-300"
+        }],
+    }
+
+
+def brand_json_shapes(variants_per_file: int) -> dict:
+    """One document per shape handled by extract_items / iter_items."""
+    def variants(brand):
+        return [_variant(brand, i) for i in range(variants_per_file)]
+
+    models = [
+        {"model": f"Model{m}", "variants": [_variant("Honda", m * 10 + i) for i in range(10)]}
+        for m in range(max(1, variants_per_file // 10))
+    ]
+    return {
+        "items_brand.json": {"items": variants("Audi")},
+        "variants_brand.json": {"variants": variants("Tata")},
+        "numeric_brand.json": {str(i): v for i, v in enumerate(variants("Citroen"))},
+        "wrapper_list.json": {"kia": variants("Kia")},
+        "wrapper_numeric.json": {"mercedes": {str(i): v for i, v in enumerate(variants("Mercedes"))}},
+        "wrapper_models.json": {"honda": {"models": models}},
+    }
+
+
+@pytest.fixture(scope="session")
+def brand_data_dir(tmp_path_factory):
+    root = tmp_path_factory.mktemp("data")
+    for name, doc in brand_json_shapes(200).items():
+        (root / name).write_text(json.dumps(doc, indent=2))
+    return root
+
+
+# ── Local HTTP stub ──────────────────────────────────────────────────────────
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Answers just enough of Storage, PostgREST and the CDN to drive the scripts."""
+
+    image_bytes = b""
+    catalog_rows = []
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, body: bytes = b"", content_type: str = "application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def _drain(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+
+    def do_GET(self):
+        if self.path.startswith("/rest/v1/car_catalog"):
+            offset = 0
+            for part in self.path.split("?", 1)[-1].split("&"):
+                if part.startswith("offset="):
+                    offset = int(part.split("=", 1)[1])
+            rows = self.catalog_rows if offset == 0 else []
+            self._reply(200, json.dumps(rows).encode())
+        elif self.path.startswith("/images/"):
+            self._reply(200, self.image_bytes, "image/jpeg")
+        else:
+            self._reply(404)
+
+    def do_POST(self):
+        self._drain()
+        self._reply(200, b'{"Key":"ok"}')
+
+    def do_PATCH(self):
+        self._drain()
+        self._reply(204)
+
+
+class _StubServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops SYNs under 15 upload workers, which shows
+    # up as 1 s TCP retransmit stalls rather than script cost.
+    request_queue_size = 128
+    daemon_threads = True
+
+
+@pytest.fixture(scope="session")
+def http_stub(car_image_path):
+    """Base URL of a threaded local server standing in for Supabase and the CDN."""
+    server = _StubServer(("127.0.0.1", 0), _StubHandler)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    _StubHandler.image_bytes = car_image_path.read_bytes()
+    _StubHandler.catalog_rows = [
+        {"image_url": f"{base_url}{CDN_PREFIX}/Brand/Model{i}/{i}/{i}/front-left-side-47.jpg"}
+        for i in range(60)
+    ]
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield base_url
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def flaky_supabase(tmp_path):
+    """local_supabase.py with 2 ms latency and 10% injected 429/503s (seeded)."""
+    from local_supabase import Conditions, LocalSupabase
+
+    root = tmp_path / "storage"
+    for bucket in ("brand-model-images", "car-images"):
+        (root / bucket).mkdir(parents=True)
+    conditions = Conditions(latency_ms=2, error_rate=0.1, seed=SEED)
+    server = LocalSupabase(("127.0.0.1", 0), root, conditions=conditions)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+blob_cache.py
+
+Content-addressed download cache shared by every media script.
+
+Bytes are stored once under their sha256 (blobs/ab/abcdef…), and a URL → hash
+index lets any script — migration, 3W scrapers, hero downloaders — find bytes
+another run already fetched. Output files are reflinked (copy-on-write) from
+the blob store where the filesystem supports it, else hard-linked, else
+copied, so a populated output tree costs no extra disk. Blobs are read-only,
+so a write through a hard-linked output fails instead of corrupting every
+file sharing the blob, and a blob is checked against its sha256 before it is
+served. The store is size-bounded with least-recently-used eviction.
+
+Config (env):
+  BLOB_CACHE_DIR        default scripts/.blob_cache
+  BLOB_CACHE_MAX_BYTES  default 4 GiB
+
+Usage:
+  from blob_cache import shared_cache
+
+  cache = shared_cache()
+  data = cache.fetch(url, my_fetcher)              # bytes, from cache or network
+  data = cache.fetch(url, my_fetcher, validate=lambda b: looks_like_image(b, 20_000))
+  path = cache.fetch_to(url, dest, my_fetcher)     # reflinked / hard-linked into dest
+  cache.flush()                                    # also runs at exit
+
+  python3 scripts/blob_cache.py --stats
+  python3 scripts/blob_cache.py --evict
+"""
+
+import argparse
+import atexit
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+DEFAULT_DIR       = Path(os.environ.get("BLOB_CACHE_DIR") or Path(__file__).parent / ".blob_cache")
+DEFAULT_MAX_BYTES = int(os.environ.get("BLOB_CACHE_MAX_BYTES") or 4 * 1024 ** 3)
+LOW_WATER         = 0.9   # evict down to this fraction of max_bytes
+FLUSH_EVERY       = 50    # puts between index writes
+FICLONE           = 0x40049409  # Linux ioctl: share src's extents copy-on-write (btrfs, XFS)
+
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+# Leading bytes of the image formats the media scripts download
+IMAGE_MAGIC = (b"\xff\xd8\xff", b"\x89PNG\r\n\x1a\n", b"GIF87a", b"GIF89a")
+
+
+def looks_like_image(data: bytes, min_bytes: int = 0) -> bool:
+    """True for JPEG/PNG/GIF/WebP/AVIF bytes of at least min_bytes (not an HTML error page)."""
+    if not data or len(data) < min_bytes:
+        return False
+    if data.startswith(IMAGE_MAGIC):
+        return True
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return True
+    return data[4:8] == b"ftyp" and data[8:12] in (b"avif", b"avis", b"heic", b"mif1")
+
+
+def _read_index(path: Path) -> "tuple[dict, dict]":
+    """(urls, blobs) from an index file; empty if missing or unreadable."""
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}, {}
+    return data.get("urls", {}), data.get("blobs", {})
+
+
+def _reflink(src: Path, dest: Path) -> bool:
+    """Copy-on-write clone of src at dest; False where the OS or filesystem can't."""
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        return False
+    try:
+        with src.open("rb") as s, dest.open("wb") as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        return True
+    except OSError:
+        dest.unlink(missing_ok=True)
+        return False
+
+
+def link_or_copy(src: Path, dest: Path):
+    """
+    Materialize blob src at dest (replacing dest): a reflink where supported,
+    else a hard link to the read-only blob, else a copy across devices.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    if dest.exists():
+        if dest.samefile(src):
+            return
+        dest.unlink()
+    if _reflink(src, dest):
+        return
+    try:
+        if src.stat().st_mode & 0o222:
+            src.chmod(0o444)  # blobs stored before they were made read-only
+        os.link(src, dest)
+    except OSError:
+        shutil.copyfile(src, dest)
+
+
+class BlobCache:
+    """sha256-named blob store with a URL index and LRU size bound."""
+
+    def __init__(self, root: Path = DEFAULT_DIR, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.index_path = self.root / "index.json"
+        self.hits = 0
+        self.misses = 0
+        self._dirty = 0
+        self._lock = threading.RLock()
+        self.urls, self.blobs = _read_index(self.index_path)
+        self._total = sum(meta.get("size", 0) for meta in self.blobs.values())
+
+    # ── Index ────────────────────────────────────────────────────────────────
+
+    def flush(self):
+        """
+        Persist the index. Merges with what is on disk first, so two scripts
+        sharing the cache don't drop each other's entries.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            disk_urls, disk_blobs = _read_index(self.index_path)
+            for digest, meta in disk_blobs.items():
+                mine = self.blobs.get(digest)
+                if mine is None:
+                    if self.blob_path(digest).exists():
+                        self.blobs[digest] = meta
+                        self._total += meta.get("size", 0)
+                elif meta.get("last_used", 0) > mine.get("last_used", 0):
+                    mine["last_used"] = meta["last_used"]
+            for url, digest in disk_urls.items():
+                if digest in self.blobs:
+                    self.urls.setdefault(url, digest)
+
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_name(f".index.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"urls": self.urls, "blobs": self.blobs}))
+            tmp.replace(self.index_path)
+            self._dirty = 0
+
+    def _touch(self, digest: str):
+        self.blobs[digest]["last_used"] = time.time()
+        self._dirty += 1
+
+    # ── Lookup / store ───────────────────────────────────────────────────────
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / "blobs" / digest[:2] / digest
+
+    def lookup(self, url: str) -> "Path | None":
+        """Blob path for url if its bytes are held, else None."""
+        with self._lock:
+            digest = self.urls.get(url)
+            if digest is None or digest not in self.blobs:
+                return None
+            path = self.blob_path(digest)
+            if not path.exists():
+                self._total -= self.blobs.pop(digest, {}).get("size", 0)
+                self.urls.pop(url, None)
+                return None
+            self._touch(digest)
+            return path
+
+    def put(self, url: str, data: bytes) -> Path:
+        """Store data for url; identical bytes from another URL share one blob."""
+        digest = sha256_bytes(data)
+        path = self.blob_path(digest)
+        with self._lock:
+            if digest not in self.blobs or not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f".{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp.write_bytes(data)
+                tmp.chmod(0o444)
+                tmp.replace(path)
+                self._total += len(data) - self.blobs.get(digest, {}).get("size", 0)
+                self.blobs[digest] = {"size": len(data)}
+            self.urls[url] = digest
+            self._touch(digest)
+            self._evict_if_needed(keep=digest)
+            if self._dirty >= FLUSH_EVERY:
+                self.flush()
+        return path
+
+    def add_alias(self, url: str, digest: str):
+        """Point another URL at bytes already held (e.g. a canonicalized URL)."""
+        with self._lock:
+            if digest in self.blobs:
+                self.urls[url] = digest
+                self._dirty += 1
+
+    def _discard(self, digest: str):
+        """Drop a blob whose bytes no longer match its name, and every URL pointing at it."""
+        with self._lock:
+            self.blob_path(digest).unlink(missing_ok=True)
+            self._total -= self.blobs.pop(digest, {}).get("size", 0)
+            self.urls = {u: d for u, d in self.urls.items() if d != digest}
+            self._dirty += 1
+
+    def forget(self, url: str):
+        """Drop url from the index (its blob stays until evicted)."""
+        with self._lock:
+            if self.urls.pop(url, None) is not None:
+                self._dirty += 1
+
+    def fetch(self, url: str, fetcher, validate=None) -> "bytes | None":
+        """Return bytes for url from the cache, else fetcher(url) (stored on success)."""
+        path = self.fetch_path(url, fetcher, validate)
+        return path.read_bytes() if path else None
+
+    def fetch_path(self, url: str, fetcher, validate=None) -> "Path | None":
+        """
+        Blob path for url, fetching on a miss. A cached blob whose bytes no
+        longer hash to its name is discarded and fetched again. With validate,
+        bytes it rejects (HTML error pages, placeholders) are never stored, and
+        a cached entry it rejects is dropped and fetched again.
+        """
+        path = self.lookup(url)
+        if path is not None:
+            data = path.read_bytes()
+            if sha256_bytes(data) != path.name:
+                print(f"  WARN: blob {path.name[:12]}… is corrupt; fetching {url[:80]} again")
+                self._discard(path.name)
+            elif validate is None or validate(data):
+                self.hits += 1
+                return path
+            else:
+                self.forget(url)
+        self.misses += 1
+        data = fetcher(url)
+        if not data or (validate is not None and not validate(data)):
+            return None
+        return self.put(url, data)
+
+    def fetch_to(self, url: str, dest: Path, fetcher, validate=None) -> "Path | None":
+        """Materialize url's bytes at dest via link_or_copy. Returns dest or None."""
+        path = self.fetch_path(url, fetcher, validate)
+        if path is None:
+            return None
+        link_or_copy(path, Path(dest))
+        return Path(dest)
+
+    # ── Eviction ─────────────────────────────────────────────────────────────
+
+    def total_bytes(self) -> int:
+        """Bytes held, kept as a running total so put() never walks the store."""
+        return self._total
+
+    def _evict_if_needed(self, keep: str = ""):
+        if self._total > self.max_bytes:
+            self.evict(int(self.max_bytes * LOW_WATER), keep=keep)
+
+    def evict(self, target_bytes: int, keep: str = "") -> int:
+        """Drop least-recently-used blobs until the store is ≤ target_bytes."""
+        with self._lock:
+            total = self._total
+            freed = 0
+            by_age = sorted(self.blobs.items(), key=lambda kv: kv[1].get("last_used", 0))
+            evicted = set()
+            for digest, meta in by_age:
+                if total - freed <= target_bytes:
+                    break
+                if digest == keep:
+                    continue
+                self.blob_path(digest).unlink(missing_ok=True)
+                freed += meta.get("size", 0)
+                evicted.add(digest)
+            for digest in evicted:
+                del self.blobs[digest]
+            self._total -= freed
+            if evicted:
+                self.urls = {u: d for u, d in self.urls.items() if d not in evicted}
+                self._dirty += 1
+            return freed
+
+    def stats(self) -> dict:
+        return {
+            "root": str(self.root),
+            "blobs": len(self.blobs),
+            "urls": len(self.urls),
+            "bytes": self.total_bytes(),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+_SHARED = None
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_cache() -> BlobCache:
+    """Process-wide cache instance; its index is flushed at interpreter exit."""
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = BlobCache()
+            atexit.register(_SHARED.flush)
+        return _SHARED
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or trim the shared media blob cache")
+    parser.add_argument("--stats", action="store_true", help="Print cache size and counts")
+    parser.add_argument("--evict", action="store_true", help="Evict down to the low-water mark now")
+    args = parser.parse_args()
+
+    cache = shared_cache()
+    if args.evict:
+        freed = cache.evict(int(cache.max_bytes * LOW_WATER))
+        print(f"  Evicted {freed / 1024 / 1024:.1f} MB")
+    print(json.dumps(cache.stats(), indent=2))
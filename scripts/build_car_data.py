@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+build_car_data.py
+
+Regenerates CAR_DATA.tsv and CAR_DATA_TABLE.md from the 4W brand JSON files
+(public/data/*.json), incrementally:
+
+  1. Each brand file's sha is compared with scripts/.car_data_state.json;
+     only new or changed files are parsed and turned into rows. Unchanged
+     brands reuse the rows stored in the state.
+  2. Every brand's rows are kept sorted (brand, model, price), so the full
+     table is a heapq.merge of per-brand runs, not a global sort.
+  3. The merged rows stream into both outputs through temp files, and a
+     file is only replaced when its content changed.
+  4. A row-level diff (added / removed / changed columns, keyed by brand,
+     model and variant) is printed for the brands that changed. The diff
+     is against their previous rows in the state, or the current TSV when
+     there is no state yet. --diff-out writes it as JSON lines.
+  5. A brand file that fails to parse keeps its previous rows and state,
+     and nothing is written until every source parses again.
+
+Models come from "model" / "model_name"; name-only variants (Isuzu, Force,
+Maruti, …) take the model from their cardekho.com/{brand}/{model} URLs, or
+else the first word of the name after the brand. A variant name that repeats
+the model is stored without it ("Camry Elegance" → "Elegance"), like
+build_search_index does.
+
+Usage:
+  python3 scripts/build_car_data.py
+  python3 scripts/build_car_data.py --dry-run --diff-out /tmp/car-data-diff.jsonl
+  python3 scripts/build_car_data.py --force
+"""
+
+import argparse
+import csv
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import unicodedata
+from pathlib import Path
+
+from build_model_shards import NESTED_SPECS
+from build_search_index import fold, min_price
+from media_tools.slugs import model_to_slug
+from migrate_car_images_to_supabase import DATA_DIR, SKIP_FILES, extract_items
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TSV_FILE     = PROJECT_ROOT / "CAR_DATA.tsv"
+TABLE_FILE   = PROJECT_ROOT / "CAR_DATA_TABLE.md"
+STATE_FILE   = Path(__file__).parent / ".car_data_state.json"
+FORMAT       = 2  # bump when row extraction changes; invalidates the state
+DIFF_PREVIEW = 25
+
+COLUMNS = (
+    "Brand", "Model", "Variant", "Price (INR)", "Price (Lakhs)", "Fuel Type", "Transmission",
+    "Engine (cc)", "Power (bhp)", "Torque (Nm)", "Mileage", "Seating", "Boot (L)",
+    "Ground Clearance (mm)", "Year",
+)
+# (brand, model, variant) identify a row across builds
+KEY_COLUMNS = 3
+
+# Candidate source fields per column, first non-empty wins (after flattening)
+FIELDS = {
+    "fuel":      ("fuel_type", "fuel"),
+    "trans":     ("transmission",),
+    "engine":    ("engine_displacement_cc", "engine_displacement", "displacement",
+                  "engine_displacement_or_battery_capacity"),
+    "power":     ("power_bhp", "power"),
+    "torque":    ("torque_nm", "torque"),
+    "mileage":   ("mileage_kmpl", "mileage", "mileage_range", "mileage_kmpl_or_ev_range", "mileage_or_range"),
+    "range":     ("range_km", "mileage_range_km", "mileage_range", "mileage_or_range", "mileage"),
+    "seats":     ("seating_capacity", "seating", "dimensions_seating", "capacities_seating"),
+    "boot":      ("boot_space_l", "boot_capacity", "boot_space_liters", "boot_space", "boot",
+                  "dimensions_boot", "capacities_boot_space"),
+    "clearance": ("ground_clearance_mm", "ground_clearance", "clearance", "dimensions_ground_clearance"),
+    "year":      ("launch_year",),
+}
+# Nested groups whose keys are lifted into the variant, besides NESTED_SPECS
+NESTED_GROUPS = NESTED_SPECS + ("dimensions", "capacities", "metadata")
+# CAR_DATA.tsv names brands in title case ("Bmw", "Mercedes Benz", "Mg")
+BRAND_NAMES = {"force": "Force Motors", "mercedes": "Mercedes Benz"}
+
+_NUMBER = re.compile(r"\d+(?:\.\d+)?")
+_MODEL_URL = re.compile(r"cardekho\.com/([a-z0-9-]+)/([a-z0-9-]+)")
+
+
+# ── Rows ──────────────────────────────────────────────────────────────────────
+
+def brand_name(make: str, stem: str) -> str:
+    if stem in BRAND_NAMES:
+        return BRAND_NAMES[stem]
+    label = make or stem.replace("_", " ")
+    label = unicodedata.normalize("NFKD", label).encode("ascii", "ignore").decode()
+    return label.replace("-", " ").title()
+
+
+def flatten(item: dict) -> dict:
+    """Nested spec groups lifted into the variant (existing keys win)."""
+    flat = dict(item)
+    for key in NESTED_GROUPS:
+        sub = item.get(key)
+        if isinstance(sub, dict):
+            for name, value in sub.items():
+                if flat.get(name) in (None, ""):
+                    flat[name] = value
+    return flat
+
+
+def _first(flat: dict, column: str):
+    for key in FIELDS[column]:
+        value = flat.get(key)
+        if value not in (None, "", [], {}) and not isinstance(value, (dict, list)):
+            return value
+    return None
+
+
+def _number(value) -> str:
+    """First number in a value, without a trailing '.0' ('86.79 bhp' → '86.79', 5.0 → '5')."""
+    if value is None or isinstance(value, bool):
+        return ""
+    if isinstance(value, (int, float)):
+        number = float(value)
+    else:
+        match = _NUMBER.search(str(value).replace(",", ""))
+        if not match:
+            return ""
+        number = float(match.group())
+    return str(int(number)) if number.is_integer() else f"{number:g}"
+
+
+def strip_model(variant: str, model: str) -> str:
+    """The variant without a leading model name ("Camry Elegance" → "Elegance")."""
+    if fold(variant).startswith(fold(model) + " "):
+        return variant[len(model):].strip()
+    return variant
+
+
+def split_name(item: dict, brand: str) -> "tuple[str, str]":
+    """(model, variant) for a variant, inferring the model for name-only records."""
+    name = str(item.get("variant_name") or item.get("variant") or "").strip()
+    model = str(item.get("model") or item.get("model_name") or "").strip()
+    if model:
+        return model, strip_model(name, model)
+
+    words = name.split()
+    if words and model_to_slug(words[0]) in {model_to_slug(w) for w in brand.split()}:
+        words = words[1:]  # "Maruti Grand Vitara Sigma" → "Grand Vitara Sigma"
+    for match in _MODEL_URL.finditer(json.dumps(item)):
+        slug = match.group(2)
+        if match.group(1) in ("images", "overview"):
+            continue
+        for n in range(len(words), 0, -1):
+            if model_to_slug(" ".join(words[:n])) == slug:
+                return " ".join(words[:n]), " ".join(words[n:]) or " ".join(words)
+        return slug.replace("-", " ").title(), " ".join(words)
+    if len(words) > 1:
+        return words[0], " ".join(words[1:])
+    return "", name
+
+
+def to_row(item: dict, brand: str) -> "list[str] | None":
+    """One CAR_DATA.tsv row (COLUMNS order), or None for records without a model."""
+    flat = flatten(item)
+    model, variant = split_name(flat, brand)
+    if not model or not variant:
+        return None
+    price = min_price(flat)
+    fuel = str(_first(flat, "fuel") or "")
+    electric = fuel.lower().startswith("electric")
+    engine = "EV" if electric else _number(_first(flat, "engine"))
+    if electric:
+        km = _number(_first(flat, "range"))
+        mileage = f"{km} km" if km else ""
+    else:
+        mileage = _number(_first(flat, "mileage"))
+    return [
+        brand, model, variant,
+        str(round(price)) if price else "",
+        f"{price / 1e5:.2f}" if price else "",
+        fuel,
+        str(_first(flat, "trans") or ""),
+        engine,
+        _number(_first(flat, "power")),
+        _number(_first(flat, "torque")),
+        mileage,
+        _number(_first(flat, "seats")),
+        _number(_first(flat, "boot")),
+        _number(_first(flat, "clearance")),
+        _number(_first(flat, "year")),
+    ]
+
+
+def sort_key(row: "list[str]"):
+    """Brand, model, then price (unpriced last); ties keep source order."""
+    return row[0], row[1], float(row[3]) if row[3] else math.inf
+
+
+def extract_rows(fpath: Path) -> "list[list[str]]":
+    items = extract_items(fpath.name, json.loads(fpath.read_text()))
+    rows = []
+    for item in items:
+        if isinstance(item, dict):
+            row = to_row(item, brand_name(str(item.get("make") or ""), fpath.stem))
+            if row:
+                rows.append(row)
+    return sorted(rows, key=sort_key)
+
+
+# ── Output ────────────────────────────────────────────────────────────────────
+
+def _table_row(row: "list[str]") -> str:
+    _, model, variant, price, lakhs, fuel, trans, engine, power, torque, mileage, seats, boot, gc, year = row
+    suffixed = lambda value, unit: f"{value}{unit}" if value else "-"
+    cells = [
+        model, variant, f"{lakhs}L" if lakhs else "-", fuel or "-", trans or "-",
+        engine if engine == "EV" else suffixed(engine, "cc"),
+        suffixed(power, "bhp"), suffixed(torque, "Nm"), mileage or "-", seats or "-",
+        f"{boot or '-'}L", f"{gc or '-'}mm", year or "-",
+    ]
+    return "| " + " | ".join(cells) + " |\n"
+
+
+class _StreamedFile:
+    """Writes to a temp file while hashing; replaces the target only if the bytes differ."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.tmp = path.with_name(path.name + ".tmp")
+        self.handle = self.tmp.open("w", encoding="utf-8", newline="")
+        self.sha = hashlib.sha256()
+
+    def write(self, text: str):
+        self.handle.write(text)
+        self.sha.update(text.encode("utf-8"))
+
+    def commit(self) -> bool:
+        self.handle.close()
+        if self.path.exists() and hashlib.sha256(self.path.read_bytes()).digest() == self.sha.digest():
+            self.tmp.unlink()
+            return False
+        os.replace(self.tmp, self.path)
+        return True
+
+
+def write_outputs(runs: "list[list[list[str]]]") -> "tuple[bool, bool]":
+    """Stream the merged runs into CAR_DATA.tsv and CAR_DATA_TABLE.md; returns (tsv, table) changed."""
+    per_brand = {}
+    for run in runs:
+        for row in run:
+            models, count = per_brand.get(row[0], (set(), 0))
+            models.add(row[1])
+            per_brand[row[0]] = (models, count + 1)
+
+    tsv, table = _StreamedFile(TSV_FILE), _StreamedFile(TABLE_FILE)
+    tsv.write("\t".join(COLUMNS))
+    total_models = sum(len(models) for models, _ in per_brand.values())
+    total_rows = sum(count for _, count in per_brand.values())
+    table.write("# Complete Car Data — All Brands, Models & Variants\n\n"
+                f"> **{len(per_brand)} brands · {total_models} models · {total_rows} entries**\n\n")
+
+    brand = None
+    for row in heapq.merge(*runs, key=sort_key):
+        tsv.write("\n" + "\t".join(row))
+        if row[0] != brand:
+            brand = row[0]
+            models, count = per_brand[brand]
+            table.write(f"---\n\n## {brand} ({len(models)} models, {count} variants)\n\n"
+                        "| Model | Variant | Price (₹) | Fuel | Trans | Engine | Power | Torque | Mileage "
+                        "| Seats | Boot | GC | Year |\n"
+                        "|-------|---------|-----------|------|-------|--------|-------|--------|---------"
+                        "|-------|------|----|------|\n")
+        table.write(_table_row(row))
+    return tsv.commit(), table.commit()
+
+
+# ── Diff ──────────────────────────────────────────────────────────────────────
+
+def _keyed(rows) -> "dict[tuple, list[str]]":
+    """Rows by (brand, model, variant, occurrence), so repeated names still pair up."""
+    keyed = {}
+    for row in rows:
+        key = tuple(row[:KEY_COLUMNS])
+        n = 0
+        while key + (n,) in keyed:
+            n += 1
+        keyed[key + (n,)] = row
+    return keyed
+
+
+def diff_rows(old_rows, new_rows) -> "list[dict]":
+    old, new = _keyed(old_rows), _keyed(new_rows)
+    changes = []
+    for key in sorted(old.keys() | new.keys()):
+        label = list(key[:KEY_COLUMNS])
+        if key not in new:
+            changes.append({"op": "removed", "key": label})
+        elif key not in old:
+            changes.append({"op": "added", "key": label})
+        elif old[key] != new[key]:
+            changes.append({"op": "changed", "key": label, "columns": {
+                COLUMNS[i]: [a, b] for i, (a, b) in enumerate(zip(old[key], new[key])) if a != b
+            }})
+    return changes
+
+
+def tsv_rows(brands: "set[str]") -> "list[list[str]]":
+    """Current CAR_DATA.tsv rows of some brands, read as a stream."""
+    if not TSV_FILE.exists():
+        return []
+    with TSV_FILE.open(encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE)
+        next(reader, None)
+        return [row for row in reader if row and row[0] in brands]
+
+
+def print_diff(changes: "list[dict]"):
+    marks = {"added": "+", "removed": "-", "changed": "~"}
+    for change in changes[:DIFF_PREVIEW]:
+        line = f"    {marks[change['op']]} {' / '.join(change['key'])}"
+        if change["op"] == "changed":
+            line += ": " + "; ".join(f"{c} {a or '∅'} → {b or '∅'}" for c, (a, b) in change["columns"].items())
+        print(line)
+    if len(changes) > DIFF_PREVIEW:
+        print(f"    … {len(changes) - DIFF_PREVIEW} more (--diff-out for all)")
+
+
+# ── Build ─────────────────────────────────────────────────────────────────────
+
+def load_state() -> dict:
+    try:
+        state = json.loads(STATE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return state.get("sources", {}) if state.get("format") == FORMAT else {}
+
+
+def run(force: bool = False, dry_run: bool = False, diff_out: "Path | None" = None):
+    had_state = STATE_FILE.exists() and not force
+    previous = {} if force else load_state()
+    sources = {}
+    changed, failed = [], []
+
+    for fpath in sorted(DATA_DIR.glob("*.json")):
+        if fpath.name in SKIP_FILES:
+            continue
+        sha = hashlib.sha256(fpath.read_bytes()).hexdigest()[:16]
+        cached = previous.get(fpath.name)
+        if cached and cached["sha"] == sha:
+            sources[fpath.name] = cached
+            continue
+        try:
+            rows = extract_rows(fpath)
+        except Exception as e:
+            # Keep the last good rows so a broken file is not read as a removed brand
+            print(f"  WARN: could not parse {fpath.name}: {e}")
+            failed.append(fpath.name)
+            if cached:
+                sources[fpath.name] = cached
+            continue
+        sources[fpath.name] = {"sha": sha, "rows": rows}
+        changed.append(fpath.name)
+    removed = sorted(previous.keys() - sources.keys())
+
+    print(f"  Sources: {len(sources)}  Changed: {len(changed)}  Removed: {len(removed)}  "
+          f"Unchanged: {len(sources.keys() - changed - set(failed))}" + (f"  Failed: {len(failed)}" if failed else ""))
+    if not changed and not removed and not failed and TSV_FILE.exists() and TABLE_FILE.exists():
+        print("  Nothing to do")
+        return
+
+    # diff only the brands touched by changed or removed sources
+    touched = changed + removed
+    new_rows = [row for name in changed for row in sources[name]["rows"]]
+    if had_state and previous:
+        old_rows = [row for name in touched if name in previous for row in previous[name]["rows"]]
+    else:
+        brands = {row[0] for row in new_rows}
+        old_rows = tsv_rows(brands | {row[0] for name in removed for row in previous.get(name, {}).get("rows", [])})
+    changes = diff_rows(old_rows, new_rows)
+    counts = {op: sum(c["op"] == op for c in changes) for op in ("added", "removed", "changed")}
+    print(f"  Rows: +{counts['added']}  -{counts['removed']}  ~{counts['changed']}")
+    print_diff(changes)
+    if diff_out:
+        diff_out.write_text("".join(json.dumps(c, ensure_ascii=False) + "\n" for c in changes))
+        print(f"  Diff: {diff_out}")
+
+    if dry_run:
+        return
+    if failed:
+        raise SystemExit(f"  ERROR: {len(failed)} source(s) failed to parse ({', '.join(failed)}); "
+                         "nothing written")
+    runs = [source["rows"] for source in sources.values() if source["rows"]]
+    tsv_changed, table_changed = write_outputs(runs)
+    STATE_FILE.write_text(json.dumps({"format": FORMAT, "sources": sources}))
+    print(f"  {TSV_FILE.name}: {'written' if tsv_changed else 'unchanged'}  "
+          f"{TABLE_FILE.name}: {'written' if table_changed else 'unchanged'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally regenerate CAR_DATA.tsv and CAR_DATA_TABLE.md")
+    parser.add_argument("--force", action="store_true", help="Ignore the state file and re-extract every brand")
+    parser.add_argument("--dry-run", action="store_true", help="Print the row diff without writing anything")
+    parser.add_argument("--diff-out", type=Path, help="Write the full row diff as JSON lines")
+    args = parser.parse_args()
+    run(force=args.force, dry_run=args.dry_run, diff_out=args.diff_out)
+
+
+if __name__ == "__main__":
+    main()
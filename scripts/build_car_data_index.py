@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+build_car_data_index.py
+
+Build stage for inventory filtering: loads CAR_DATA.tsv into typed NumPy
+columns and precomputes everything the filter/sort UI needs, so queries on
+dealer inventory pages become index lookups instead of scans over raw rows.
+
+The artifact (compact JSON) contains:
+  - rows:       per-row categorical codes + numeric columns (null = missing)
+  - vocab:      code → label for brand / model / fuel / transmission
+  - facets:     counts per brand, fuel and transmission, plus the joint
+                brand × fuel × transmission cube (any filter combo → sum)
+  - order:      row ids sorted ascending by each numeric column (missing last)
+  - histograms: bucket boundaries, per-bucket counts and each row's bucket
+
+It is written to public/data/car-data-index.json, which is a local build
+artifact (gitignored) until a page reads it.
+
+Usage:
+  python3 scripts/build_car_data_index.py
+  python3 scripts/build_car_data_index.py --buckets 12 --output /tmp/index.json
+"""
+
+import argparse
+import csv
+import json
+import math
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+INPUT_TSV    = PROJECT_ROOT / "CAR_DATA.tsv"
+OUTPUT_JSON  = PROJECT_ROOT / "public" / "data" / "car-data-index.json"
+BUCKETS      = 10
+
+# TSV header → artifact column name
+CATEGORICAL = {
+    "Brand": "brand",
+    "Model": "model",
+    "Fuel Type": "fuel",
+    "Transmission": "transmission",
+}
+NUMERIC = {
+    "Price (INR)": "price",
+    "Engine (cc)": "engine_cc",
+    "Power (bhp)": "power_bhp",
+    "Torque (Nm)": "torque_nm",
+    "Mileage": "mileage",
+    "Seating": "seating",
+    "Boot (L)": "boot_l",
+    "Ground Clearance (mm)": "ground_clearance_mm",
+    "Year": "year",
+}
+FACETS = ("brand", "fuel", "transmission")
+
+
+# ── Load ──────────────────────────────────────────────────────────────────────
+
+def normalize_transmission(raw: str) -> str:
+    """Collapse the free-text gearbox column ("8-Speed Steptronic", "AMT", …)."""
+    raw = raw.strip()
+    if not raw:
+        return ""
+    return "Manual" if "manual" in raw.lower() else "Automatic"
+
+
+def _to_float(raw: str) -> float:
+    try:
+        value = float(raw)
+    except ValueError:
+        return math.nan
+    # Mileage 0 / price 0 are scrape placeholders, not real values
+    return value if value > 0 else math.nan
+
+
+def load_columns(tsv_path: Path):
+    """
+    Read the TSV into columns.
+    Returns (variants, codes, vocab, numeric): codes are int32 arrays indexing
+    into vocab, numeric columns are float64 with NaN for missing values.
+    """
+    import numpy as np
+
+    with tsv_path.open(encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f, delimiter="\t"))
+
+    variants = [r["Variant"] for r in rows]
+
+    codes, vocab = {}, {}
+    for header, name in CATEGORICAL.items():
+        raw = [r.get(header) or "" for r in rows]
+        if name == "transmission":
+            raw = [normalize_transmission(v) for v in raw]
+        labels, inverse = np.unique(np.array(raw, dtype=object), return_inverse=True)
+        vocab[name] = [str(label) for label in labels]
+        codes[name] = inverse.astype(np.int32)
+
+    numeric = {
+        name: np.array([_to_float(r.get(header) or "") for r in rows], dtype=np.float64)
+        for header, name in NUMERIC.items()
+    }
+    return variants, codes, vocab, numeric
+
+
+# ── Indexes ───────────────────────────────────────────────────────────────────
+
+def facet_counts(codes: dict, vocab: dict) -> dict:
+    """Per-facet counts plus the joint cube, flattened in FACETS order."""
+    import numpy as np
+
+    facets = {
+        name: dict(zip(vocab[name], np.bincount(codes[name], minlength=len(vocab[name])).tolist()))
+        for name in FACETS
+    }
+    shape = tuple(len(vocab[name]) for name in FACETS)
+    flat = np.ravel_multi_index(tuple(codes[name] for name in FACETS), shape)
+    facets["cube"] = {
+        "dims": list(FACETS),
+        "shape": list(shape),
+        "counts": np.bincount(flat, minlength=int(np.prod(shape))).tolist(),
+    }
+    return facets
+
+
+def sort_orders(numeric: dict) -> dict:
+    """Row ids ascending by value; stable, so ties keep TSV order. NaN sorts last."""
+    import numpy as np
+
+    return {
+        name: np.argsort(values, kind="stable").astype(np.int32).tolist()
+        for name, values in numeric.items()
+    }
+
+
+def histogram(values: "np.ndarray", buckets: int) -> dict:
+    """
+    Quantile buckets so each holds roughly the same number of rows.
+    Row bucket is -1 when the value is missing.
+    """
+    import numpy as np
+
+    present = values[~np.isnan(values)]
+    if present.size == 0:
+        return {"edges": [], "counts": [], "rows": [-1] * values.size}
+
+    # Bucket with the same 2-decimal edges that are emitted. The outer edges
+    # round outwards so the smallest and largest values stay inside them and
+    # counts agree with rows.
+    edges = np.round(np.quantile(present, np.linspace(0.0, 1.0, buckets + 1)), 2)
+    edges[0] = np.floor(present.min() * 100) / 100
+    edges[-1] = np.ceil(present.max() * 100) / 100
+    edges = np.unique(edges)
+    if edges.size == 1:
+        edges = np.array([edges[0], edges[0]])
+    counts, _ = np.histogram(present, bins=edges)
+
+    # np.histogram closes the last bucket on the right; mirror that here
+    rows = np.searchsorted(edges, values, side="right") - 1
+    rows = np.clip(rows, 0, edges.size - 2)
+    rows[np.isnan(values)] = -1
+    return {
+        "edges": edges.tolist(),
+        "counts": counts.tolist(),
+        "rows": rows.astype(np.int32).tolist(),
+    }
+
+
+def _nullable(values: "np.ndarray") -> list:
+    import numpy as np
+
+    return [None if np.isnan(v) else (int(v) if float(v).is_integer() else float(v)) for v in values]
+
+
+def build_index(tsv_path: Path, buckets: int = BUCKETS) -> dict:
+    variants, codes, vocab, numeric = load_columns(tsv_path)
+    rows = {name: codes[name].tolist() for name in CATEGORICAL.values()}
+    rows["variant"] = variants
+    rows.update({name: _nullable(values) for name, values in numeric.items()})
+    return {
+        "source": tsv_path.name,
+        "count": len(variants),
+        "vocab": vocab,
+        "rows": rows,
+        "facets": facet_counts(codes, vocab),
+        "order": sort_orders(numeric),
+        "histograms": {name: histogram(values, buckets) for name, values in numeric.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute CAR_DATA.tsv facet/range index")
+    parser.add_argument("--input", type=Path, default=INPUT_TSV)
+    parser.add_argument("--output", type=Path, default=OUTPUT_JSON)
+    parser.add_argument("--buckets", type=int, default=BUCKETS,
+                        help="Histogram buckets per numeric column")
+    args = parser.parse_args()
+
+    index = build_index(args.input, args.buckets)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(index, separators=(",", ":"), ensure_ascii=False))
+
+    print(f"  Rows:    {index['count']}")
+    print(f"  Brands:  {len(index['vocab']['brand'])}")
+    print(f"  Output:  {args.output} ({args.output.stat().st_size // 1024} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,356 @@
+#!/usr/bin/env python3
+"""
+build_color_swatches.py
+
+Extracts a paint swatch from every colour-variant image and writes it into
+the gallery metadata, so colour pickers can render without loading photos:
+
+  4w-galleries/{brand}/{model}/metadata.json
+    "colorSwatches": [                          # parallel to colorImages
+      {"hex": "#9b1b1f", "palette": ["#9b1b1f", "#1d1d1f", …], "sha": "1f3a…"},
+      null                                      # image missing or undecodable
+    ]
+
+  2w-colors/{brand}/{model}/metadata.json
+    "colors": [{"name": "Purple", "image": "…", "swatch": {"hex": …, "palette": …, "sha": …}}]
+
+Per image: downscale to ≤128 px and strip letterbox bars (transparent or
+near-black border rows/columns). Then drop transparent pixels and the
+backdrop: pixels near the backdrop colour that are connected to the border
+(so white paint inside the vehicle survives), plus any pixel that is the
+backdrop colour itself (backdrop seen through spokes and windows). The
+backdrop colour is taken from the near-white pixels on the border, or the
+whole border when it has none. The body pixels are
+split into tone bands (chromatic, light, mid and dark neutrals); the paint
+is the first band covering enough of the body (BAND_SHARES), and the hex is
+the largest cluster of a median-cut seeded k-means within it. Tyres, glass
+and trim are dark neutrals, so they only win on a black vehicle. "palette"
+lists the k-means clusters of the whole body, largest first. A paint
+colour that is the backdrop colour is rejected in favour of the next band.
+
+Images whose sha matches the stored swatch are skipped; the rest are
+processed in parallel. metadata.json is only rewritten when a swatch
+changes.
+
+Usage:
+  python3 scripts/build_color_swatches.py            # 4W and 2W
+  python3 scripts/build_color_swatches.py 2w --force --workers 8
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from build_gallery_placeholders import file_sha, gallery_tail
+from publish_hashed_images import stable_key
+
+if TYPE_CHECKING:
+    import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PUBLIC_DIR   = PROJECT_ROOT / "public"
+ROOTS = {
+    "4w": PUBLIC_DIR / "data" / "brand-model-images" / "4w-galleries",
+    "2w": PUBLIC_DIR / "data" / "brand-model-images" / "2w-colors",
+}
+SAMPLE_SIDE  = 128
+CLUSTERS     = 5
+ITERATIONS   = 8
+BG_TOLERANCE = 24    # max channel distance to the backdrop colour → backdrop if border-connected
+BG_EXACT     = 8     # max channel distance → backdrop anywhere; also rejects a paint swatch
+WHITE_MIN    = 255 - BG_TOLERANCE  # all channels at least this → near-white
+MIN_BODY     = 0.03  # fewer body pixels than this share → keep everything opaque
+CHROMA_MIN   = 40    # max - min channel for a pixel to count as coloured
+LIGHT_MIN    = 150   # luma of light neutrals (white / silver)
+MID_MIN      = 80    # luma of mid neutrals (grey)
+# tone band → share of body pixels it needs to be taken as the paint, in
+# order; on bikes the engine, tyres and seat outweigh the painted panels
+BAND_SHARES  = {
+    "4w": {"chromatic": 0.15, "light": 0.25, "mid": 0.35},
+    "2w": {"chromatic": 0.06, "light": 0.25, "mid": 0.35},
+}
+WORKERS      = os.cpu_count() or 4
+
+
+# ── Extraction ────────────────────────────────────────────────────────────────
+
+def _hex(rgb) -> str:
+    return "#" + "".join(f"{int(round(c)):02x}" for c in rgb)
+
+
+def _grow(seed: "np.ndarray", allowed: "np.ndarray") -> "np.ndarray":
+    """Pixels of `allowed` 4-connected to `seed` (flood fill by repeated dilation)."""
+    region = seed & allowed
+    while True:
+        grown = region.copy()
+        grown[1:] |= region[:-1]
+        grown[:-1] |= region[1:]
+        grown[:, 1:] |= region[:, :-1]
+        grown[:, :-1] |= region[:, 1:]
+        grown &= allowed
+        if (grown == region).all():
+            return region
+        region = grown
+
+
+def content_box(rgba: "np.ndarray") -> "tuple[slice, slice]":
+    """Rows and columns left after stripping letterbox bars (transparent or uniform near-black lines)."""
+    opaque = rgba[..., 3] >= 128
+    rgb = rgba[..., :3]
+
+    def is_bar(line: "tuple[slice | int, slice | int]") -> bool:
+        if not opaque[line].any():
+            return True
+        return bool(opaque[line].all() and rgb[line].max() <= BG_TOLERANCE)
+
+    top, bottom, left, right = 0, rgba.shape[0], 0, rgba.shape[1]
+    while bottom - top > 2 and right - left > 2:
+        if is_bar((top, slice(left, right))):
+            top += 1
+        elif is_bar((bottom - 1, slice(left, right))):
+            bottom -= 1
+        elif is_bar((slice(top, bottom), left)):
+            left += 1
+        elif is_bar((slice(top, bottom), right - 1)):
+            right -= 1
+        else:
+            break
+    return slice(top, bottom), slice(left, right)
+
+
+def body_pixels(rgba: "np.ndarray") -> "tuple[np.ndarray, np.ndarray | None]":
+    """
+    (N, 3) float32 pixels of the vehicle, and the backdrop colour (None for a
+    cut-out PNG, where transparency already removed the backdrop).
+    """
+    import numpy as np
+
+    rgba = rgba[content_box(rgba)]
+    rgb = rgba[..., :3].astype(np.float32)
+    opaque = rgba[..., 3] >= 128
+
+    edge = np.zeros(opaque.shape, dtype=bool)
+    edge[[0, -1], :] = edge[:, [0, -1]] = True
+    border = edge & opaque
+    if not border.any():
+        return rgb[opaque], None
+    # studio shots: the vehicle may touch the edge, so prefer the white around it
+    white = border & (rgb.min(axis=-1) >= WHITE_MIN)
+    seed = white if white.any() else border
+    backdrop = np.median(rgb[seed], axis=0)
+    distance = np.abs(rgb - backdrop).max(axis=-1)
+    # only backdrop reachable from the border (or exactly the backdrop colour,
+    # seen through the frame): white paint inside the car stays
+    keep = opaque & ~_grow(seed, opaque & (distance <= BG_TOLERANCE)) & (distance > BG_EXACT)
+    if keep.sum() < MIN_BODY * keep.size:
+        keep = opaque
+    return rgb[keep], backdrop
+
+
+def tone_bands(pixels: "np.ndarray") -> "dict[str, np.ndarray]":
+    """Boolean masks over body pixels: chromatic, then light / mid / dark neutrals."""
+    import numpy as np
+
+    chroma = pixels.max(axis=1) - pixels.min(axis=1)
+    luma = pixels @ np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    chromatic = chroma >= CHROMA_MIN
+    return {
+        "chromatic": chromatic,
+        "light": ~chromatic & (luma >= LIGHT_MIN),
+        "mid": ~chromatic & (luma >= MID_MIN) & (luma < LIGHT_MIN),
+        "dark": ~chromatic & (luma < MID_MIN),
+    }
+
+
+def median_cut(pixels: "np.ndarray", k: int) -> "np.ndarray":
+    """k initial centroids: repeatedly split the box with the widest channel at its median."""
+    import numpy as np
+
+    boxes = [pixels]
+    while len(boxes) < k:
+        spans = [(b.max(axis=0) - b.min(axis=0)).max() if len(b) > 1 else -1 for b in boxes]
+        widest = int(np.argmax(spans))
+        if spans[widest] <= 0:
+            break
+        box = boxes.pop(widest)
+        channel = int(np.argmax(box.max(axis=0) - box.min(axis=0)))
+        box = box[np.argsort(box[:, channel], kind="stable")]
+        half = len(box) // 2
+        boxes += [box[:half], box[half:]]
+    return np.array([b.mean(axis=0) for b in boxes], dtype=np.float32)
+
+
+def kmeans(pixels: "np.ndarray", k: int = CLUSTERS, iterations: int = ITERATIONS):
+    """Lloyd iterations from a median-cut start. Returns (centroids, counts) sorted by count."""
+    import numpy as np
+
+    centroids = median_cut(pixels, k)
+    for _ in range(iterations):
+        distances = ((pixels[:, None, :] - centroids[None, :, :]) ** 2).sum(axis=-1)
+        labels = distances.argmin(axis=1)
+        counts = np.bincount(labels, minlength=len(centroids))
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, pixels)
+        moved = np.where(counts[:, None] > 0, sums / np.maximum(counts, 1)[:, None], centroids)
+        if np.allclose(moved, centroids, atol=0.5):
+            break
+        centroids = moved
+    order = np.argsort(-counts, kind="stable")
+    return centroids[order], counts[order]
+
+
+def swatch(path: Path, band_shares: dict = BAND_SHARES["4w"]) -> dict:
+    """Dominant body colour and the cluster palette of one colour-variant image."""
+    import numpy as np
+    from PIL import Image
+
+    with Image.open(path) as img:
+        img.draft("RGB", (SAMPLE_SIDE * 2, SAMPLE_SIDE * 2))
+        small = img.convert("RGBA")
+    small.thumbnail((SAMPLE_SIDE, SAMPLE_SIDE), Image.BILINEAR)
+
+    pixels, backdrop = body_pixels(np.asarray(small))
+    if len(pixels) == 0:
+        raise ValueError("no opaque pixels")
+    # paint is the first tone band covering enough of the body; tyres, glass
+    # and trim are dark neutrals, so they only win when nothing else does.
+    # A band whose paint is the backdrop colour is backdrop, not paint.
+    bands = tone_bands(pixels)
+    for band, share in [*band_shares.items(), ("dark", 0.0)]:
+        if not bands[band].any() or bands[band].mean() < share:
+            continue
+        paint, _ = kmeans(pixels[bands[band]], k=3)
+        if backdrop is None or np.abs(paint[0] - backdrop).max() > BG_EXACT:
+            break
+
+    centroids, counts = kmeans(pixels)
+    centroids = centroids[counts > 0]
+    return {
+        "hex": _hex(paint[0]),
+        "palette": [_hex(c) for c in centroids],
+    }
+
+
+def _swatch_job(job: "tuple[str, tuple[str, str]]") -> "tuple[str, dict | None, str]":
+    path, (sha, category) = job
+    try:
+        return path, {**swatch(Path(path), BAND_SHARES[category]), "sha": sha}, ""
+    except Exception as e:
+        return path, None, str(e)
+
+
+# ── Metadata ──────────────────────────────────────────────────────────────────
+
+def local_file(url: str, meta_path: Path, category: str) -> "Path | None":
+    """The local file behind a colour image URL (published hashed URLs map to the unhashed file)."""
+    if not url:
+        return None
+    if category == "4w":
+        tail = gallery_tail(url)
+        return meta_path.parent / stable_key(tail) if tail else None
+    marker = "/2w-colors/"
+    if marker not in url:
+        return None
+    return ROOTS["2w"] / stable_key(url.split(marker, 1)[1].split("?")[0])
+
+
+def color_slots(metadata: dict, category: str) -> "list[tuple[str, dict | None]]":
+    """[(image url, stored swatch)] in colour order."""
+    if category == "4w":
+        stored = metadata.get("colorSwatches") or []
+        images = metadata.get("colorImages") or []
+        return [(url, stored[i] if i < len(stored) else None) for i, url in enumerate(images)]
+    return [(c.get("image") or c.get("file") or "", c.get("swatch")) for c in metadata.get("colors") or []]
+
+
+def apply_swatches(metadata: dict, category: str, swatches: "list[dict | None]") -> bool:
+    """Write swatches back in colour order; True when metadata changed."""
+    if category == "4w":
+        value = swatches if any(swatches) else None
+        if metadata.get("colorSwatches") == value:
+            return False
+        if value is None:
+            metadata.pop("colorSwatches", None)
+        else:
+            metadata["colorSwatches"] = value
+        return True
+    changed = False
+    for color, entry in zip(metadata.get("colors") or [], swatches):
+        if color.get("swatch") != entry:
+            changed = True
+            if entry is None:
+                color.pop("swatch", None)
+            else:
+                color["swatch"] = entry
+    return changed
+
+
+def run(categories=None, force: bool = False, workers: int = WORKERS):
+    galleries = []   # (category, metadata path, metadata, raw text, [file path | None])
+    jobs = {}        # file path → (sha, category), for images needing extraction
+    reused = 0
+    missing = 0
+
+    for category in categories or ROOTS:
+        for meta_path in sorted(ROOTS[category].glob("*/*/metadata.json")):
+            raw = meta_path.read_text()
+            metadata = json.loads(raw)
+            files = []
+            for url, stored in color_slots(metadata, category):
+                path = local_file(url, meta_path, category)
+                if path is None or not path.exists():
+                    missing += 1
+                    files.append(None)
+                    continue
+                files.append(path)
+                sha = file_sha(path)
+                if not force and (stored or {}).get("sha") == sha:
+                    reused += 1
+                else:
+                    jobs[str(path)] = (sha, category)
+            galleries.append((category, meta_path, metadata, raw, files))
+
+    print(f"  Galleries: {len(galleries)}  Colour images: {reused + len(jobs)}  "
+          f"Unchanged: {reused}  To process: {len(jobs)}  Missing files: {missing}")
+
+    computed = {}
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for path, entry, error in pool.map(_swatch_job, jobs.items(), chunksize=32):
+                if entry is None:
+                    print(f"  WARN: {Path(path).relative_to(PROJECT_ROOT)}: {error}")
+                else:
+                    computed[path] = entry
+
+    updated = 0
+    for category, meta_path, metadata, raw, files in galleries:
+        stored = [s for _, s in color_slots(metadata, category)]
+        swatches = [
+            (computed.get(str(path)) or stored[i]) if path else None
+            for i, path in enumerate(files)
+        ]
+        if apply_swatches(metadata, category, swatches):
+            meta_path.write_text(json.dumps(metadata, indent=2, ensure_ascii=False) + ("\n" if raw.endswith("\n") else ""))
+            updated += 1
+
+    print(f"  Extracted: {len(computed)}  metadata.json updated: {updated}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write dominant-colour swatches into colour-variant metadata")
+    parser.add_argument("categories", nargs="*", metavar="CATEGORY",
+                        help=f"Subset of {', '.join(ROOTS)} (default: all)")
+    parser.add_argument("--force", action="store_true", help="Re-extract every image")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    args = parser.parse_args()
+    unknown = set(args.categories) - set(ROOTS)
+    if unknown:
+        parser.error(f"unknown categories: {', '.join(sorted(unknown))}")
+    run(categories=args.categories or None, force=args.force, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+build_gallery_index.py
+
+Compiles the 4W gallery metadata.json files into one small index per brand,
+so a brand-level gallery grid needs a single fetch instead of one request
+per model:
+
+  public/data/gallery-index/4w/index.json      brand → model count, image
+                                               total, first model's hero
+  public/data/gallery-index/4w/{brand}.json    per-model hero, counts, hero
+                                               placeholder and first N thumbs
+
+Paths under the brand's gallery folder are stored relative to "base";
+absolute paths and published (http) URLs are kept as-is:
+
+  {
+    "brand": "Audi", "slug": "audi",
+    "base": "/data/brand-model-images/4w-galleries/audi/",
+    "models": [
+      {"model": "A4", "slug": "a4", "hero": "a4/colors/progressive-red-metallic.avif",
+       "counts": {"colors": 8, "total": 8},
+       "placeholder": {"width": 930, "height": 620, "color": "#e3d2d4", "lqip": "data:…"},
+       "thumbs": ["a4/colors/manhattan-grey-metallic.avif", …]}
+    ]
+  }
+
+Rebuilds are incremental: the sha of every metadata.json is kept in
+scripts/.gallery_index_state.json along with its compiled entry, only
+changed galleries are parsed again, and an index file is only rewritten
+when its content changes.
+
+Usage:
+  python3 scripts/build_gallery_index.py
+  python3 scripts/build_gallery_index.py --thumbs 6 --force
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+GALLERY_ROOT = PROJECT_ROOT / "public" / "data" / "brand-model-images" / "4w-galleries"
+OUTPUT_DIR   = PROJECT_ROOT / "public" / "data" / "gallery-index" / "4w"
+STATE_FILE   = Path(__file__).parent / ".gallery_index_state.json"
+URL_PREFIX   = "/data/brand-model-images/4w-galleries/"
+THUMB_FIELDS = ("exterior", "interior", "feature", "colorImages")  # thumbnail order
+THUMBS       = 4
+FORMAT       = 2  # bump when the entry layout changes; invalidates the state
+
+
+def file_sha(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def compact(url: str, brand: str) -> str:
+    """'/data/…/4w-galleries/audi/a4/colors/x.avif' → 'a4/colors/x.avif' for brand 'audi'."""
+    base = f"{URL_PREFIX}{brand}/"
+    return url[len(base):] if url.startswith(base) else url
+
+
+def compile_model(metadata: dict, brand: str, slug: str, thumbs: int) -> dict:
+    """The index entry for one gallery (hero, counts, hero placeholder, first thumbs)."""
+    hero = metadata.get("hero") or ""
+    entry = {
+        "model": metadata.get("model", ""),
+        "slug": slug,  # the folder name; metadata's modelSlug is the scrape source's
+        "hero": compact(hero, brand) if hero else None,
+        "counts": metadata.get("counts") or {},
+    }
+
+    # placeholders are keyed by the path relative to the gallery folder
+    # (or by URL for published images); see build_gallery_placeholders.py
+    placeholders = metadata.get("placeholders") or {}
+    gallery_prefix = f"{URL_PREFIX}{brand}/{slug}/"
+    hero_key = hero[len(gallery_prefix):] if hero.startswith(gallery_prefix) else hero
+    placeholder = placeholders.get(hero_key)
+    if placeholder:
+        entry["placeholder"] = {k: placeholder[k] for k in ("width", "height", "color", "lqip") if k in placeholder}
+
+    seen = {hero}
+    picked = []
+    for field in THUMB_FIELDS:
+        for url in metadata.get(field) or []:
+            if len(picked) == thumbs:
+                break
+            if url and url not in seen:
+                seen.add(url)
+                picked.append(compact(url, brand))
+    entry["thumbs"] = picked
+    return entry
+
+
+def _from_root(path: str, brand: str) -> str:
+    """Brand-relative path → relative to URL_PREFIX (index.json's base)."""
+    return path if path.startswith(("/", "http")) else f"{brand}/{path}"
+
+
+def _dump(data) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+
+def _write_if_changed(path: Path, text: str) -> bool:
+    if path.exists() and path.read_text() == text:
+        return False
+    path.write_text(text)
+    return True
+
+
+def load_state(thumbs: int) -> dict:
+    try:
+        state = json.loads(STATE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    if state.get("format") != FORMAT or state.get("thumbs") != thumbs:
+        return {}
+    return state.get("galleries", {})
+
+
+def run(thumbs: int = THUMBS, force: bool = False):
+    previous = {} if force else load_state(thumbs)
+    galleries = {}          # "brand/model" → {"sha", "make", "entry"}
+    changed_brands = set()
+    parsed = 0
+
+    for meta_path in sorted(GALLERY_ROOT.glob("*/*/metadata.json")):
+        brand = meta_path.parent.parent.name
+        key = f"{brand}/{meta_path.parent.name}"
+        sha = file_sha(meta_path)
+        cached = previous.get(key)
+        if cached and cached["sha"] == sha:
+            galleries[key] = cached
+            continue
+        metadata = json.loads(meta_path.read_text())
+        galleries[key] = {
+            "sha": sha,
+            "make": metadata.get("make", ""),
+            "entry": compile_model(metadata, brand, meta_path.parent.name, thumbs),
+        }
+        changed_brands.add(brand)
+        parsed += 1
+    changed_brands |= {key.split("/")[0] for key in previous.keys() - galleries.keys()}
+
+    by_brand = {}
+    for key, gallery in galleries.items():
+        by_brand.setdefault(key.split("/")[0], []).append(gallery)
+
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    written = 0
+    summary = {}
+    for brand, items in sorted(by_brand.items()):
+        models = sorted((g["entry"] for g in items), key=lambda e: e["model"].lower())
+        summary[brand] = {
+            "brand": items[0]["make"],
+            "models": len(models),
+            "images": sum(m["counts"].get("total", 0) for m in models),
+            "hero": next((_from_root(m["hero"], brand) for m in models if m["hero"]), None),
+        }
+        out = OUTPUT_DIR / f"{brand}.json"
+        if brand in changed_brands or not out.exists():
+            written += _write_if_changed(out, _dump({
+                "brand": items[0]["make"],
+                "slug": brand,
+                "base": f"{URL_PREFIX}{brand}/",
+                "models": models,
+            }) + "\n")
+
+    # brands whose galleries were all removed
+    for stale in OUTPUT_DIR.glob("*.json"):
+        if stale.stem != "index" and stale.stem not in by_brand:
+            stale.unlink()
+            written += 1
+
+    written += _write_if_changed(OUTPUT_DIR / "index.json", _dump({
+        "base": URL_PREFIX,
+        "brands": summary,
+    }) + "\n")
+    STATE_FILE.write_text(json.dumps({"format": FORMAT, "thumbs": thumbs, "galleries": galleries}))
+
+    size = sum(p.stat().st_size for p in OUTPUT_DIR.glob("*.json"))
+    print(f"  Galleries: {len(galleries)}  Parsed: {parsed}  Unchanged: {len(galleries) - parsed}")
+    print(f"  Brands: {len(by_brand)}  Files written: {written}  Index size: {size / 1024:.1f} KB")
+    print(f"  Output: {OUTPUT_DIR.relative_to(PROJECT_ROOT)}/")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile 4W gallery metadata into per-brand index files")
+    parser.add_argument("--thumbs", type=int, default=THUMBS, help="Thumbnails kept per model")
+    parser.add_argument("--force", action="store_true", help="Ignore the state file and re-parse every gallery")
+    args = parser.parse_args()
+    run(thumbs=args.thumbs, force=args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+build_gallery_placeholders.py
+
+Adds placeholder data to every 4W gallery metadata.json so galleries can
+paint before the AVIFs arrive and reserve the right box (no layout shift).
+
+For each local image referenced by hero / exterior / interior / feature /
+colorImages, metadata gains an entry under "placeholders", keyed by the path
+relative to the gallery folder (the part the site keeps when it normalizes
+asset URLs). Images published under content-hashed URLs by
+publish_hashed_images.py are keyed by that URL and described from the local
+file behind it:
+
+  "placeholders": {
+    "colors/polar-white.avif": {
+      "width": 1200, "height": 800,
+      "color": "#d9d9d7",                      # mean colour, for a flat fill
+      "lqip": "data:image/webp;base64,...",    # ~16px blurDataURL for next/image
+      "sha": "1f3a…"                           # source fingerprint (incremental)
+    }
+  }
+
+Images whose sha matches the stored entry are not decoded again; changed or
+new images are processed in parallel. metadata.json is only rewritten when
+its placeholders actually change. Other remote (http) references are skipped.
+
+Usage:
+  python3 scripts/build_gallery_placeholders.py
+  python3 scripts/build_gallery_placeholders.py --force --workers 8
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from publish_hashed_images import stable_key
+
+PROJECT_ROOT = Path(__file__).parent.parent
+GALLERY_ROOT = PROJECT_ROOT / "public" / "data" / "brand-model-images" / "4w-galleries"
+IMAGE_FIELDS = ("hero", "exterior", "interior", "feature", "colorImages")
+LQIP_WIDTH   = 16
+LQIP_QUALITY = 40
+WORKERS      = os.cpu_count() or 4
+
+
+def file_sha(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def gallery_tail(url: str) -> "str | None":
+    """'…/4w-galleries/{brand}/{model}/colors/x.avif' → 'colors/x.avif' (None outside 4w-galleries)."""
+    parts = [p for p in url.split("/") if p]
+    if "4w-galleries" not in parts:
+        return None
+    index = parts.index("4w-galleries")
+    if len(parts) <= index + 3:
+        return None
+    return "/".join(parts[index + 3:])
+
+
+def referenced_tails(metadata: dict) -> "dict[str, str]":
+    """{placeholder key: local tail} in field order. Published URLs key by URL, backed by the unhashed file."""
+    tails = {}
+    for field in IMAGE_FIELDS:
+        values = metadata.get(field) or []
+        for url in [values] if isinstance(values, str) else values:
+            tail = gallery_tail(url)
+            if tail:
+                tails.setdefault(url if url.startswith("http") else tail, stable_key(tail))
+    return tails
+
+
+def describe(path: Path) -> dict:
+    """Intrinsic size, mean colour and a tiny WebP data URL for one image."""
+    import numpy as np
+    from PIL import Image
+
+    with Image.open(path) as img:
+        width, height = img.size
+        small = img.convert("RGB")
+    small.thumbnail((LQIP_WIDTH, LQIP_WIDTH * 4), Image.BOX)
+
+    mean = np.asarray(small, dtype=np.float32).reshape(-1, 3).mean(axis=0)
+    buf = io.BytesIO()
+    small.save(buf, "WEBP", quality=LQIP_QUALITY)
+    return {
+        "width": width,
+        "height": height,
+        "color": "#" + "".join(f"{int(round(c)):02x}" for c in mean),
+        "lqip": "data:image/webp;base64," + base64.b64encode(buf.getvalue()).decode("ascii"),
+    }
+
+
+def _describe_job(job: "tuple[str, str]") -> "tuple[str, dict | None, str]":
+    path, sha = job
+    try:
+        return path, {**describe(Path(path)), "sha": sha}, ""
+    except Exception as e:
+        return path, None, str(e)
+
+
+def _dump(metadata: dict, trailing_newline: bool) -> str:
+    return json.dumps(metadata, indent=2, ensure_ascii=False) + ("\n" if trailing_newline else "")
+
+
+def run(force: bool = False, workers: int = WORKERS):
+    galleries = []   # (metadata path, metadata, raw text, {tail: file path})
+    jobs = {}        # file path → sha, for images needing a decode
+    reused = 0
+    missing = 0
+
+    for meta_path in sorted(GALLERY_ROOT.rglob("metadata.json")):
+        raw = meta_path.read_text()
+        metadata = json.loads(raw)
+        previous = metadata.get("placeholders") or {}
+        files = {}
+        for key, tail in referenced_tails(metadata).items():
+            path = meta_path.parent / tail
+            if not path.exists():
+                missing += 1
+                continue
+            files[key] = path
+            sha = file_sha(path)
+            if not force and previous.get(key, {}).get("sha") == sha:
+                reused += 1
+            else:
+                jobs[str(path)] = sha
+        galleries.append((meta_path, metadata, raw, files))
+
+    print(f"  Galleries: {len(galleries)}  Images: {reused + len(jobs)}  "
+          f"Unchanged: {reused}  To process: {len(jobs)}  Missing files: {missing}")
+
+    computed = {}
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for path, entry, error in pool.map(_describe_job, jobs.items(), chunksize=16):
+                if entry is None:
+                    print(f"  WARN: {Path(path).relative_to(PROJECT_ROOT)}: {error}")
+                else:
+                    computed[path] = entry
+
+    updated = 0
+    for meta_path, metadata, raw, files in galleries:
+        previous = metadata.get("placeholders") or {}
+        placeholders = {}
+        for key, path in files.items():
+            entry = computed.get(str(path)) or previous.get(key)
+            if entry:
+                placeholders[key] = entry
+        if placeholders == previous and ("placeholders" in metadata or not placeholders):
+            continue
+        if placeholders:
+            metadata["placeholders"] = placeholders
+        else:
+            metadata.pop("placeholders", None)
+        meta_path.write_text(_dump(metadata, raw.endswith("\n")))
+        updated += 1
+
+    print(f"  Decoded: {len(computed)}  metadata.json updated: {updated}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write LQIP/size placeholders into 4W gallery metadata")
+    parser.add_argument("--force", action="store_true", help="Recompute every image")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    args = parser.parse_args()
+    run(force=args.force, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
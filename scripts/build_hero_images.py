@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+build_hero_images.py
+
+Refresh brand hero images from scripts/hero_manifest.json and regenerate the
+TypeScript mapping the site reads (lib/data/generated/hero-images.ts).
+
+Per brand, in one pass:
+  - try each manifest source in order (fetched through the shared blob cache,
+    so re-runs cost no network), falling back to what is already on disk
+  - detect the real format from magic bytes (OEM URLs lie: .jpg serving PNG)
+  - decode fully to catch truncated/HTML responses, check minimum width
+  - downscale anything wider than MAX_WIDTH
+  - write {slug}.{ext} only when bytes changed, remove stale {slug}.* files
+
+Brands run concurrently. Re-running with nothing changed writes nothing.
+
+Usage:
+  python3 scripts/build_hero_images.py
+  python3 scripts/build_hero_images.py --offline          # disk only, no network
+  python3 scripts/build_hero_images.py --only bmw --only audi
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import ssl
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from blob_cache import shared_cache
+
+PROJECT_ROOT = Path(__file__).parent.parent
+MANIFEST     = Path(__file__).parent / "hero_manifest.json"
+HERO_DIR     = PROJECT_ROOT / "public" / "assets" / "hero"
+TS_OUTPUT    = PROJECT_ROOT / "lib" / "data" / "generated" / "hero-images.ts"
+RENDITIONS_RECORD = Path(__file__).parent / "hero_renditions.json"  # see build_hero_renditions.py
+WORKERS      = 8
+MIN_WIDTH    = 640    # narrower images are used only when nothing better exists
+MAX_WIDTH    = 1920
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+
+# OEM sites with broken chains were the reason the old scripts skipped verification
+SSL_CTX = ssl.create_default_context()
+SSL_CTX.check_hostname = False
+SSL_CTX.verify_mode = ssl.CERT_NONE
+
+# PIL format → file extension
+EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "WEBP": "webp", "AVIF": "avif"}
+SAVE_OPTIONS = {
+    "JPEG": {"quality": 85, "optimize": True, "progressive": True},
+    "PNG": {"optimize": True},
+    "WEBP": {"quality": 82, "method": 6},
+    "AVIF": {"quality": 60},
+}
+
+
+def sniff_format(data: bytes) -> "str | None":
+    """Image format from magic bytes (PIL naming), or None if not an image we keep."""
+    if data[:3] == b"\xff\xd8\xff":
+        return "JPEG"
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        return "PNG"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "WEBP"
+    if data[4:8] == b"ftyp" and data[8:12] in (b"avif", b"avis"):
+        return "AVIF"
+    return None
+
+
+def fetch(url: str) -> bytes:
+    """GET url; refuses non-image responses so error pages never reach the cache."""
+    req = urllib.request.Request(url, headers=HEADERS)
+    with urllib.request.urlopen(req, context=SSL_CTX, timeout=30) as response:
+        content_type = response.headers.get_content_type()
+        if not (content_type.startswith("image/") or content_type == "application/octet-stream"):
+            raise ValueError(f"not an image ({content_type})")
+        return response.read()
+
+
+def prepare(data: bytes) -> "tuple[bytes, str, tuple[int, int]]":
+    """
+    Validate and normalize one candidate. Returns (bytes, ext, (w, h));
+    bytes are the original unless the image had to be downscaled.
+    Raises ValueError when data is not a decodable image.
+    """
+    from PIL import Image
+
+    fmt = sniff_format(data)
+    if fmt is None:
+        raise ValueError("unrecognized image format")
+    try:
+        img = Image.open(io.BytesIO(data))
+        img.load()  # full decode: catches truncated downloads
+    except Exception as e:
+        raise ValueError(f"decode failed: {e}")
+
+    if img.width > MAX_WIDTH:
+        height = round(img.height * MAX_WIDTH / img.width)
+        if fmt == "JPEG" and img.mode != "RGB":
+            img = img.convert("RGB")
+        img = img.resize((MAX_WIDTH, height), Image.LANCZOS)
+        buf = io.BytesIO()
+        img.save(buf, fmt, **SAVE_OPTIONS[fmt])
+        data = buf.getvalue()
+    return data, EXTENSIONS[fmt], img.size
+
+
+def existing_files(slug: str) -> "list[Path]":
+    return sorted(p for p in HERO_DIR.glob(f"{slug}.*") if p.stem == slug)
+
+
+def build_brand(slug: str, entry: dict, offline: bool = False) -> dict:
+    """Pick, normalize and write one brand's hero. Returns a result row."""
+    candidates = []  # (source, bytes, ext, size)
+    errors = []
+
+    sources = [] if offline else entry.get("sources", [])
+    for url in sources:
+        try:
+            raw = shared_cache().fetch(url, fetch)
+            if not raw:
+                raise ValueError("empty response")
+            candidates.append((url, *prepare(raw)))
+        except Exception as e:
+            errors.append(f"{url[:60]}: {e}")
+            continue
+        if candidates[-1][3][0] >= MIN_WIDTH:
+            break
+
+    if not candidates or candidates[-1][3][0] < MIN_WIDTH:
+        for path in existing_files(slug):
+            try:
+                candidates.append((str(path.relative_to(PROJECT_ROOT)), *prepare(path.read_bytes())))
+            except ValueError as e:
+                errors.append(f"{path.name}: {e}")
+
+    if not candidates:
+        return {"slug": slug, "status": "missing", "errors": errors}
+
+    wide = [c for c in candidates if c[3][0] >= MIN_WIDTH]
+    source, data, ext, size = wide[0] if wide else max(candidates, key=lambda c: c[3][0])
+
+    dest = HERO_DIR / f"{slug}.{ext}"
+    changed = not dest.exists() or dest.read_bytes() != data
+    if changed:
+        HERO_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.tmp")
+        tmp.write_bytes(data)
+        tmp.replace(dest)
+    for stale in existing_files(slug):
+        if stale != dest:
+            stale.unlink()
+            changed = True
+
+    return {
+        "slug": slug,
+        "status": ("updated" if changed else "unchanged") + ("" if size[0] >= MIN_WIDTH else ", low-res"),
+        "file": dest.name,
+        "ext": ext,
+        "width": size[0],
+        "height": size[1],
+        "bytes": len(data),
+        "source": source,
+        "errors": errors,
+    }
+
+
+# ── TypeScript mapping ────────────────────────────────────────────────────────
+
+MIME_TYPES = {"avif": "image/avif", "webp": "image/webp"}
+
+
+def _ts_record(name: str, comment: str, rows, value_type: str = "string") -> str:
+    body = "".join(f"    '{k}': {v},\n" for k, v in rows)
+    return f"// {comment}\nexport const {name}: Record<string, {value_type}> = {{\n{body}}};\n"
+
+
+def _srcset_sources(entry: dict) -> "list[str]":
+    """<picture> sources for one brand: per breakpoint (narrowest first), AVIF before WebP."""
+    sources = []
+    for bp in entry["breakpoints"].values():
+        largest = bp["outputs"][-1]
+        for fmt in largest["files"]:
+            srcset = ", ".join(
+                f"/assets/hero/renditions/{o['files'][fmt]['file']} {o['width']}w" for o in bp["outputs"]
+            )
+            sources.append(
+                f"{{ media: '{bp['media']}', type: '{MIME_TYPES[fmt]}', srcSet: '{srcset}', "
+                f"width: {largest['width']}, height: {largest['height']} }}"
+            )
+    return sources
+
+
+def render_ts(brands: dict, files: "dict[str, Path]", renditions: dict) -> str:
+    by_type = lambda t: [(slug, f"'{path.suffix[1:]}'") for slug, path in files.items() if brands[slug]["type"] == t]
+    srcsets = [
+        (slug, "[\n" + "".join(f"        {src},\n" for src in _srcset_sources(renditions[slug])) + "    ]")
+        for slug in files if slug in renditions
+    ]
+    return "\n".join([
+        "// Generated by scripts/build_hero_images.py from scripts/hero_manifest.json. Do not edit.\n",
+        _ts_record("HERO_2W", "2W brands that have their own dedicated hero images in /assets/hero/", by_type("2w")),
+        _ts_record("HERO_4W", "4W hero images in /assets/hero/", by_type("4w")),
+        _ts_record("HERO_IMAGES", "Brand display name → hero image path",
+                   [(brands[slug]["name"], f"'/assets/hero/{path.name}'") for slug, path in files.items()]),
+        "export interface HeroSource {\n"
+        "    media: string;\n    type: string;\n    srcSet: string;\n    width: number;\n    height: number;\n}\n",
+        _ts_record("HERO_SRCSET", "Breakpoint renditions per slug, in <picture> source order "
+                   "(scripts/build_hero_renditions.py)", srcsets, "HeroSource[]"),
+    ])
+
+
+def write_mapping(brands: dict):
+    """
+    Regenerate TS_OUTPUT from what is on disk. Renditions are included only
+    while their recorded source hash still matches the current hero file and
+    their files exist (they are gitignored build output).
+    """
+    files = {}
+    for slug in sorted(brands):
+        found = existing_files(slug)
+        if found:
+            files[slug] = found[0]
+
+    record = json.loads(RENDITIONS_RECORD.read_text()) if RENDITIONS_RECORD.exists() else {}
+    renditions = {
+        slug: entry for slug, entry in record.items()
+        if slug in files and entry.get("source") == files[slug].name
+        and entry.get("sha256") == hashlib.sha256(files[slug].read_bytes()).hexdigest()
+        and all((HERO_DIR / "renditions" / f["file"]).exists()
+                for bp in entry["breakpoints"].values() for o in bp["outputs"] for f in o["files"].values())
+    }
+
+    TS_OUTPUT.parent.mkdir(parents=True, exist_ok=True)
+    TS_OUTPUT.write_text(render_ts(brands, files, renditions))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download/normalize brand hero images and emit the TS mapping")
+    parser.add_argument("--offline", action="store_true", help="Use files already on disk, no network")
+    parser.add_argument("--only", action="append", metavar="SLUG", help="Limit to these brand slugs")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    args = parser.parse_args()
+
+    brands = json.loads(MANIFEST.read_text())["brands"]
+    selected = [s for s in brands if not args.only or s in args.only]
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        rows = list(pool.map(lambda s: build_brand(s, brands[s], args.offline), selected))
+    shared_cache().flush()
+
+    for row in rows:
+        if row["status"] == "missing":
+            print(f"  ❌ {row['slug']:<16} missing")
+        else:
+            print(f"  ✅ {row['slug']:<16} {row['file']:<22} {row['width']}x{row['height']:<5} "
+                  f"{row['bytes'] // 1024:>5} KB  {row['status']}")
+        for err in row["errors"]:
+            print(f"       {err}")
+
+    # The mapping always covers every brand, not just --only ones
+    write_mapping(brands)
+
+    missing = [r["slug"] for r in rows if r["status"] == "missing"]
+    print(f"\n  Heroes: {len(rows) - len(missing)}/{len(rows)}  Missing: {missing or 'none'}")
+    print(f"  Mapping: {TS_OUTPUT.relative_to(PROJECT_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
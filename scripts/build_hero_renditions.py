@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+build_hero_renditions.py
+
+Breakpoint renditions for brand hero images (the LCP element on dealer
+homepages). For each hero in public/assets/hero this crops to the aspect of
+every breakpoint around the brand's focal point, then encodes AVIF and WebP
+at each width under a byte budget:
+
+  mobile   3:4 portrait   360 / 720 px
+  tablet   16:10          768 / 1280 px
+  desktop  21:9           1440 / 1920 px
+
+Output goes to public/assets/hero/renditions/{slug}-{breakpoint}-{width}.{avif,webp}.
+What was built is recorded in scripts/hero_renditions.json, keyed by source hash,
+focal point and settings, so unchanged brands are skipped on the next run;
+renditions of brands no longer built are deleted. Afterwards it regenerates
+lib/data/generated/hero-images.ts (HERO_SRCSET).
+
+Renditions and the record are build output (gitignored): no page renders the
+brand heroes yet, so they are not shipped. Run this before `next build` once
+getBrandHeroSources() has a consumer.
+
+Focal points live in scripts/hero_manifest.json as "focus": [x, y] (0–1 of
+width/height). --detect-focus fills in missing ones from edge density.
+
+Usage:
+  python3 scripts/build_hero_renditions.py
+  python3 scripts/build_hero_renditions.py --detect-focus
+  python3 scripts/build_hero_renditions.py --only audi --force
+"""
+
+import argparse
+import hashlib
+import io
+import json
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import build_hero_images as heroes
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+RENDITIONS_DIR = heroes.HERO_DIR / "renditions"
+RECORD         = heroes.RENDITIONS_RECORD
+WORKERS        = 4
+
+# name → (aspect w/h, widths, byte budget at the largest width, media query)
+BREAKPOINTS = {
+    "mobile":  (3 / 4,   (360, 720),   45_000,  "(max-width: 767px)"),
+    "tablet":  (16 / 10, (768, 1280),  90_000,  "(max-width: 1279px)"),
+    "desktop": (21 / 9,  (1440, 1920), 160_000, "(min-width: 1280px)"),
+}
+FORMATS   = ("avif", "webp")
+QUALITY   = (25, 85)   # search range; lowest is used when even it overshoots
+SEARCH_STEPS = 5
+
+PIL_FORMATS = {"avif": "AVIF", "webp": "WEBP"}
+
+
+def settings_key() -> str:
+    """Changes whenever output-affecting settings do, invalidating the record."""
+    return hashlib.sha256(json.dumps([BREAKPOINTS, FORMATS, QUALITY, SEARCH_STEPS]).encode()).hexdigest()[:12]
+
+
+# ── Cropping / encoding ──────────────────────────────────────────────────────
+
+def crop_box(size: "tuple[int, int]", aspect: float, focus: "tuple[float, float]") -> "tuple[int, int, int, int]":
+    """Largest box of the given aspect inside size, centred on focus as far as it fits."""
+    width, height = size
+    if width / height > aspect:
+        box_w, box_h = round(height * aspect), height
+    else:
+        box_w, box_h = width, round(width / aspect)
+    left = min(max(round(focus[0] * width - box_w / 2), 0), width - box_w)
+    top = min(max(round(focus[1] * height - box_h / 2), 0), height - box_h)
+    return left, top, left + box_w, top + box_h
+
+
+def encode_under(img: "Image.Image", fmt: str, budget: int) -> "tuple[bytes, int]":
+    """Highest quality whose encoding fits budget (binary search). Returns (bytes, quality)."""
+    def encode(quality):
+        buf = io.BytesIO()
+        img.save(buf, PIL_FORMATS[fmt], quality=quality)
+        return buf.getvalue()
+
+    low, high = QUALITY
+    best = None
+    for _ in range(SEARCH_STEPS):
+        if low > high:
+            break
+        mid = (low + high) // 2
+        data = encode(mid)
+        if len(data) <= budget:
+            best, low = (data, mid), mid + 1
+        else:
+            high = mid - 1
+    return best or (encode(QUALITY[0]), QUALITY[0])
+
+
+def detect_focus(path: Path) -> "list[float]":
+    """Centroid of edge energy on a downscaled copy: usually lands on the car."""
+    import numpy as np
+    from PIL import Image, ImageFilter
+
+    img = Image.open(path).convert("L")
+    img.thumbnail((256, 256))
+    edges = np.asarray(img.filter(ImageFilter.FIND_EDGES), dtype=np.float64)
+    edges[:2, :] = edges[-2:, :] = 0
+    edges[:, :2] = edges[:, -2:] = 0
+    total = edges.sum()
+    if total == 0:
+        return [0.5, 0.5]
+    ys, xs = np.indices(edges.shape)
+    return [round(float((xs * edges).sum() / total / edges.shape[1]), 2),
+            round(float((ys * edges).sum() / total / edges.shape[0]), 2)]
+
+
+def render_brand(slug: str, source: Path, focus: "list[float]", formats: "tuple[str, ...]") -> dict:
+    """All renditions for one hero. Returns its record entry."""
+    from PIL import Image
+
+    img = Image.open(source)
+    img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+    RENDITIONS_DIR.mkdir(parents=True, exist_ok=True)
+
+    breakpoints = {}
+    for name, (aspect, widths, budget, media) in BREAKPOINTS.items():
+        cropped = img.crop(crop_box(img.size, aspect, focus))
+        outputs = []
+        for width in widths:
+            width = min(width, cropped.width)  # never upscale
+            if any(o["width"] == width for o in outputs):
+                continue
+            height = round(width / aspect)
+            scaled = cropped.resize((width, height), Image.LANCZOS)
+            area_budget = int(budget * (width * height) / (widths[-1] * round(widths[-1] / aspect)))
+            files = {}
+            for fmt in formats:
+                data, quality = encode_under(scaled, fmt, area_budget)
+                out = RENDITIONS_DIR / f"{slug}-{name}-{width}.{fmt}"
+                out.write_bytes(data)
+                files[fmt] = {"file": out.name, "bytes": len(data), "quality": quality}
+            outputs.append({"width": width, "height": height, "files": files})
+        breakpoints[name] = {"media": media, "outputs": outputs}
+
+    return {
+        "source": source.name,
+        "sha256": hashlib.sha256(source.read_bytes()).hexdigest(),
+        "focus": focus,
+        "settings": settings_key(),
+        "breakpoints": breakpoints,
+    }
+
+
+def _is_current(entry: "dict | None", source: Path, focus: list) -> bool:
+    if not entry or entry.get("source") != source.name or entry.get("focus") != focus:
+        return False
+    if entry.get("settings") != settings_key():
+        return False
+    if entry.get("sha256") != hashlib.sha256(source.read_bytes()).hexdigest():
+        return False
+    return all(
+        (RENDITIONS_DIR / f["file"]).exists()
+        for bp in entry["breakpoints"].values() for o in bp["outputs"] for f in o["files"].values()
+    )
+
+
+def load_record() -> dict:
+    return json.loads(RECORD.read_text()) if RECORD.exists() else {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build breakpoint hero renditions and srcset mapping")
+    parser.add_argument("--only", action="append", metavar="SLUG", help="Limit to these brand slugs")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if up to date")
+    parser.add_argument("--detect-focus", action="store_true",
+                        help="Write an edge-density focal point into the manifest for brands without one")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    args = parser.parse_args()
+    from PIL import features
+
+    manifest = json.loads(heroes.MANIFEST.read_text())
+    brands = manifest["brands"]
+    formats = tuple(f for f in FORMATS if features.check(f))
+    if formats != FORMATS:
+        print(f"  WARN: Pillow lacks {sorted(set(FORMATS) - set(formats))} support; skipping those formats")
+
+    sources = {}
+    for slug in brands:
+        files = heroes.existing_files(slug)
+        if files and (not args.only or slug in args.only):
+            sources[slug] = files[0]
+
+    if args.detect_focus:
+        detected = 0
+        for slug, path in sources.items():
+            if "focus" not in brands[slug]:
+                brands[slug]["focus"] = detect_focus(path)
+                detected += 1
+        heroes.MANIFEST.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n")
+        print(f"  Focal points detected: {detected}")
+
+    record = load_record()
+    todo = {
+        slug: path for slug, path in sources.items()
+        if args.force or not _is_current(record.get(slug), path, brands[slug].get("focus", [0.5, 0.5]))
+    }
+    print(f"  Heroes: {len(sources)}  To build: {len(todo)}  Formats: {', '.join(formats)}")
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = {
+            slug: pool.submit(render_brand, slug, path, brands[slug].get("focus", [0.5, 0.5]), formats)
+            for slug, path in todo.items()
+        }
+        for slug, future in futures.items():
+            entry = record[slug] = future.result()
+            original = sources[slug].stat().st_size
+            mobile = entry["breakpoints"]["mobile"]["outputs"][-1]["files"]
+            smallest = min(f["bytes"] for f in mobile.values())
+            print(f"  {slug:<16} {original // 1024:>5} KB → mobile {smallest // 1024} KB "
+                  f"({original / max(smallest, 1):.0f}x smaller)")
+
+    # Drop renditions for brands whose hero disappeared
+    for slug in [s for s in record if s not in brands or not heroes.existing_files(s)]:
+        del record[slug]
+    RECORD.write_text(json.dumps(dict(sorted(record.items())), indent=2) + "\n")
+    # drop renditions no longer in the record (removed brands, old widths/settings)
+    keep = {f["file"] for entry in record.values() for bp in entry["breakpoints"].values()
+            for o in bp["outputs"] for f in o["files"].values()}
+    if RENDITIONS_DIR.exists():
+        for stale in RENDITIONS_DIR.iterdir():
+            if stale.name not in keep:
+                stale.unlink()
+
+    heroes.write_mapping(brands)
+    print(f"  Record:  {RECORD.relative_to(heroes.PROJECT_ROOT)}")
+    print(f"  Mapping: {heroes.TS_OUTPUT.relative_to(heroes.PROJECT_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
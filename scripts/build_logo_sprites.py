@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+build_logo_sprites.py
+
+Packs the raster brand logos the site's brand grids show into one sprite sheet
+per segment and size tier, so a brand grid costs one image request instead of
+one per logo.
+
+Which logos go on which sheet is read from the code that renders them
+(SHEET_GROUPS): BRAND_LOGOS in lib/data/brand-logos.ts for cars, and the
+twoWheelerBrands / threeWheelerModels lists in app/welcome-client-v2.tsx for
+bikes and autos. Logos nothing renders are not packed.
+
+Per logo: white background removed (same flood fill as
+public/assets/logos/remove_bg.py, done in memory — sources are not touched),
+trimmed to its visible box, scaled to the tier height. Cells are shelf-packed
+into ATLAS_WIDTH-wide WebP sheets, split into pages at MAX_ATLAS_HEIGHT.
+
+Outputs:
+  public/assets/logos/sprites/logos-{tier}-{segment}-{page}.{hash}.webp
+  lib/data/generated/logo-sprites.json        runtime coordinate map, keyed by
+                                              the logo's public path (read by
+                                              getBrandLogoSprite in
+                                              lib/utils/brand-logos.ts)
+
+Incremental: source hashes and sheet membership are kept in
+scripts/.logo_sprites_state.json. When nothing changed the run writes nothing;
+otherwise only new/changed logos are decoded (prepared cells are kept
+losslessly in scripts/.logo_cells/) and the sheets repacked.
+SVG logos are left alone (already small, and scale freely).
+
+Usage:
+  python3 scripts/build_logo_sprites.py
+  python3 scripts/build_logo_sprites.py --force
+"""
+
+import argparse
+import functools
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PUBLIC_DIR   = PROJECT_ROOT / "public"
+SPRITE_DIR   = PUBLIC_DIR / "assets" / "logos" / "sprites"
+MAP_OUTPUT   = PROJECT_ROOT / "lib" / "data" / "generated" / "logo-sprites.json"
+STATE_JSON   = Path(__file__).parent / ".logo_sprites_state.json"
+CELL_CACHE   = Path(__file__).parent / ".logo_cells"
+EXTENSIONS   = (".png", ".jpg", ".jpeg", ".webp")
+WORKERS      = os.cpu_count() or 4
+
+# segment → (file, declaration) whose logo paths share a sheet
+SHEET_GROUPS = {
+    "4w": [(PROJECT_ROOT / "lib" / "data" / "brand-logos.ts", "BRAND_LOGOS")],
+    "2w": [(PROJECT_ROOT / "app" / "welcome-client-v2.tsx", "twoWheelerBrands")],
+    "3w": [(PROJECT_ROOT / "app" / "welcome-client-v2.tsx", "threeWheelerModels")],
+}
+LOGO_PATH = re.compile(r"""["'](/(?:assets/logos|data/brand-logos)/[^"']+)["']""")
+
+# tier → display height in CSS px; sheets are drawn at DENSITY× for retina.
+# The brand tiles cap logos at 48px (max-h-12).
+TIERS   = {"md": 48}
+DENSITY = 2
+MAX_ASPECT = 4          # wider wordmarks are scaled down to fit H*MAX_ASPECT
+PADDING    = 2          # px between cells (stops bleed when scaled); multiple of DENSITY
+ATLAS_WIDTH      = 2048
+MAX_ATLAS_HEIGHT = 2048
+WEBP_QUALITY     = 85
+
+
+@functools.cache
+def _remove_bg():
+    """public/assets/logos/remove_bg.py, loaded on first use."""
+    spec = importlib.util.spec_from_file_location("remove_bg", PUBLIC_DIR / "assets" / "logos" / "remove_bg.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def settings_key() -> str:
+    remove_bg = _remove_bg()
+    return hashlib.sha256(json.dumps([TIERS, DENSITY, MAX_ASPECT, PADDING, ATLAS_WIDTH,
+                                      MAX_ATLAS_HEIGHT, WEBP_QUALITY, remove_bg.TOLERANCE]).encode()).hexdigest()[:12]
+
+
+def declared_block(text: str, name: str) -> str:
+    """Source of the object/array literal assigned to name (brackets balanced)."""
+    match = re.search(rf"\b{re.escape(name)}\b[^=]*=\s*", text)
+    if not match:
+        raise ValueError(f"{name} not found")
+    depth = 0
+    for i in range(match.end(), len(text)):
+        if text[i] in "[{":
+            depth += 1
+        elif text[i] in "]}":
+            depth -= 1
+            if depth == 0:
+                return text[match.end():i + 1]
+    raise ValueError(f"{name}: unbalanced literal")
+
+
+def list_logos() -> "dict[str, tuple[str, Path]]":
+    """
+    Public path ('/assets/logos/audi.png') → (segment, file) for every raster
+    logo SHEET_GROUPS renders. A logo listed by two segments goes on the first.
+    """
+    logos = {}
+    for segment, declarations in SHEET_GROUPS.items():
+        for source, name in declarations:
+            for key in LOGO_PATH.findall(declared_block(source.read_text(), name)):
+                path = PUBLIC_DIR / key.lstrip("/")
+                if key in logos or path.suffix.lower() not in EXTENSIONS:
+                    continue
+                if not path.is_file():
+                    print(f"  WARN: {key} (from {source.name}) does not exist")
+                    continue
+                logos[key] = (segment, path)
+    return logos
+
+
+# ── Per-logo preparation ─────────────────────────────────────────────────────
+
+def prepare(path: Path, heights: "dict[str, int]") -> "dict[str, bytes]":
+    """Background-removed, trimmed logo scaled per tier. Returns {tier: PNG bytes}."""
+    import numpy as np
+    from PIL import Image
+
+    remove_bg = _remove_bg()
+    img = Image.open(path)
+    img = img.convert("RGBA")
+    # Flood fill works on a working copy no bigger than needed for the largest tier
+    work = max(heights.values()) * MAX_ASPECT * 2
+    img.thumbnail((work, work), Image.LANCZOS)
+
+    arr = np.asarray(img)
+    corners = [arr[0, 0], arr[0, -1], arr[-1, 0], arr[-1, -1]]
+    if not any(c[3] < 10 for c in corners) and remove_bg.is_white_corner(arr):
+        img = remove_bg.flood_fill_transparent(img, remove_bg.TOLERANCE)
+
+    box = img.getchannel("A").point(lambda a: 255 if a > 8 else 0).getbbox()
+    if box:
+        img = img.crop(box)
+
+    cells = {}
+    for tier, height in heights.items():
+        cell = img.copy()
+        cell.thumbnail((height * MAX_ASPECT, height), Image.LANCZOS)
+        buf = io.BytesIO()
+        cell.save(buf, "PNG")
+        cells[tier] = buf.getvalue()
+    return cells
+
+
+def _prepare_job(job) -> "tuple[str, dict | None, str]":
+    key, path, heights = job
+    try:
+        return key, prepare(Path(path), heights), ""
+    except Exception as e:
+        return key, None, str(e)
+
+
+# ── Packing ──────────────────────────────────────────────────────────────────
+
+def snap(value: int) -> int:
+    """Round up to a multiple of DENSITY so every CSS coordinate is a whole pixel."""
+    return -(-value // DENSITY) * DENSITY
+
+
+def pack(sizes: "dict[str, tuple[int, int]]") -> "dict[str, tuple[int, int, int]]":
+    """
+    Shelf packing, widest first. Every cell in a tier has nearly the same height,
+    so shelves waste little. Returns key → (page, x, y).
+    """
+    order = sorted(sizes, key=lambda k: (-sizes[k][0], k))
+    placed = {}
+    page, shelf_y, shelf_h, cursor_x = 0, 0, 0, 0
+    for key in order:
+        w, h = map(snap, sizes[key])
+        if cursor_x + w > ATLAS_WIDTH:
+            shelf_y, cursor_x, shelf_h = shelf_y + shelf_h + PADDING, 0, 0
+        if shelf_y + h > MAX_ATLAS_HEIGHT:
+            page, shelf_y, cursor_x, shelf_h = page + 1, 0, 0, 0
+        placed[key] = (page, cursor_x, shelf_y)
+        cursor_x += w + PADDING
+        shelf_h = max(shelf_h, h)
+    return placed
+
+
+def render_sheets(cells: "dict[str, Image.Image]", placed: dict) -> "list[Image.Image]":
+    from PIL import Image
+
+    pages = max((p for p, _, _ in placed.values()), default=-1) + 1
+    sheets = []
+    for page in range(pages):
+        members = [k for k, (p, _, _) in placed.items() if p == page]
+        width = max(placed[k][1] + snap(cells[k].width) for k in members)
+        height = max(placed[k][2] + snap(cells[k].height) for k in members)
+        sheet = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        for key in members:
+            _, x, y = placed[key]
+            sheet.paste(cells[key], (x, y))
+        sheets.append(sheet)
+    return sheets
+
+
+# ── Outputs ──────────────────────────────────────────────────────────────────
+
+def write_sheet(tier: str, segment: str, page: int, sheet: "Image.Image") -> str:
+    buf = io.BytesIO()
+    sheet.save(buf, "WEBP", quality=WEBP_QUALITY, method=4)
+    data = buf.getvalue()
+    name = f"logos-{tier}-{segment}-{page}.{hashlib.sha256(data).hexdigest()[:10]}.webp"
+    SPRITE_DIR.mkdir(parents=True, exist_ok=True)
+    (SPRITE_DIR / name).write_bytes(data)
+    return f"/assets/logos/sprites/{name}"
+
+
+def cell_path(sha: str, tier: str) -> Path:
+    return CELL_CACHE / f"{sha}-{tier}-{TIERS[tier]}x{DENSITY}.png"
+
+
+def build(force: bool = False, workers: int = WORKERS):
+    from PIL import Image
+
+    logos = list_logos()
+    hashes = {key: hashlib.sha256(path.read_bytes()).hexdigest()[:16] for key, (_, path) in logos.items()}
+    segments = {key: segment for key, (segment, _) in logos.items()}
+
+    state = json.loads(STATE_JSON.read_text()) if STATE_JSON.exists() else {}
+    previous = json.loads(MAP_OUTPUT.read_text()) if MAP_OUTPUT.exists() else {}
+    up_to_date = (
+        state.get("settings") == settings_key()
+        and state.get("sources") == hashes
+        and state.get("segments") == segments
+        and list(previous.get("tiers", {})) == list(TIERS)
+        and all((PUBLIC_DIR / url.lstrip("/")).exists()
+                for entry in previous["tiers"].values() for url in entry["sheets"])
+    )
+    if up_to_date and not force:
+        print(f"  Logos: {len(logos)}  Sprite sheets up to date")
+        return
+
+    to_decode = [k for k in logos if force or not all(cell_path(hashes[k], t).exists() for t in TIERS)]
+    print(f"  Logos: {len(logos)}  To decode: {len(to_decode)}  Cached cells: {len(logos) - len(to_decode)}")
+
+    failed = set()
+    CELL_CACHE.mkdir(parents=True, exist_ok=True)
+    heights = {tier: height * DENSITY for tier, height in TIERS.items()}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        jobs = [(k, str(logos[k][1]), heights) for k in to_decode]
+        for key, cells, error in pool.map(_prepare_job, jobs, chunksize=8):
+            if cells is None:
+                failed.add(key)
+                print(f"  WARN: {key}: {error}")
+                continue
+            for tier, data in cells.items():
+                cell_path(hashes[key], tier).write_bytes(data)
+
+    keys = [k for k in logos if k not in failed]
+    sprite_map = {"density": DENSITY, "tiers": {}}
+    for tier in TIERS:
+        entry = sprite_map["tiers"][tier] = {"sheets": [], "sheetSizes": [], "logos": {}}
+        for segment in SHEET_GROUPS:
+            members = [k for k in keys if segments[k] == segment]
+            if not members:
+                continue
+            cells = {k: Image.open(cell_path(hashes[k], tier)) for k in members}
+            placed = pack({k: c.size for k, c in cells.items()})
+            sheets = render_sheets(cells, placed)
+            first = len(entry["sheets"])
+            urls = [write_sheet(tier, segment, page, sheet) for page, sheet in enumerate(sheets)]
+            entry["sheets"] += urls
+            entry["sheetSizes"] += [list(s.size) for s in sheets]
+            entry["logos"].update({
+                k: {"sheet": first + placed[k][0], "x": placed[k][1], "y": placed[k][2],
+                    "w": snap(cells[k].width), "h": snap(cells[k].height)}
+                for k in sorted(placed)
+            })
+            total = sum((SPRITE_DIR / u.rsplit("/", 1)[1]).stat().st_size for u in urls)
+            print(f"  {tier}/{segment}: {len(placed)} logos → {len(urls)} sheet(s), {total // 1024} KB")
+        entry["logos"] = dict(sorted(entry["logos"].items()))
+
+    MAP_OUTPUT.parent.mkdir(parents=True, exist_ok=True)
+    MAP_OUTPUT.write_text(json.dumps(sprite_map, indent=1) + "\n")
+    STATE_JSON.write_text(json.dumps({
+        "settings": settings_key(),
+        "sources": {k: hashes[k] for k in keys},
+        "segments": {k: segments[k] for k in keys},
+    }, indent=1) + "\n")
+
+    live = {url.rsplit("/", 1)[1] for entry in sprite_map["tiers"].values() for url in entry["sheets"]}
+    for old in SPRITE_DIR.glob("logos-*.webp"):
+        if old.name not in live:
+            old.unlink()
+    wanted = {cell_path(hashes[k], t).name for k in keys for t in TIERS}
+    for old in CELL_CACHE.glob("*.png"):
+        if old.name not in wanted:
+            old.unlink()
+    print(f"  Map: {MAP_OUTPUT.relative_to(PROJECT_ROOT)}  State: {STATE_JSON.relative_to(PROJECT_ROOT)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack brand logos into tiered sprite sheets")
+    parser.add_argument("--force", action="store_true", help="Decode and repack everything")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    args = parser.parse_args()
+    build(force=args.force, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
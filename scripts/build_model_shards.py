@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+build_model_shards.py
+
+Splits the 4W brand JSON files (mahindra.json alone is ~750 KB) into one
+minified shard per model holding only the fields the model page reads, so
+a model page transfers a few KB instead of the whole brand file.
+
+Variants come out of each brand file through extract_items, so every brand
+shape the migration understands is handled. Nested spec objects
+(engine_specs, engine_performance, powertrain, powertrain_details) are
+flattened the way lib/data/car-detail.ts flattens them, then only
+RENDERED_FIELDS are kept.
+
+  public/data/model-shards/{brand}/{model-slug}.{hash}.json   minified
+  public/data/model-shards/manifest.json   {brand: {model-slug: "brand/file.json"}}
+
+The hash is over the shard content, so shard URLs can be cached as
+immutable; only manifest.json needs revalidating. Vercel compresses static
+files itself, so no precompressed siblings are written. Variants without a
+model name (Isuzu, Force, …) are left to the brand file, which the site
+still falls back to.
+
+The site reads a shard whenever the manifest lists one, so shards must be
+rebuilt whenever a brand file changes. --check (run in CI) rebuilds them in
+memory and fails if the manifest or any shard differs from what is on disk.
+
+Usage:
+  python3 scripts/build_model_shards.py
+  python3 scripts/build_model_shards.py --only mahindra tata
+  python3 scripts/build_model_shards.py --check
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+from media_tools.slugs import model_to_slug
+from migrate_car_images_to_supabase import DATA_DIR, SKIP_FILES, extract_items
+
+OUTPUT_DIR    = DATA_DIR / "model-shards"
+MANIFEST_FILE = OUTPUT_DIR / "manifest.json"
+HASH_LENGTH   = 10
+
+# Flattened into the variant, as flattenBrandVariants does (existing keys win)
+NESTED_SPECS = ("engine_specs", "engine_performance", "powertrain", "powertrain_details")
+
+# Every variant field lib/data/car-detail.ts and four-wheelers.ts read
+RENDERED_FIELDS = (
+    "model", "model_name", "variant_name", "variant", "trim",
+    "ex_showroom_price_min_inr", "ex_showroom_price_min", "ex_showroom_min",
+    "ex_showroom_price_max_inr", "ex_showroom_price_max", "ex_showroom_max",
+    "ex_showroom_price_range", "ex_showroom_price", "pricing",
+    "hyderabad_on_road_price_inr", "hyderabad_on_road_price",
+    "fuel_type", "fuel", "transmission",
+    "engine_displacement_cc", "engine_displacement", "displacement",
+    "power", "power_bhp", "torque", "torque_nm",
+    "mileage_range", "mileage_kmpl_or_ev_range", "mileage", "mileage_kmpl",
+    "seating_capacity", "boot_capacity", "dimensions",
+    "key_features", "safety_features", "features",
+    "colors", "colour_options", "color_options", "available_colors", "available_colours",
+    "image_urls", "model_citation", "source_url",
+)
+
+
+def slim_variant(item: dict) -> dict:
+    """The variant as the storefront sees it: nested specs flattened, unread fields dropped."""
+    flat = dict(item)
+    for key in NESTED_SPECS:
+        sub = item.get(key)
+        if isinstance(sub, dict):
+            for name, value in sub.items():
+                if flat.get(name) is None:
+                    flat[name] = value
+    return {k: flat[k] for k in RENDERED_FIELDS if flat.get(k) not in (None, "", [], {})}
+
+
+def model_shards(items) -> "dict[str, dict]":
+    """{model slug: {"model": name, "variants": [...]}} in file order."""
+    shards = {}
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        model = str(item.get("model") or item.get("model_name") or "").strip()
+        slug = model_to_slug(model)
+        if not slug:
+            continue
+        shard = shards.setdefault(slug, {"model": model, "variants": []})
+        shard["variants"].append(slim_variant(item))
+    return shards
+
+
+def _minify(data) -> bytes:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def shard_name(slug: str, body: bytes) -> str:
+    return f"{slug}.{hashlib.sha256(body).hexdigest()[:HASH_LENGTH]}.json"
+
+
+def brand_shards(fpath: Path) -> "dict[str, tuple[str, bytes]]":
+    """{model slug: (shard path relative to OUTPUT_DIR, minified body)} for one brand file."""
+    shards = model_shards(extract_items(fpath.name, json.loads(fpath.read_text())))
+    bodies = {slug: _minify(shard) for slug, shard in shards.items()}
+    return {slug: (f"{fpath.stem}/{shard_name(slug, body)}", body) for slug, body in bodies.items()}
+
+
+def check() -> "list[str]":
+    """Brands whose manifest entry or shard files don't match their brand file."""
+    manifest = json.loads(MANIFEST_FILE.read_text()) if MANIFEST_FILE.exists() else {}
+    stale, seen = [], set()
+    for fpath in sorted(DATA_DIR.glob("*.json")):
+        if fpath.name in SKIP_FILES:
+            continue
+        seen.add(fpath.stem)
+        try:
+            shards = brand_shards(fpath)
+        except Exception as e:
+            print(f"  WARN: could not parse {fpath.name}: {e}")
+            stale.append(fpath.stem)
+            continue
+        expected = {slug: path for slug, (path, _) in shards.items()} or None  # build() omits empty brands
+        if manifest.get(fpath.stem) != expected or not all(
+                (OUTPUT_DIR / path).exists() for path in (expected or {}).values()):
+            stale.append(fpath.stem)
+    return stale + sorted(manifest.keys() - seen)
+
+
+def build(only=None):
+    manifest = json.loads(MANIFEST_FILE.read_text()) if only and MANIFEST_FILE.exists() else {}
+    totals = {"brands": 0, "models": 0, "raw": 0, "gz": 0}
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    for fpath in sorted(DATA_DIR.glob("*.json")):
+        brand = fpath.stem
+        if fpath.name in SKIP_FILES or (only and brand not in only):
+            continue
+        try:
+            shards = brand_shards(fpath)
+        except Exception as e:
+            print(f"  WARN: could not parse {fpath.name}: {e}")
+            continue
+        if not shards:
+            continue
+
+        brand_dir = OUTPUT_DIR / brand
+        brand_dir.mkdir(parents=True, exist_ok=True)
+        entries = {}
+        largest = 0
+        for slug, (path, body) in shards.items():
+            target = OUTPUT_DIR / path
+            if not target.exists():  # content-addressed: an existing file is already right
+                target.write_bytes(body)
+            entries[slug] = path
+            largest = max(largest, len(body))
+            totals["raw"] += len(body)
+            totals["gz"] += len(gzip.compress(body, 9, mtime=0))
+
+        # drop shards no longer referenced
+        keep = {Path(f).name for f in entries.values()}
+        for stale in brand_dir.iterdir():
+            if stale.name not in keep:
+                stale.unlink()
+
+        manifest[brand] = dict(sorted(entries.items()))
+        totals["brands"] += 1
+        totals["models"] += len(entries)
+        print(f"  {fpath.name}: {len(entries)} models, {fpath.stat().st_size // 1024} KB → "
+              f"largest shard {largest / 1024:.1f} KB")
+
+    for stale in OUTPUT_DIR.iterdir():
+        if stale.is_dir() and stale.name not in manifest:
+            for f in stale.iterdir():
+                f.unlink()
+            stale.rmdir()
+    MANIFEST_FILE.write_text(json.dumps(dict(sorted(manifest.items())), separators=(",", ":")) + "\n")
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Minified per-model shards of the 4W brand files")
+    parser.add_argument("--only", nargs="+", metavar="BRAND", help="Brand file stems to rebuild (e.g. mahindra)")
+    parser.add_argument("--check", action="store_true",
+                        help="Exit non-zero if any shard is out of date with its brand file (for CI)")
+    args = parser.parse_args()
+
+    if args.check:
+        stale = check()
+        if stale:
+            raise SystemExit(f"  Model shards out of date for: {', '.join(stale)}\n"
+                             "  Run python3 scripts/build_model_shards.py and commit the result.")
+        print("  Model shards are up to date")
+        return
+
+    totals = build(set(args.only) if args.only else None)
+    models = max(totals["models"], 1)
+    print(f"  Brands: {totals['brands']}  Models: {totals['models']}")
+    print(f"  Avg shard: {totals['raw'] / models / 1024:.1f} KB raw, {totals['gz'] / models / 1024:.1f} KB gzip")
+    print(f"  Manifest: {MANIFEST_FILE.relative_to(DATA_DIR.parent.parent)}")
+
+
+if __name__ == "__main__":
+    main()
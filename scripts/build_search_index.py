@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+build_search_index.py
+
+Precomputes a typo-tolerant typeahead index over every brand, model and
+variant in the catalog, so search never scans raw data:
+
+  CAR_DATA.tsv + public/data/*.json (4W brand files)   category "4w"
+  public/data/2w/*.json                                 category "2w"
+  public/data/4w-auto/*.json                            category "4w-auto"
+
+Output is one JSON file the site loads once (public/data/search-index.json):
+
+  docs       columnar: kind (0 brand / 1 model / 2 variant), name, brand and
+             model doc ids, category, slug, min price, price band, popularity
+  tokens     sorted unique tokens; a prefix is a binary-search range
+  postings   doc ids per token, ascending; docs are numbered by static rank
+             (brands, then models, then variants, each by popularity), so
+             the lowest ids in a posting list are the best results
+  trigrams   trigram → token ids, for tokens a typo kept out of the prefix range
+             (swapped adjacent letters are looked up as prefixes instead,
+             since a swap can break every trigram of a short word)
+
+Docs carry their brand and model tokens, so "tata nex" finds Nexon, plus
+aliases from the slug rules the site uses (to_slug_ts / model_to_slug):
+"XUV 3XO" is also "xuv3xo", "Mercedes-Benz" also "mercedesbenz".
+
+Popularity is a static 0–100 percentile within the category: models with
+more variants, listed by more sources, rank higher (the catalog has no
+traffic data offline). Price bands split INR at BAND_EDGES.
+
+search() below is the reference query; lib/utils/catalog-search.ts runs
+the same algorithm in the browser.
+
+Usage:
+  python3 scripts/build_search_index.py
+  python3 scripts/build_search_index.py --query "nexn ev" --query "royal enf"
+"""
+
+import argparse
+import bisect
+import csv
+import json
+import math
+import re
+import time
+import unicodedata
+from pathlib import Path
+
+from build_spec_store import parse_price
+from media_tools.slugs import model_to_slug, to_slug_ts
+from migrate_car_images_to_supabase import SKIP_FILES, extract_items
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR     = PROJECT_ROOT / "public" / "data"
+CAR_DATA_TSV = PROJECT_ROOT / "CAR_DATA.tsv"
+OUTPUT_JSON  = DATA_DIR / "search-index.json"
+
+CATEGORIES = ("4w", "2w", "4w-auto")
+BRAND, MODEL, VARIANT = 0, 1, 2
+BAND_EDGES = (1e5, 2.5e5, 5e5, 1e6, 2e6, 5e6, 1e7)  # INR: <1L, 1–2.5L, …, ≥1Cr
+
+# Same brand under different names across sources → one brand key
+BRAND_ALIASES = {
+    "mercedes": "mercedes-benz",
+    "force": "force-motors",
+    "tata-motors": "tata",
+}
+# 4W brand files without a "make" field on their variants
+FILE_BRANDS = {"maruti_suzuki": "Maruti Suzuki", "land_rover": "Land Rover", "rolls_royce": "Rolls-Royce",
+               "aston_martin": "Aston Martin", "mg": "MG", "bmw": "BMW", "byd": "BYD"}
+
+# Ranking: per query token, how it matched; plus a boost per doc kind so
+# "tata" lists the brand before its 200 variants
+MATCH_EXACT, MATCH_PREFIX, MATCH_FUZZY = 3.0, 2.0, 1.0
+KIND_BOOST  = {BRAND: 0.6, MODEL: 0.4, VARIANT: 0.0}
+FUZZY_MIN   = 4      # shorter query tokens only match by prefix
+MAX_RESULTS = 10
+
+
+# ── Tokens ────────────────────────────────────────────────────────────────────
+
+def fold(text: str) -> str:
+    """Lower-case ASCII ('Citroën' → 'citroen')."""
+    return unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode().lower()
+
+
+def tokenize(text: str) -> "list[str]":
+    return re.findall(r"[a-z0-9]+", fold(text))
+
+
+def aliases(name: str) -> "set[str]":
+    """Joined forms of a name under the site's slug rules ('XUV 3XO' → 'xuv3xo')."""
+    folded = fold(name)
+    return {s.replace("-", "") for s in (to_slug_ts(folded), model_to_slug(folded)) if "-" in s}
+
+
+def trigrams(token: str) -> "list[str]":
+    return [token[i:i + 3] for i in range(len(token) - 2)]
+
+
+def brand_key(name: str) -> str:
+    key = model_to_slug(fold(name))
+    return BRAND_ALIASES.get(key, key)
+
+
+# ── Sources ───────────────────────────────────────────────────────────────────
+
+def min_price(item: dict) -> "float | None":
+    """Lowest ex-showroom price of a record, whichever field shape it uses."""
+    pricing = item.get("pricing")
+    nested = pricing.get("ex_showroom") if isinstance(pricing, dict) else None
+    for value in (item.get("ex_showroom_price_min_inr"), item.get("ex_showroom_price_min"),
+                  nested, item.get("ex_showroom_price"), item.get("price")):
+        if isinstance(value, dict):
+            value = value.get("min")
+        if isinstance(value, (int, float)) and value > 0:
+            return float(value)
+        if isinstance(value, str) and re.search(r"\d", value):
+            parsed = parse_price(value)
+            if parsed == parsed and parsed > 0:  # not NaN
+                return parsed
+    return None
+
+
+def iter_records():
+    """(category, source, brand, model, variant, price) from every catalog source."""
+    with CAR_DATA_TSV.open(encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f, delimiter="\t"):
+            price = float(row["Price (INR)"]) if (row.get("Price (INR)") or "").isdigit() else None
+            yield "4w", "tsv", row["Brand"], row["Model"], row["Variant"], price
+
+    for fpath in sorted(DATA_DIR.glob("*.json")):
+        if fpath.name in SKIP_FILES:
+            continue
+        try:
+            items = extract_items(fpath.name, json.loads(fpath.read_text()))
+        except Exception as e:
+            print(f"  WARN: could not parse {fpath.name}: {e}")
+            continue
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            model = item.get("model") or item.get("model_name")
+            if not model:
+                continue  # name-only variants (Maruti, Isuzu, …) come from CAR_DATA.tsv
+            brand = item.get("make") or FILE_BRANDS.get(fpath.stem) or fpath.stem.replace("_", " ").title()
+            yield "4w", fpath.stem, brand, str(model), str(item.get("variant_name") or item.get("variant") or ""), min_price(item)
+
+    for category in ("2w", "4w-auto"):
+        for fpath in sorted((DATA_DIR / category).glob("*.json")):
+            data = json.loads(fpath.read_text())
+            for vehicle in data.get("vehicles") or []:
+                brand = data.get("brand") or vehicle.get("make") or ""
+                name = str(vehicle.get("variant_name") or "")
+                # 4w-auto names are "Model Variant/Fuel"
+                model = str(vehicle.get("model") or name.split("/")[0])
+                price = min_price(vehicle) or min_price({"price": vehicle.get("ex_showroom_price")})
+                variants = [v.get("name") for v in vehicle.get("variants") or [] if v.get("name")]
+                for variant in variants or [name]:
+                    yield category, fpath.stem, brand, model, str(variant), price
+
+
+# ── Build ─────────────────────────────────────────────────────────────────────
+
+def _percentiles(values: "dict[object, float]") -> "dict[object, int]":
+    """Key → 0–100 percentile rank of its value (ties share the lower rank)."""
+    ordered = sorted(values.values())
+    top = max(len(ordered) - 1, 1)
+    return {key: round(100 * bisect.bisect_left(ordered, value) / top) for key, value in values.items()}
+
+
+def build_index() -> dict:
+    brands = {}    # (category, brand key) → {"name", "models": set}
+    models = {}    # (category, brand key, model slug) → {"name", "variants": {}, "sources": set, "price"}
+    for category, source, brand, model, variant, price in iter_records():
+        bkey, mslug = brand_key(brand), model_to_slug(fold(model))
+        if not bkey or not mslug:
+            continue
+        entry = brands.setdefault((category, bkey), {"name": brand, "models": set()})
+        entry["models"].add(mslug)
+        if source != "tsv":
+            entry["name"] = brand  # CAR_DATA.tsv title-cases brands ("Bmw", "Mg")
+        entry = models.setdefault((category, bkey, mslug),
+                                  {"name": model, "variants": {}, "sources": set(), "price": None})
+        entry["sources"].add(source)
+        variant = variant.strip()
+        if fold(variant).startswith(fold(model) + " "):
+            variant = variant[len(model):].strip()  # "Nexon Creative" → "Creative"
+        if variant and fold(variant) != fold(model):
+            previous = entry["variants"].get(fold(variant))
+            entry["variants"][fold(variant)] = (variant, price if previous is None else previous[1] or price)
+        if price and (entry["price"] is None or price < entry["price"]):
+            entry["price"] = price
+
+    # static popularity: more variants and more sources listing the model
+    raw = {key: math.log1p(len(m["variants"])) + len(m["sources"]) for key, m in models.items()}
+    model_pop = {}
+    for category in CATEGORIES:
+        model_pop.update(_percentiles({k: v for k, v in raw.items() if k[0] == category}))
+    brand_raw = {}
+    for (category, bkey, _), value in raw.items():
+        brand_raw[(category, bkey)] = brand_raw.get((category, bkey), 0.0) + value
+    brand_pop = {}
+    for category in CATEGORIES:
+        brand_pop.update(_percentiles({k: v for k, v in brand_raw.items() if k[0] == category}))
+
+    # docs in static rank order: kind, then popularity, then name
+    docs = []
+    for (category, bkey), b in brands.items():
+        prices = [m["price"] for (c, k, _), m in models.items() if c == category and k == bkey and m["price"]]
+        docs.append({"kind": BRAND, "name": b["name"], "key": (category, bkey), "category": category,
+                     "slug": bkey, "price": min(prices) if prices else None, "pop": brand_pop[(category, bkey)],
+                     "tokens": set(tokenize(b["name"])) | aliases(b["name"]) | set(tokenize(bkey))})
+    for key, m in models.items():
+        category, bkey, mslug = key
+        brand_tokens = set(tokenize(brands[(category, bkey)]["name"])) | aliases(brands[(category, bkey)]["name"])
+        model_tokens = set(tokenize(m["name"])) | aliases(m["name"])
+        docs.append({"kind": MODEL, "name": m["name"], "key": key, "brand_key": (category, bkey),
+                     "category": category, "slug": mslug, "price": m["price"], "pop": model_pop[key],
+                     "tokens": brand_tokens | model_tokens})
+        for variant, price in m["variants"].values():
+            docs.append({"kind": VARIANT, "name": variant, "model_key": key, "brand_key": (category, bkey),
+                         "category": category, "slug": mslug, "price": price, "pop": model_pop[key],
+                         "tokens": brand_tokens | model_tokens | set(tokenize(variant)) | aliases(variant)})
+    docs.sort(key=lambda d: (d["kind"], -d["pop"], fold(d["name"])))
+
+    ids = {d["key"]: i for i, d in enumerate(docs) if "key" in d}
+    postings = {}
+    for i, doc in enumerate(docs):
+        for token in doc["tokens"]:
+            postings.setdefault(token, []).append(i)
+    tokens = sorted(postings)
+    grams = {}
+    for t, token in enumerate(tokens):
+        for gram in set(trigrams(token)):
+            grams.setdefault(gram, []).append(t)
+
+    return {
+        "version": 1,
+        "categories": list(CATEGORIES),
+        "bandEdges": list(BAND_EDGES),
+        "docs": {
+            "kind": [d["kind"] for d in docs],
+            "name": [d["name"] for d in docs],
+            "brand": [ids[d["key"]] if d["kind"] == BRAND else ids[d["brand_key"]] for d in docs],
+            "model": [-1 if d["kind"] == BRAND else ids[d["key"]] if d["kind"] == MODEL else ids[d["model_key"]]
+                      for d in docs],
+            "category": [CATEGORIES.index(d["category"]) for d in docs],
+            "slug": [d["slug"] for d in docs],
+            "price": [round(d["price"]) if d["price"] else None for d in docs],
+            "band": [bisect.bisect_right(BAND_EDGES, d["price"]) if d["price"] else -1 for d in docs],
+            "popularity": [d["pop"] for d in docs],
+        },
+        "tokens": tokens,
+        "postings": [postings[t] for t in tokens],
+        "trigrams": dict(sorted(grams.items())),
+    }
+
+
+# ── Query ─────────────────────────────────────────────────────────────────────
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Optimal-string-alignment distance, abandoned once it must exceed limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if previous2 and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > limit:
+            return limit + 1
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def _prefix_range(tokens: "list[str]", term: str) -> range:
+    """Ids of the tokens starting with term (two binary searches)."""
+    return range(bisect.bisect_left(tokens, term), bisect.bisect_left(tokens, term + "\x7f"))
+
+
+def match_tokens(index: dict, term: str) -> "dict[int, float]":
+    """Token id → match quality for one query term: exact, prefix, else a close typo."""
+    tokens = index["tokens"]
+    matched = {t: MATCH_EXACT if tokens[t] == term else MATCH_PREFIX for t in _prefix_range(tokens, term)}
+    if matched or len(term) < FUZZY_MIN:
+        return matched
+
+    # an adjacent swap ("swfit") can break every trigram of a short word, so
+    # each swapped spelling is looked up as a prefix directly
+    for i in range(len(term) - 1):
+        if term[i] != term[i + 1]:
+            swapped = term[:i] + term[i + 1] + term[i] + term[i + 2:]
+            matched.update((t, MATCH_FUZZY) for t in _prefix_range(tokens, swapped))
+
+    limit = 1 if len(term) < 7 else 2
+    grams = trigrams(term)
+    shared = {}
+    for gram in grams:
+        for t in index["trigrams"].get(gram, ()):
+            shared[t] = shared.get(t, 0) + 1
+    # an insertion, deletion or substitution breaks at most three trigrams
+    floor = max(1, len(grams) - 3 * limit)
+    for t, count in shared.items():
+        if count < floor or t in matched:
+            continue
+        token = tokens[t]
+        # whole token, or the typed part of a longer one ("nexn" → "nexon")
+        if min(edit_distance(term, token, limit), edit_distance(term, token[:len(term) + 1], limit)) <= limit:
+            matched[t] = MATCH_FUZZY
+    return matched
+
+
+def search(index: dict, query: str, limit: int = MAX_RESULTS, category: "str | None" = None) -> "list[dict]":
+    """Docs matching every query term, best first."""
+    terms = tokenize(query)
+    if not terms:
+        return []
+    scores = None
+    for term in terms:
+        best = {}
+        for t, quality in match_tokens(index, term).items():
+            for doc in index["postings"][t]:
+                if quality > best.get(doc, 0.0):
+                    best[doc] = quality
+        scores = best if scores is None else {d: s + best[d] for d, s in scores.items() if d in best}
+        if not scores:
+            return []
+
+    docs = index["docs"]
+    wanted = index["categories"].index(category) if category else None
+    ranked = sorted(
+        (d for d in scores if wanted is None or docs["category"][d] == wanted),
+        key=lambda d: (-(scores[d] + KIND_BOOST[docs["kind"][d]] + docs["popularity"][d] / 100), d),
+    )
+    return [{
+        "kind": ("brand", "model", "variant")[docs["kind"][d]],
+        "name": docs["name"][d],
+        "brand": docs["name"][docs["brand"][d]],
+        "model": docs["name"][docs["model"][d]] if docs["model"][d] >= 0 else None,
+        "category": index["categories"][docs["category"][d]],
+        "slug": docs["slug"][d],
+        "price": docs["price"][d],
+        "band": docs["band"][d],
+    } for d in ranked[:limit]]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the typo-tolerant catalog search index")
+    parser.add_argument("--output", type=Path, default=OUTPUT_JSON)
+    parser.add_argument("--query", action="append", default=[], help="Run a query against the built index")
+    args = parser.parse_args()
+
+    if args.query:
+        index = json.loads(args.output.read_text())
+        for query in args.query:
+            start = time.perf_counter()
+            results = search(index, query)
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"  {query!r}: {len(results)} results in {elapsed:.2f} ms")
+            for r in results:
+                label = " ".join(dict.fromkeys(filter(None, (r["brand"], r["model"], r["name"]))))
+                price = f"  ₹{r['price']:,}" if r["price"] else ""
+                print(f"    [{r['kind']:<7}] {label} ({r['category']}){price}")
+        return
+
+    index = build_index()
+    args.output.write_text(json.dumps(index, separators=(",", ":"), ensure_ascii=False))
+    kinds = index["docs"]["kind"]
+    print(f"  Brands: {kinds.count(BRAND)}  Models: {kinds.count(MODEL)}  Variants: {kinds.count(VARIANT)}")
+    print(f"  Tokens: {len(index['tokens'])}  Trigrams: {len(index['trigrams'])}")
+    print(f"  Output: {args.output} ({args.output.stat().st_size // 1024} KB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+build_spec_store.py
+
+Parses the string-valued 2W and 3W catalog fields ("₹78,166", "₹2.07 Lakh",
+"109.51 cc", "47 kmpl", "8.25 kW", "48V 100 Ah") once, into typed NumPy
+columns with normalized units, and stores them as one columnar .npz per
+category with a sort index per numeric column. Price and mileage filters
+then become array operations instead of re-parsing strings per consumer.
+
+  public/data/spec-store/2w.npz   one row per vehicle in public/data/2w/*.json
+  public/data/spec-store/3w.npz   one row per vehicle in public/data/3w/*.json
+
+Arrays in each .npz:
+  brand, model, variant          str
+  fuel, transmission             int16 codes into fuel_vocab / transmission_vocab
+  <numeric column>               float64, NaN when missing or unparseable
+  order_<numeric column>         int32 row ids ascending by value (NaN last)
+  meta                           JSON: units per column, sources, row count
+
+Units: price INR, engine cc, power bhp (kW / W / PS converted), torque Nm,
+speed kmph, mileage kmpl or km/kg, range km, battery kWh (V × Ah when no
+kWh is given), weights kg. A value with an unexpected unit is dropped rather
+than guessed, and reported with the unparsed strings.
+
+Usage:
+  python3 scripts/build_spec_store.py
+  python3 scripts/build_spec_store.py --where price:50000:100000 --sort mileage_kmpl
+  python3 scripts/build_spec_store.py --category 3w --where range_km:150:
+"""
+
+import argparse
+import json
+import math
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from build_car_data_index import normalize_transmission as _car_transmission
+
+if TYPE_CHECKING:
+    import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+DATA_DIR     = PROJECT_ROOT / "public" / "data"
+OUTPUT_DIR   = DATA_DIR / "spec-store"
+CATEGORIES   = ("2w", "3w")
+
+MISSING = {"", "n/a", "na", "none", "-", "coming soon", "price coming soon", "not available"}
+
+# ── Parsers ───────────────────────────────────────────────────────────────────
+
+_PRICE    = re.compile(r"₹?\s*(\d[\d,]*(?:\.\d+)?)\s*(lakh|lac|crore|cr)?", re.I)
+# first number (a range "3-4" keeps its lower bound), then the unit right after it
+_QUANTITY = re.compile(r"(\d+(?:\.\d+)?)\s*(?:[-–]\s*\d+(?:\.\d+)?\s*)?\+?\s*([a-z/%]+)?", re.I)
+_KWH      = re.compile(r"(\d+(?:\.\d+)?)\s*kwh", re.I)
+_VOLT_AH  = re.compile(r"(\d+(?:\.\d+)?)\s*v\b.*?(\d+(?:\.\d+)?)\s*ah", re.I)
+_SEATS    = re.compile(r"driver\s*\+\s*(\d+)", re.I)
+
+PRICE_SCALE = {None: 1, "lakh": 1e5, "lac": 1e5, "crore": 1e7, "cr": 1e7}
+
+# unit token (lower-cased) → factor to the column's unit
+UNITS = {
+    "cc":    {"cc": 1},
+    "bhp":   {"bhp": 1, "hp": 1, "ps": 0.98632, "kw": 1.34102, "w": 0.00134102},
+    "nm":    {"nm": 1},
+    "kmph":  {"kmph": 1, "km/h": 1, "kmh": 1},
+    "kmpl":  {"kmpl": 1, "km/l": 1},
+    "km/kg": {"km/kg": 1},
+    "km":    {"km": 1},
+    "kg":    {"kg": 1},
+    "kwh":   {"kwh": 1},
+}
+
+
+def _missing(raw) -> bool:
+    """None, blank, "N/A" and unit-only placeholders such as "N/A cc"."""
+    if not isinstance(raw, str):
+        return raw is None
+    text = raw.strip().lower()
+    return text in MISSING or text.split(" ")[0] in MISSING
+
+
+def parse_price(raw) -> float:
+    """'₹78,166' → 78166.0, '₹2.07 Lakh' → 207000.0."""
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    match = _PRICE.search(raw)
+    if not match:
+        return math.nan
+    scale = PRICE_SCALE[match.group(2).lower() if match.group(2) else None]
+    return float(round(float(match.group(1).replace(",", "")) * scale))
+
+
+def quantity_parser(unit: str):
+    """Parser for '<number> <unit>' strings; values in another unit come back NaN."""
+    factors = UNITS[unit]
+
+    def parse(raw) -> float:
+        if isinstance(raw, (int, float)):
+            return float(raw)  # already typed in the source (piaggio-ape.json)
+        match = _QUANTITY.search(raw)
+        if not match:
+            return math.nan
+        factor = factors.get((match.group(2) or "").lower())
+        return float(match.group(1)) * factor if factor else math.nan
+
+    return parse
+
+
+def parse_battery(raw) -> float:
+    """kWh, or V × Ah / 1000 for '48V 100 Ah' style capacities."""
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    match = _KWH.search(raw)
+    if match:
+        return float(match.group(1))
+    match = _VOLT_AH.search(raw)
+    return float(match.group(1)) * float(match.group(2)) / 1000 if match else math.nan
+
+
+def parse_seats(raw) -> float:
+    """'Driver + 3 Passenger' → 3 (passengers, driver excluded)."""
+    if isinstance(raw, (int, float)):
+        return float(raw)
+    match = _SEATS.search(raw)
+    return float(match.group(1)) if match else math.nan
+
+
+# column → (candidate source paths, first present wins; parser; unit)
+NUMERIC = {
+    "2w": {
+        "price":        (["price"], parse_price, "INR"),
+        "engine_cc":    (["engine_displacement"], quantity_parser("cc"), "cc"),
+        "mileage_kmpl": (["mileage"], quantity_parser("kmpl"), "kmpl"),
+        "mileage_kmkg": (["mileage"], quantity_parser("km/kg"), "km/kg"),
+        "range_km":     (["mileage"], quantity_parser("km"), "km"),
+        "power_bhp":    (["max_power"], quantity_parser("bhp"), "bhp"),
+        "torque_nm":    (["max_torque"], quantity_parser("nm"), "Nm"),
+        "top_speed":    (["top_speed"], quantity_parser("kmph"), "kmph"),
+    },
+    "3w": {
+        "price":        (["ex_showroom_price"], parse_price, "INR"),
+        "engine_cc":    (["engine_details.displacement", "engine_cc"], quantity_parser("cc"), "cc"),
+        "mileage_kmpl": (["mileage", "mileage_kmpl"], quantity_parser("kmpl"), "kmpl"),
+        "mileage_kmkg": (["mileage"], quantity_parser("km/kg"), "km/kg"),
+        "range_km":     (["technical_specifications.range", "range_km", "mileage"], quantity_parser("km"), "km"),
+        "power_bhp":    (["engine_details.max_power", "max_power"], quantity_parser("bhp"), "bhp"),
+        "torque_nm":    (["engine_details.torque", "torque"], quantity_parser("nm"), "Nm"),
+        "top_speed":    (["technical_specifications.top_speed"], quantity_parser("kmph"), "kmph"),
+        "battery_kwh":  (["technical_specifications.battery_capacity", "battery_kwh",
+                          "technical_specifications.battery"], parse_battery, "kWh"),
+        "gvw_kg":       (["payload_features.gross_vehicle_weight", "gvw_kg"], quantity_parser("kg"), "kg"),
+        "payload_kg":   (["payload_features.payload_capacity", "payload_capacity"], quantity_parser("kg"), "kg"),
+        "passengers":   (["technical_specifications.seating_capacity", "passenger_capacity"], parse_seats, "seats"),
+    },
+}
+CATEGORICAL = {
+    "2w": {"fuel": ["fuel_type"], "transmission": ["transmission"]},
+    "3w": {"fuel": ["technical_specifications.fuel_type", "fuel_type"],
+           "transmission": ["technical_specifications.transmission_type", "transmission_type"]},
+}
+
+
+def normalize_transmission(raw: str) -> str:
+    """Manual / Automatic, as in the CAR_DATA index; 3W constant-mesh boxes are manual."""
+    return "Manual" if "mesh" in raw.lower() else _car_transmission(raw)
+
+
+def lookup(vehicle: dict, paths: "list[str]"):
+    """First present value among dotted paths ('engine_details.torque'), else None."""
+    for path in paths:
+        value = vehicle
+        for part in path.split("."):
+            value = value.get(part) if isinstance(value, dict) else None
+        if not _missing(value):
+            return value
+    return None
+
+
+# ── Build ─────────────────────────────────────────────────────────────────────
+
+def load_rows(category: str) -> "tuple[list[dict], list[str], list[str]]":
+    """(vehicles, brand per vehicle, source files) for one category."""
+    vehicles, brands, sources = [], [], []
+    for path in sorted((DATA_DIR / category).glob("*.json")):
+        data = json.loads(path.read_text())
+        sources.append(path.name)
+        for vehicle in data.get("vehicles") or []:
+            vehicles.append(vehicle)
+            brands.append(data.get("brand") or vehicle.get("make") or "")
+    return vehicles, brands, sources
+
+
+def parse_column(vehicles: "list[dict]", paths: "list[str]", parse) -> "tuple[np.ndarray, list[str]]":
+    """(float64 column, raw strings that were present but did not parse)."""
+    import numpy as np
+
+    raw = [lookup(v, paths) for v in vehicles]
+    values = np.array([np.nan if r is None else parse(r) for r in raw], dtype=np.float64)
+    rejected = [str(r) for r, v in zip(raw, values) if r is not None and np.isnan(v)]
+    return values, rejected
+
+
+def build_store(category: str) -> "tuple[dict, dict]":
+    """Arrays for the .npz and the rejected strings per column."""
+    import numpy as np
+
+    vehicles, brands, sources = load_rows(category)
+    arrays = {
+        "brand": np.array(brands, dtype=str),
+        "model": np.array([v.get("model") or v.get("variant_name") or "" for v in vehicles], dtype=str),
+        "variant": np.array([v.get("variant_name") or v.get("variant") or "" for v in vehicles], dtype=str),
+    }
+    for name, paths in CATEGORICAL[category].items():
+        raw = [str(lookup(v, paths) or "") for v in vehicles]
+        if name == "transmission":
+            raw = [normalize_transmission(v) for v in raw]
+        labels, inverse = np.unique(np.array(raw, dtype=str), return_inverse=True)
+        arrays[name] = inverse.astype(np.int16)
+        arrays[f"{name}_vocab"] = labels
+
+    rejected = {}
+    units = {}
+    for name, (paths, parse, unit) in NUMERIC[category].items():
+        values, bad = parse_column(vehicles, paths, parse)
+        arrays[name] = values
+        # stable, so ties keep file order; NaN sorts last
+        arrays[f"order_{name}"] = np.argsort(values, kind="stable").astype(np.int32)
+        units[name] = unit
+        # mileage feeds three unit-specific columns; other units there are expected
+        if bad and "mileage" not in paths:
+            rejected[name] = bad
+
+    arrays["meta"] = np.array(json.dumps({
+        "category": category,
+        "rows": len(vehicles),
+        "sources": sources,
+        "units": units,
+    }))
+    return arrays, rejected
+
+
+def save_store(arrays: dict, path: Path):
+    import numpy as np
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    np.savez_compressed(path, **arrays)
+
+
+# ── Query ─────────────────────────────────────────────────────────────────────
+
+def load_store(category: str, directory: Path = OUTPUT_DIR) -> dict:
+    import numpy as np
+
+    with np.load(directory / f"{category}.npz", allow_pickle=False) as npz:
+        return {name: npz[name] for name in npz.files}
+
+
+def range_rows(store: dict, column: str, low: float = -math.inf, high: float = math.inf) -> "np.ndarray":
+    """Row ids with low <= column <= high, ascending by the column (two binary searches)."""
+    import numpy as np
+
+    order = store[f"order_{column}"]
+    ordered = store[column][order]
+    start = np.searchsorted(ordered, low, side="left")
+    stop = np.searchsorted(ordered, high, side="right")  # NaN sorts after +inf
+    return order[start:stop]
+
+
+def numeric_columns(store: dict) -> "list[str]":
+    """Columns with a sort index, i.e. the ones where / sort accept."""
+    return sorted(name[len("order_"):] for name in store if name.startswith("order_"))
+
+
+def query(store: dict, where: "list[tuple[str, float, float]]", sort: "str | None" = None) -> "np.ndarray":
+    """Rows matching every range in where, ordered by sort (default: the first where column)."""
+    import numpy as np
+
+    known = numeric_columns(store)
+    unknown = [c for c in [c for c, *_ in where] + ([sort] if sort else []) if c not in known]
+    if unknown:
+        raise ValueError(f"unknown column(s) {', '.join(dict.fromkeys(unknown))}; numeric columns: {', '.join(known)}")
+    mask = np.ones(len(store["brand"]), dtype=bool)
+    for column, low, high in where:
+        hit = np.zeros_like(mask)
+        hit[range_rows(store, column, low, high)] = True
+        mask &= hit
+    sort = sort or (where[0][0] if where else None)
+    order = store[f"order_{sort}"] if sort else np.arange(mask.size)
+    return order[mask[order]]
+
+
+def _range_arg(text: str) -> "tuple[str, float, float]":
+    """'price:50000:100000' / 'range_km:150:' → (column, low, high)."""
+    column, _, bounds = text.partition(":")
+    low, _, high = bounds.partition(":")
+    return column, float(low) if low else -math.inf, float(high) if high else math.inf
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Typed columnar store for 2W/3W catalog specs")
+    parser.add_argument("--category", choices=CATEGORIES, help="Build / query one category (default: all)")
+    parser.add_argument("--where", action="append", type=_range_arg, default=[], metavar="COL:LO:HI",
+                        help="Query the built store instead of building (repeatable)")
+    parser.add_argument("--sort", help="Numeric column to order query results by")
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+    categories = [args.category] if args.category else list(CATEGORIES)
+
+    if args.where or args.sort:
+        for category in categories:
+            store = load_store(category)
+            try:
+                rows = query(store, args.where, args.sort)
+            except ValueError as e:
+                parser.error(f"{category}: {e}")
+            shown = [c for c, *_ in args.where] + ([args.sort] if args.sort else [])
+            print(f"  {category}: {rows.size} rows")
+            for row in rows[:args.limit]:
+                values = "  ".join(f"{c}={store[c][row]:g}" for c in dict.fromkeys(shown))
+                print(f"    {store['brand'][row]} {store['model'][row]}  {values}")
+        return
+
+    import numpy as np
+
+    for category in categories:
+        arrays, rejected = build_store(category)
+        out = OUTPUT_DIR / f"{category}.npz"
+        save_store(arrays, out)
+        meta = json.loads(str(arrays["meta"]))
+        filled = {name: int((~np.isnan(arrays[name])).sum()) for name in meta["units"]}
+        print(f"  {category}: {meta['rows']} rows from {len(meta['sources'])} files → "
+              f"{out.relative_to(PROJECT_ROOT)} ({out.stat().st_size // 1024} KB)")
+        print("    " + "  ".join(f"{name}={count}" for name, count in filled.items()))
+        for name, bad in rejected.items():
+            print(f"    unparsed {name} ({len(bad)}): {', '.join(sorted(set(bad))[:5])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+cdn_urls.py
+
+Canonical form for CardDekho CDN image URLs.
+
+stimg.cardekho.com serves the same photo at several sizes by swapping one
+path segment:
+
+  /images/carexteriorimages/630x420/Aston-Martin/DB12/10185/1769509097940/front-left-side-47.jpg
+  /images/carexteriorimages/930x620/Aston-Martin/DB12/10185/1769509097940/front-left-side-47.jpg
+
+The scripts see both (car_catalog, brand JSON, ANTIGRAVITY_SCRAPE_TASK.csv),
+so without this they fetch and store one photo once per size. Here every
+variant maps to one asset key; pick_best() chooses which variant to fetch
+for our renditions.
+
+Usage:
+  from cdn_urls import asset_key, storage_path, group_variants, pick_best
+
+  python3 scripts/cdn_urls.py ANTIGRAVITY_SCRAPE_TASK.csv   # report duplicate sizes
+"""
+
+import re
+import sys
+from pathlib import Path
+from urllib.parse import urlparse
+
+SIZE_RE = re.compile(r"^(\d+)x(\d+)$")
+
+# Largest rendition the site serves from these photos (gallery / detail hero).
+# Prefer the smallest variant at least this wide; else the widest available.
+TARGET_WIDTH = 930
+
+
+def _split(url: str) -> "tuple[str, list, int]":
+    """(host, path segments, index of the size segment or -1) for a URL without query."""
+    parsed = urlparse(url.split("?")[0])
+    parts = parsed.path.split("/")
+    for i, seg in enumerate(parts):
+        if SIZE_RE.match(seg):
+            return parsed.netloc, parts, i
+    return parsed.netloc, parts, -1
+
+
+def size_of(url: str) -> "tuple[int, int] | None":
+    """(width, height) encoded in the URL path, or None."""
+    _, parts, idx = _split(url)
+    if idx < 0:
+        return None
+    w, h = SIZE_RE.match(parts[idx]).groups()
+    return int(w), int(h)
+
+
+def asset_key(url: str) -> str:
+    """
+    Size- and query-independent identity of the photo behind url:
+    host + path with the size segment replaced by '*'.
+    """
+    host, parts, idx = _split(url)
+    if idx >= 0:
+        parts = parts[:idx] + ["*"] + parts[idx + 1:]
+    return host + "/".join(parts)
+
+
+def storage_path(url: str) -> str:
+    """
+    Supabase object key for url: the path after the size segment, e.g.
+    Lamborghini/Revuelto/9770/12345/front-left-side-47.jpg. Same for every
+    size variant. Without a size segment, everything after /images/.
+    """
+    _, parts, idx = _split(url)
+    if idx >= 0:
+        rel_parts = parts[idx + 1:]
+    else:
+        rel_parts = parts[2:] if len(parts) > 1 and parts[1] == "images" else parts[1:]
+    return "/".join(p for p in rel_parts if p)
+
+
+def _rank(url: str, target_width: int):
+    size = size_of(url)
+    width = size[0] if size else 0
+    # Big-enough variants first (smallest of them), then the widest of the rest
+    return (0, width) if width >= target_width else (1, -width)
+
+
+def pick_best(urls, target_width: int = TARGET_WIDTH) -> str:
+    """The variant to fetch among urls of one asset (ties: first seen)."""
+    return min(urls, key=lambda u: _rank(u, target_width))
+
+
+def group_variants(urls) -> "dict[str, list[str]]":
+    """{asset_key: [urls…]} preserving first-seen order within each asset."""
+    groups = {}
+    for url in urls:
+        groups.setdefault(asset_key(url), []).append(url)
+    return groups
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2:
+        print("usage: cdn_urls.py FILE   (any text file; URLs are found by regex)")
+        sys.exit(2)
+    text = Path(sys.argv[1]).read_text(errors="replace")
+    found = list(dict.fromkeys(re.findall(r"https?://stimg\.cardekho\.com/[^\s,\"'<>]+", text)))
+    groups = group_variants(found)
+    multi = {k: v for k, v in groups.items() if len(v) > 1}
+    print(f"  URLs:    {len(found)}")
+    print(f"  Assets:  {len(groups)}")
+    print(f"  Assets with several sizes: {len(multi)}")
+    for key, variants in list(multi.items())[:10]:
+        print(f"    {key}")
+        print(f"      fetch {pick_best(variants)}")
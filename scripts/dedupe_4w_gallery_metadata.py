@@ -7,7 +7,7 @@ from pathlib import Path
 from PIL import Image
 
 
-ROOT = Path("/Users/anilkumarkolukulapalli/projects/cyepro/dealersite pro/dealer-site-pro")
+ROOT = Path(__file__).resolve().parent.parent
 GALLERY_ROOT = ROOT / "public" / "data" / "brand-model-images" / "4w-galleries"
 REPORT_JSON = ROOT / "docs" / "4w-gallery-dedupe-report.json"
 REPORT_MD = ROOT / "docs" / "4w-gallery-dedupe-report.md"
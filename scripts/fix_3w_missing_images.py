@@ -20,83 +20,38 @@ Usage:
 from __future__ import annotations
 
 import json
-import os
 import re
 import sys
 import time
 import tempfile
 import urllib.request
-import urllib.parse
-import urllib.error
 from pathlib import Path
 from typing import Optional
 
+from blob_cache import looks_like_image, shared_cache
+from media_tools.config import AUTH, SUPABASE_URL, require_service_key
+from media_tools.net import request
+from media_tools.slugs import model_to_slug
+
 # ── Config ────────────────────────────────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).parent.parent
 URLS_JSON    = PROJECT_ROOT / "public/data/vehicle-image-urls.json"
 BRAND_MODEL_IMAGES_3W = PROJECT_ROOT / "public/data/brand-model-images/3w"
 
-SUPABASE_URL = "https://llsvbyeumrfngjvbedbz.supabase.co"
-SUPABASE_SERVICE_KEY = (
-    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
-    "eyJpc3MiOiJzdXBhYmFzZSIsInJlZiI6Imxsc3ZieWV1bXJmbmdqdmJlZGJ6Iiwicm9sZSI6InNlcnZpY2Vfcm9sZSIsImlhdCI6MTc3MTMwODMxNywiZXhwIjoyMDg2ODg0MzE3fQ."
-    "NUlqttWkhTpQEcTCLQ7GPLkQvEpoW-6g4UuEPkYJnaE"
-)
 BUCKET = "vehicle-images"
 MIN_IMAGE_BYTES = 20_000  # 20 KB minimum
 
-# ── Slug helpers ──────────────────────────────────────────────────────────────
-
-def to_slug_ts(s: str) -> str:
-    """Replicate three-wheelers.ts toSlug function exactly."""
-    s = s.lower()
-    s = re.sub(r'[^a-z0-9\s-]', '', s)
-    s = re.sub(r'\s+', '-', s)
-    s = re.sub(r'-+', '-', s)
-    return s
-
-
-def model_to_slug(model: str) -> str:
-    """Replicate brand-model-images.ts modelToSlug function exactly."""
-    s = model.lower()
-    s = re.sub(r'\.', '', s)
-    s = re.sub(r'[^a-z0-9]+', '-', s)
-    s = re.sub(r'^-|-$', '', s)
-    return s
-
 # ── Supabase helpers ──────────────────────────────────────────────────────────
 
 def supabase_upload(path_in_bucket: str, image_bytes: bytes) -> str:
     """Upload bytes to Supabase Storage, return public URL."""
     url = f"{SUPABASE_URL}/storage/v1/object/{BUCKET}/{path_in_bucket}"
-    req = urllib.request.Request(
-        url,
-        data=image_bytes,
-        method="POST",
-        headers={
-            "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}",
-            "Content-Type": "image/jpeg",
-            "x-upsert": "true",
-        },
-    )
-    try:
-        with urllib.request.urlopen(req) as resp:
-            pass
-    except urllib.error.HTTPError as e:
-        body = e.read().decode()
-        raise RuntimeError(f"Upload failed ({e.code}): {body}")
+    status, body = request("POST", url, image_bytes, {**AUTH, "Content-Type": "image/jpeg", "x-upsert": "true"})
+    if status not in (200, 201):
+        raise RuntimeError(f"Upload failed ({status}): {body.decode(errors='replace')}")
     return f"{SUPABASE_URL}/storage/v1/object/public/{BUCKET}/{path_in_bucket}"
 
 
-def supabase_exists(path_in_bucket: str) -> bool:
-    url = f"{SUPABASE_URL}/storage/v1/object/public/{BUCKET}/{path_in_bucket}"
-    req = urllib.request.Request(url, method="HEAD")
-    try:
-        with urllib.request.urlopen(req):
-            return True
-    except urllib.error.HTTPError:
-        return False
-
 # ── Scraping helpers ──────────────────────────────────────────────────────────
 
 HEADERS = {
@@ -174,28 +129,32 @@ def scrape_cardekho_image(brand_folder: str, model_slug_cardekho: str) -> Option
     for img_url in candidates[:5]:
         print(f"      Trying image URL: {img_url[:80]}...")
         try:
-            img_req = urllib.request.Request(img_url, headers=HEADERS)
-            with urllib.request.urlopen(img_req, timeout=15) as r:
-                data = r.read()
-            if len(data) >= MIN_IMAGE_BYTES:
+            data = shared_cache().fetch(img_url, _download, validate=_is_image)
+            if data:
                 print(f"      OK ({len(data):,} bytes)")
                 return data
-            else:
-                print(f"      Too small ({len(data):,} bytes), skipping")
+            print(f"      Not an image or under {MIN_IMAGE_BYTES:,} bytes, skipping")
         except Exception as e:
             print(f"      Image fetch failed: {e}")
 
     return None
 
 
+def _download(url: str) -> bytes:
+    req = urllib.request.Request(url, headers=HEADERS)
+    with urllib.request.urlopen(req, timeout=15) as r:
+        return r.read()
+
+
+def _is_image(data: bytes) -> bool:
+    return looks_like_image(data, MIN_IMAGE_BYTES)
+
+
 def try_fetch_image(url: str) -> Optional[bytes]:
-    """Try to fetch any image URL, return bytes if valid or None."""
+    """Try to fetch any image URL (via the shared blob cache), return bytes if valid or None."""
     try:
-        req = urllib.request.Request(url, headers=HEADERS)
-        with urllib.request.urlopen(req, timeout=15) as r:
-            data = r.read()
-        if len(data) >= MIN_IMAGE_BYTES:
-            return data
+        # validated before caching, so error pages are never stored for the URL
+        return shared_cache().fetch(url, _download, validate=_is_image)
     except Exception:
         pass
     return None
@@ -203,6 +162,7 @@ def try_fetch_image(url: str) -> Optional[bytes]:
 # ── Main ──────────────────────────────────────────────────────────────────────
 
 def main():
+    require_service_key()
     with open(URLS_JSON) as f:
         urls: dict = json.load(f)
 
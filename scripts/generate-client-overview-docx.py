@@ -1,33 +1,87 @@
-from docx import Document
-from docx.shared import Pt, Inches, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import qn
-
-doc = Document()
-
-style = doc.styles['Normal']
-font = style.font
-font.name = 'Calibri'
-font.size = Pt(11)
-font.color.rgb = RGBColor(0x33, 0x33, 0x33)
-
-for s in ['Heading 1', 'Heading 2', 'Heading 3']:
-    hs = doc.styles[s]
-    hs.font.color.rgb = RGBColor(0x1a, 0x1a, 0x2e)
-    hs.font.name = 'Calibri'
-
-def add_heading(text, level=1):
+"""
+generate-client-overview-docx.py
+
+Dealer Site Pro client overview (.docx). Without arguments it writes the
+generic overview; with --all / --dealers it renders a personalized copy per
+onboarded dealer (brands, subdomain, services) in a process pool.
+
+The shared sections are built once with python-docx and saved as a template.
+Each worker loads that template once; per dealer it clones it, splices the
+dealer block in at DEALER_ANCHOR and saves. Documents are streamed to a
+directory or straight into a zip as workers finish them.
+
+Usage:
+  python3 scripts/generate-client-overview-docx.py                 # generic overview
+  python3 scripts/generate-client-overview-docx.py --all           # every onboarded dealer (Supabase)
+  python3 scripts/generate-client-overview-docx.py --all --zip overviews.zip
+  python3 scripts/generate-client-overview-docx.py --dealers dealers.json --out docs/client-overviews
+"""
+
+import argparse
+import io
+import json
+import os
+import re
+import time
+import urllib.request
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from media_tools.config import AUTH, PROJECT_ROOT, SERVICE_KEY, SUPABASE_URL
+
+GENERIC_OUTPUT = PROJECT_ROOT / "docs" / "Dealer-Site-Pro-Client-Overview.docx"
+DEALER_OUTPUT  = PROJECT_ROOT / "docs" / "client-overviews"
+SITE_DOMAIN    = "indrav.in"
+WORKERS        = os.cpu_count() or 4
+PAGE_SIZE      = 1000
+
+DEALER_ANCHOR = "{{DEALER_SECTION}}"
+
+# dealer_services.service_name → label (CHECK constraint in 20260217_complete_schema.sql)
+SERVICE_LABELS = {
+    "new_car_sales": "New vehicle sales",
+    "used_car_sales": "Used vehicle sales",
+    "financing": "Financing",
+    "service_maintenance": "Service & maintenance",
+    "parts_accessories": "Parts & accessories",
+    "body_shop": "Body shop",
+    "express_service": "Express service",
+    "insurance": "Insurance",
+    "fleet_sales": "Fleet sales",
+    "home_test_drives": "Home test drives",
+    "extended_warranties": "Extended warranties",
+    "trade_in": "Trade-in / exchange",
+    "get_callback": "Request a callback",
+    "buy_accessories": "Buy accessories online",
+}
+
+
+def style_document(doc):
+    from docx.shared import Pt, RGBColor
+
+    style = doc.styles['Normal']
+    font = style.font
+    font.name = 'Calibri'
+    font.size = Pt(11)
+    font.color.rgb = RGBColor(0x33, 0x33, 0x33)
+
+    for s in ['Heading 1', 'Heading 2', 'Heading 3']:
+        hs = doc.styles[s]
+        hs.font.color.rgb = RGBColor(0x1a, 0x1a, 0x2e)
+        hs.font.name = 'Calibri'
+
+def add_heading(doc, text, level=1):
     h = doc.add_heading(text, level=level)
     return h
 
-def add_para(text, bold=False):
+def add_para(doc, text, bold=False):
     p = doc.add_paragraph()
     run = p.add_run(text)
     run.bold = bold
     return p
 
-def add_bullet(text, bold_prefix=""):
+def add_bullet(doc, text, bold_prefix=""):
     p = doc.add_paragraph(style='List Bullet')
     if bold_prefix:
         run = p.add_run(bold_prefix)
@@ -37,7 +91,7 @@ def add_bullet(text, bold_prefix=""):
         p.add_run(text)
     return p
 
-def add_numbered(text, bold_prefix=""):
+def add_numbered(doc, text, bold_prefix=""):
     p = doc.add_paragraph(style='List Number')
     if bold_prefix:
         run = p.add_run(bold_prefix)
@@ -47,7 +101,9 @@ def add_numbered(text, bold_prefix=""):
         p.add_run(text)
     return p
 
-def add_table(headers, rows):
+def add_table(doc, headers, rows):
+    from docx.enum.table import WD_TABLE_ALIGNMENT
+
     table = doc.add_table(rows=1, cols=len(headers))
     table.style = 'Medium Shading 1 Accent 1'
     table.alignment = WD_TABLE_ALIGNMENT.CENTER
@@ -63,7 +119,10 @@ def add_table(headers, rows):
             row[i].text = cell
     return table
 
-def add_line():
+def add_line(doc):
+    from docx.shared import Pt
+    from docx.oxml.ns import qn
+
     p = doc.add_paragraph()
     p.paragraph_format.space_before = Pt(6)
     p.paragraph_format.space_after = Pt(6)
@@ -78,299 +137,462 @@ def add_line():
     pBdr.append(bottom)
     pPr.append(pBdr)
 
+
+def build_shared(doc):
+    """Every section shared by all overviews, with DEALER_ANCHOR where the dealer block goes."""
+    from docx.shared import Pt, RGBColor
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+
+    # Title
+    title = doc.add_heading('Dealer Site Pro', level=0)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    subtitle = doc.add_paragraph()
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    run = subtitle.add_run('Client-Facing Overview')
+    run.font.size = Pt(16)
+    run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
+
+    add_line(doc)
+
+    # Per-dealer section is spliced in here (see render_dealer)
+    doc.add_paragraph(DEALER_ANCHOR)
+
+    # --- What is Dealer Site Pro? ---
+    add_heading(doc, 'What is Dealer Site Pro?')
+    add_para(doc, 'Dealer Site Pro is a website builder platform designed exclusively for Indian automotive dealerships. It allows any dealer \u2014 whether they sell cars, bikes, or auto-rickshaws \u2014 to launch a fully functional, professional website without writing a single line of code.')
+
+    add_line(doc)
+
+    # --- The Problem It Solves ---
+    add_heading(doc, 'The Problem It Solves')
+    add_para(doc, 'Most small and mid-size dealerships in India either have no website at all, or rely on outdated, expensive ones built by agencies. They lose customers to competitors who show up on Google. They manage leads on paper or WhatsApp. They have no online presence for their inventory.')
+    add_para(doc, 'Dealer Site Pro fixes all of this in one platform.')
+
+    add_line(doc)
+
+    # --- How It Works ---
+    add_heading(doc, 'How It Works (Dealer Journey)')
+    add_numbered(doc, 'Sign up ', 'Step 1: ')
+    add_numbered(doc, 'Walk through a guided setup (5-6 steps) \u2014 enter dealership details, pick brands you sell, choose services you offer, select a design template, customize your homepage', 'Step 2: ')
+    add_numbered(doc, 'Go live \u2014 get a free website instantly at yourname.indrav.in', 'Step 3: ')
+    add_numbered(doc, 'Manage everything from a single dashboard \u2014 inventory, leads, reviews, bookings, analytics', 'Step 4: ')
+    add_para(doc, '')
+    add_para(doc, 'That\u2019s it. No developers, no hosting bills, no maintenance headaches.')
+
+    add_line(doc)
+
+    # --- What Dealers Get ---
+    add_heading(doc, 'What Dealers Get')
+
+    add_heading(doc, 'A. A Professional Public Website', level=2)
+    add_bullet(doc, 'Vehicle catalog with search and filters (by brand, price, fuel type, body type)')
+    add_bullet(doc, 'Individual vehicle pages with full specs, photos, and pricing')
+    add_bullet(doc, 'Built-in tools for customers \u2014 EMI calculator, on-road price estimator, insurance quotes')
+    add_bullet(doc, 'Contact form, test drive booking, service appointment booking')
+    add_bullet(doc, 'Customer reviews section')
+    add_bullet(doc, 'Fully mobile-responsive and SEO-optimized (shows up on Google)')
+    add_bullet(doc, '4 design themes to choose from \u2014 Sporty, Modern, Family, Luxury')
+    add_bullet(doc, 'Official brand colors applied automatically (Maruti blue, Tata teal, etc.)')
+
+    add_heading(doc, 'B. A Complete Dealer Dashboard', level=2)
+    add_bullet(doc, ' \u2014 Add vehicles manually, look up details via RC number, upload photos, save drafts, mark as sold/reserved', 'Inventory Management')
+    add_bullet(doc, ' \u2014 Every inquiry, test drive request, and quote gets tracked with priority levels (hot/warm/cold) and status (new/contacted/converted/lost)', 'Lead Management (CRM)')
+    add_bullet(doc, ' \u2014 Collect, moderate, and reply to customer reviews. Sync reviews from Google.', 'Reviews')
+    add_bullet(doc, ' \u2014 All contact form submissions in one inbox', 'Messages')
+    add_bullet(doc, ' \u2014 Manage test drive and service appointments', 'Bookings')
+    add_bullet(doc, ' \u2014 Customers can submit their vehicle for sale or exchange', 'Sell/Exchange Requests')
+    add_bullet(doc, ' \u2014 Create and manage special deals', 'Offers & Promotions')
+    add_bullet(doc, ' \u2014 Track page views, unique visitors, leads generated, traffic sources, and conversions', 'Analytics')
+    add_bullet(doc, ' \u2014 Send browser notifications to website visitors', 'Push Notifications')
+    add_bullet(doc, ' \u2014 Start with a free subdomain, upgrade to your own custom domain anytime', 'Domain Management')
+
+    add_heading(doc, 'C. Vehicle Type Support', level=2)
+    add_bullet(doc, ' \u2014 New cars, used cars, certified pre-owned', '4-Wheelers (Cars)')
+    add_bullet(doc, ' \u2014 New, used, electric', '2-Wheelers (Bikes & Scooters)')
+    add_bullet(doc, ' \u2014 Passenger, cargo, electric', '3-Wheelers (Auto-rickshaws)')
+    add_bullet(doc, 'Each category has its own dedicated pages, catalog data, and management tools')
+
+    add_heading(doc, 'D. Pre-Loaded Vehicle Data', level=2)
+    add_bullet(doc, 'Thousands of vehicle models already in the system with specs, images, colors, and pricing')
+    add_bullet(doc, 'Dealers just select what they sell \u2014 no need to enter data from scratch')
+    add_bullet(doc, 'Covers all major Indian brands (Maruti Suzuki, Hyundai, Tata, Mahindra, Honda, Hero, Bajaj, TVS, Piaggio, and many more)')
+
+    add_line(doc)
+
+    # --- APIs & Integrations ---
+    add_heading(doc, 'APIs & Integrations \u2014 What Powers the Platform')
+
+    add_heading(doc, 'Vehicle Verification APIs', level=2)
+    add_table(doc,
+        ['API', 'What It Does'],
+        [
+            ['RC Number Lookup (Surepass)', 'Enter a vehicle registration number \u2192 instantly get owner name, make/model, fuel type, engine/chassis number, insurance status, fitness expiry, and pending challans. Costs \u20b93 per lookup, tracked via credit system. Results cached for 24 hours.'],
+            ['VIN Decoder (NHTSA)', 'Enter a VIN number \u2192 get make, model, year, fuel type decoded automatically'],
+            ['Draft Vehicle Creation', 'RC lookup data auto-fills a draft vehicle listing. Dealer just adds photos and price to publish. Duplicate RC detection built in.'],
+        ]
+    )
+
+    add_heading(doc, 'Inventory Management APIs', level=2)
+    add_table(doc,
+        ['API', 'What It Does'],
+        [
+            ['Manual Vehicle CRUD', 'Add, edit, delete vehicles with full details \u2014 make, model, variant, year, price, mileage, color, condition, photos'],
+            ['Image Upload', 'Upload vehicle photos to cloud storage with CDN delivery'],
+            ['Cyepro DMS Sync', 'Import inventory directly from Cyepro dealer management system. Server-side proxy with pagination, filtering, and price mapping. Includes diagnostic/test endpoint.'],
+            ['AI Description Generator', 'Uses Claude AI to auto-generate professional vehicle listing descriptions from specs. Rate-limited, input-sanitized.'],
+            ['Used Vehicle Price Offers', 'Set custom pricing on used vehicles from any source (manual or Cyepro)'],
+        ]
+    )
+
+    add_heading(doc, 'Lead & CRM APIs', level=2)
+    add_table(doc,
+        ['API', 'What It Does'],
+        [
+            ['Lead Submission', 'Captures inquiries from dealer website. 5-minute duplicate detection. Auto-notifies dealer via SMS and email. Auto-forwards to Cyepro CRM if configured.'],
+            ['Test Drive Booking', 'Customers book test drives with preferred date/time. Creates both lead and booking records.'],
+            ['Lead Management', 'List, filter, and update lead status (new \u2192 contacted \u2192 qualified \u2192 converted \u2192 lost) with priority tracking'],
+        ]
+    )
+
+    add_heading(doc, 'Service & Booking APIs', level=2)
+    add_table(doc,
+        ['API', 'What It Does'],
+        [
+            ['Car Service Booking', 'Customers book service appointments \u2014 general service, body repair, AC service, etc. Supports home pickup. Rate-limited.'],
+            ['2W/3W Service Booking', 'Dedicated service booking for bikes and autos'],
+            ['Service Centers', 'Manage multiple service center locations with working hours, images, and pricing tiers'],
+        ]
+    )
+
+    add_heading(doc, 'Customer Engagement APIs', level=2)
+    add_table(doc,
+        ['API', 'What It Does'],
+        [
+            ['Review Submission', 'Customers submit reviews (rate-limited to 5/day per IP). Auto-approve or manual moderation.'],
+            ['Review Moderation', 'Dealers approve/reject/flag reviews, reply to them, feature best ones on homepage'],
+            ['Google Review Sync', 'Import reviews from Google Maps/Places automatically using Place ID'],
+            ['Sell/Exchange Requests', 'Customers submit their vehicle for sale \u2014 with photos, expected price, preferred inspection slot. Auto-emails confirmation. When dealer approves, auto-creates inventory listing.'],
+            ['Customer Panel', 'Customers look up their history (inquiries, test drives, sell requests) by phone/email'],
+            ['Push Notifications', 'Subscribe visitors to web push. Dealers broadcast notifications (new arrivals, price drops, announcements).'],
+        ]
+    )
+
+    add_heading(doc, 'Payment & Subscription APIs', level=2)
+    add_table(doc,
+        ['API', 'What It Does'],
+        [
+            ['Razorpay Subscription', 'Create subscriptions for Pro/Premium plans. Handles trial periods.'],
+            ['Payment Verification', 'Verify Razorpay payments with signature validation. Idempotent \u2014 prevents duplicate charges.'],
+            ['Vehicle Booking Payments', 'Customers pay booking amounts online for 2W/3W vehicles. Order creation + payment verification.'],
+            ['Razorpay Webhooks', 'Handles subscription lifecycle events \u2014 activated, charged, cancelled, payment failed. Deduplication built in.'],
+        ]
+    )
+
+    add_heading(doc, 'Domain Management APIs', level=2)
+    add_table(doc,
+        ['API', 'What It Does'],
+        [
+            ['Subdomain Creation', 'Auto-generates a free subdomain from business name + city'],
+            ['Custom Domain Connect', 'Connect your own domain. Registers on Vercel. Returns DNS records to configure.'],
+            ['DNS Verification', 'Verify A and CNAME records are configured correctly. Saves verification history.'],
+            ['Domain Search', 'Search available domains for purchase (Premium tier)'],
+            ['Domain Monitoring', 'Cron job checks SSL certificates and domain expiry every 12 hours'],
+            ['Domain Resolution', 'Edge middleware resolves subdomain/custom domain to dealer slug with Redis caching'],
+        ]
+    )
+
+    add_heading(doc, 'Marketplace & Social APIs', level=2)
+    add_table(doc,
+        ['API', 'What It Does'],
+        [
+            ['Cross-Dealer Marketplace', 'Search across all dealers\u2019 inventory \u2014 filter by make, fuel, condition, body type, price, location'],
+            ['Social Media Auto-Post', 'Auto-post vehicle listings to Facebook Page, Instagram Business, and Twitter/X'],
+        ]
+    )
+
+    add_heading(doc, 'Auth & Account APIs', level=2)
+    add_table(doc,
+        ['API', 'What It Does'],
+        [
+            ['OTP Login', 'Send OTP to email for passwordless authentication. Rate-limited.'],
+            ['Registration Check', 'Verify email/phone availability before signup'],
+            ['Account Deletion', 'GDPR-compliant account deletion with PII anonymization'],
+        ]
+    )
+
+    add_heading(doc, 'Admin & System APIs', level=2)
+    add_table(doc,
+        ['API', 'What It Does'],
+        [
+            ['Admin Dashboard', 'List all dealers, manage catalog, deploy templates'],
+            ['Template Deployment', 'Push template + brand updates to dealer sites with ISR revalidation'],
+            ['Health Check', 'Monitor Supabase, Razorpay, Vercel connectivity'],
+            ['API Credit Tracking', 'Track per-dealer API usage and costs (RC lookups, etc.)'],
+        ]
+    )
+
+    add_heading(doc, 'Utility APIs', level=2)
+    add_table(doc,
+        ['API', 'What It Does'],
+        [
+            ['Finance Pre-Check', 'Redirect to finance partner for loan eligibility'],
+            ['FASTag Recharge', 'Redirect to FASTag recharge partner'],
+            ['Brand Catalog', 'Get models for specific make with preview data'],
+        ]
+    )
+
+    add_line(doc)
+
+    # --- External Service Integrations ---
+    add_heading(doc, 'External Service Integrations')
+    add_table(doc,
+        ['Service', 'Purpose'],
+        [
+            ['Supabase', 'Database (PostgreSQL), Auth, Storage, Edge Functions'],
+            ['Razorpay', 'Payments, subscriptions, webhooks'],
+            ['Surepass', 'RC number lookup, challan status'],
+            ['Rapidor', 'RC lookup fallback provider'],
+            ['NHTSA', 'VIN number decoding'],
+            ['Cyepro DMS', 'Dealer management system inventory sync'],
+            ['Claude AI (Anthropic)', 'Vehicle description generation'],
+            ['Cloudflare', 'DNS management, domain verification'],
+            ['GoDaddy', 'Domain registration'],
+            ['Vercel', 'Hosting, deployment, edge functions'],
+            ['Upstash Redis', 'Domain caching, rate limiting'],
+            ['Google Places', 'Review sync from Google Maps'],
+            ['Meta Graph API', 'Facebook & Instagram posting'],
+            ['Twitter/X API', 'Twitter posting'],
+            ['Resend', 'Transactional emails'],
+            ['Sentry', 'Error monitoring'],
+            ['Google Maps', 'Location embedding'],
+        ]
+    )
+
+    add_line(doc)
+
+    # --- API Statistics ---
+    add_heading(doc, 'API Statistics')
+    add_bullet(doc, '85+ API endpoints')
+    add_bullet(doc, '3 vehicle categories with dedicated APIs each')
+    add_bullet(doc, '12+ external service integrations')
+    add_bullet(doc, 'Rate limiting on all critical endpoints')
+    add_bullet(doc, 'Redis caching for performance')
+    add_bullet(doc, 'Idempotency on payment operations')
+    add_bullet(doc, 'Credit tracking for paid API calls')
+    add_bullet(doc, 'JWT authentication on all protected routes')
+    add_bullet(doc, 'Row-level security \u2014 dealers only access their own data')
+
+    add_line(doc)
+
+    # --- Payment & Pricing Model ---
+    add_heading(doc, 'Payment & Pricing Model')
+    add_bullet(doc, 'Dealers can start with a free plan (subdomain website with core features)')
+    add_bullet(doc, 'Upgrade to Pro/Premium/Enterprise for custom domains, advanced analytics, and priority support')
+    add_bullet(doc, 'RC lookups charged at \u20b93 per call with usage dashboard')
+    add_bullet(doc, 'Vehicle booking payments collected online')
+    add_bullet(doc, 'All payments processed securely through Razorpay with webhook-based lifecycle management')
+
+    add_line(doc)
+
+    # --- Why Dealers Should Use This ---
+    add_heading(doc, 'Why Dealers Should Use This')
+    add_table(doc,
+        ['Without Dealer Site Pro', 'With Dealer Site Pro'],
+        [
+            ['No website or an outdated one', 'Professional site live in minutes'],
+            ['Leads tracked on paper/WhatsApp', 'Full CRM with priority & status tracking'],
+            ['No online inventory', 'Searchable catalog with filters & photos'],
+            ['Customers can\u2019t find you on Google', 'SEO-optimized pages that rank locally'],
+            ['Pay agencies lakhs for a basic site', 'Start free, upgrade when ready'],
+            ['Separate tools for everything', 'One dashboard for inventory, leads, reviews, analytics'],
+            ['No customer engagement tools', 'EMI calculator, test drive booking, push notifications'],
+            ['Manual vehicle data entry', 'RC lookup auto-fills details in seconds'],
+            ['Can\u2019t verify vehicle history', 'Surepass shows challans, insurance, fitness status'],
+            ['No social media presence', 'Auto-post listings to Facebook, Instagram, Twitter'],
+            ['No analytics', 'Track views, leads, conversions, traffic sources'],
+        ]
+    )
+
+    add_line(doc)
+
+    # --- Technical Highlights ---
+    add_heading(doc, 'Key Technical Highlights (For Technical Stakeholders)')
+    add_bullet(doc, 'Built on modern web stack \u2014 Next.js, Supabase, TypeScript')
+    add_bullet(doc, 'Multi-tenant architecture \u2014 one platform serves unlimited dealers')
+    add_bullet(doc, 'Server-rendered pages for fast loading and SEO')
+    add_bullet(doc, 'Edge caching for instant domain resolution')
+    add_bullet(doc, 'Row-level security \u2014 each dealer only sees their own data')
+    add_bullet(doc, 'Integrates with Surepass (RC verification), Razorpay (payments), Cloudflare (DNS), and Cyepro (DMS)')
+    add_bullet(doc, '40+ database tables, 85+ API endpoints, 142 UI components')
+
+    add_line(doc)
+
+    # --- In One Line ---
+    add_heading(doc, 'In One Line')
+    p = doc.add_paragraph()
+    run = p.add_run('Dealer Site Pro is the Shopify for Indian car, bike, and auto dealerships \u2014 everything a dealer needs to get online, manage inventory, capture leads, and grow their business, all from one platform.')
+    run.bold = True
+    run.font.size = Pt(12)
+
+
+# ============================================================
+# TEMPLATE / PER-DEALER RENDERING
+# ============================================================
+
+def build_template() -> bytes:
+    """The shared document, saved once; every dealer copy starts from these bytes."""
+    from docx import Document
+
+    doc = Document()
+    style_document(doc)
+    build_shared(doc)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def add_dealer_section(doc, dealer):
+    brands = sorted(dealer.get("brands") or [], key=lambda b: (not b.get("is_primary"), b["brand_name"]))
+    services = [SERVICE_LABELS.get(s, s.replace("_", " ").capitalize()) for s in dealer.get("services") or []]
+    site = f"https://{dealer['subdomain']}.{SITE_DOMAIN}" if dealer.get("subdomain") else "Not yet assigned"
+
+    add_heading(doc, f"Prepared for {dealer['dealership_name']}")
+    if dealer.get("location"):
+        add_para(doc, dealer["location"])
+    add_table(doc,
+        ['Your Setup', 'Details'],
+        [
+            ['Website', site],
+            ['Brands', ', '.join(b["brand_name"] for b in brands) or '\u2014'],
+            ['Services', ', '.join(services) or '\u2014'],
+            ['Design Theme', (dealer.get("style_template") or "family").capitalize()],
+        ]
+    )
+    add_line(doc)
+
+
+_TEMPLATE = None
+
+
+def _init_worker(template: bytes):
+    global _TEMPLATE
+    _TEMPLATE = template
+
+
+def render_dealer(dealer) -> "tuple[str, bytes]":
+    """Clone the template, splice this dealer's block in at the anchor. Returns (filename, docx bytes)."""
+    from docx import Document
+
+    doc = Document(io.BytesIO(_TEMPLATE))
+    body = doc.element.body
+    anchor = next(p for p in doc.paragraphs if p.text == DEALER_ANCHOR)._p
+
+    # python-docx appends before the final sectPr; move whatever we add up to the anchor
+    first_new = len(body) - 1
+    add_dealer_section(doc, dealer)
+    for element in list(body)[first_new:-1]:
+        anchor.addprevious(element)
+    body.remove(anchor)
+
+    buf = io.BytesIO()
+    doc.save(buf)
+    return dealer_filename(dealer), buf.getvalue()
+
+
+def dealer_filename(dealer) -> str:
+    name = dealer.get("slug") or dealer.get("subdomain") or dealer["dealership_name"]
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") + "-overview.docx"
+
+
 # ============================================================
-# DOCUMENT CONTENT
+# DEALERS
 # ============================================================
 
-# Title
-title = doc.add_heading('Dealer Site Pro', level=0)
-title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-subtitle = doc.add_paragraph()
-subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-run = subtitle.add_run('Client-Facing Overview')
-run.font.size = Pt(16)
-run.font.color.rgb = RGBColor(0x66, 0x66, 0x66)
-
-add_line()
-
-# --- What is Dealer Site Pro? ---
-add_heading('What is Dealer Site Pro?')
-add_para('Dealer Site Pro is a website builder platform designed exclusively for Indian automotive dealerships. It allows any dealer \u2014 whether they sell cars, bikes, or auto-rickshaws \u2014 to launch a fully functional, professional website without writing a single line of code.')
-
-add_line()
-
-# --- The Problem It Solves ---
-add_heading('The Problem It Solves')
-add_para('Most small and mid-size dealerships in India either have no website at all, or rely on outdated, expensive ones built by agencies. They lose customers to competitors who show up on Google. They manage leads on paper or WhatsApp. They have no online presence for their inventory.')
-add_para('Dealer Site Pro fixes all of this in one platform.')
-
-add_line()
-
-# --- How It Works ---
-add_heading('How It Works (Dealer Journey)')
-add_numbered('Sign up ', 'Step 1: ')
-add_numbered('Walk through a guided setup (5-6 steps) \u2014 enter dealership details, pick brands you sell, choose services you offer, select a design template, customize your homepage', 'Step 2: ')
-add_numbered('Go live \u2014 get a free website instantly at yourname.indrav.in', 'Step 3: ')
-add_numbered('Manage everything from a single dashboard \u2014 inventory, leads, reviews, bookings, analytics', 'Step 4: ')
-add_para('')
-add_para('That\u2019s it. No developers, no hosting bills, no maintenance headaches.')
-
-add_line()
-
-# --- What Dealers Get ---
-add_heading('What Dealers Get')
-
-add_heading('A. A Professional Public Website', level=2)
-add_bullet('Vehicle catalog with search and filters (by brand, price, fuel type, body type)')
-add_bullet('Individual vehicle pages with full specs, photos, and pricing')
-add_bullet('Built-in tools for customers \u2014 EMI calculator, on-road price estimator, insurance quotes')
-add_bullet('Contact form, test drive booking, service appointment booking')
-add_bullet('Customer reviews section')
-add_bullet('Fully mobile-responsive and SEO-optimized (shows up on Google)')
-add_bullet('4 design themes to choose from \u2014 Sporty, Modern, Family, Luxury')
-add_bullet('Official brand colors applied automatically (Maruti blue, Tata teal, etc.)')
-
-add_heading('B. A Complete Dealer Dashboard', level=2)
-add_bullet(' \u2014 Add vehicles manually, look up details via RC number, upload photos, save drafts, mark as sold/reserved', 'Inventory Management')
-add_bullet(' \u2014 Every inquiry, test drive request, and quote gets tracked with priority levels (hot/warm/cold) and status (new/contacted/converted/lost)', 'Lead Management (CRM)')
-add_bullet(' \u2014 Collect, moderate, and reply to customer reviews. Sync reviews from Google.', 'Reviews')
-add_bullet(' \u2014 All contact form submissions in one inbox', 'Messages')
-add_bullet(' \u2014 Manage test drive and service appointments', 'Bookings')
-add_bullet(' \u2014 Customers can submit their vehicle for sale or exchange', 'Sell/Exchange Requests')
-add_bullet(' \u2014 Create and manage special deals', 'Offers & Promotions')
-add_bullet(' \u2014 Track page views, unique visitors, leads generated, traffic sources, and conversions', 'Analytics')
-add_bullet(' \u2014 Send browser notifications to website visitors', 'Push Notifications')
-add_bullet(' \u2014 Start with a free subdomain, upgrade to your own custom domain anytime', 'Domain Management')
-
-add_heading('C. Vehicle Type Support', level=2)
-add_bullet(' \u2014 New cars, used cars, certified pre-owned', '4-Wheelers (Cars)')
-add_bullet(' \u2014 New, used, electric', '2-Wheelers (Bikes & Scooters)')
-add_bullet(' \u2014 Passenger, cargo, electric', '3-Wheelers (Auto-rickshaws)')
-add_bullet('Each category has its own dedicated pages, catalog data, and management tools')
-
-add_heading('D. Pre-Loaded Vehicle Data', level=2)
-add_bullet('Thousands of vehicle models already in the system with specs, images, colors, and pricing')
-add_bullet('Dealers just select what they sell \u2014 no need to enter data from scratch')
-add_bullet('Covers all major Indian brands (Maruti Suzuki, Hyundai, Tata, Mahindra, Honda, Hero, Bajaj, TVS, Piaggio, and many more)')
-
-add_line()
-
-# --- APIs & Integrations ---
-add_heading('APIs & Integrations \u2014 What Powers the Platform')
-
-add_heading('Vehicle Verification APIs', level=2)
-add_table(
-    ['API', 'What It Does'],
-    [
-        ['RC Number Lookup (Surepass)', 'Enter a vehicle registration number \u2192 instantly get owner name, make/model, fuel type, engine/chassis number, insurance status, fitness expiry, and pending challans. Costs \u20b93 per lookup, tracked via credit system. Results cached for 24 hours.'],
-        ['VIN Decoder (NHTSA)', 'Enter a VIN number \u2192 get make, model, year, fuel type decoded automatically'],
-        ['Draft Vehicle Creation', 'RC lookup data auto-fills a draft vehicle listing. Dealer just adds photos and price to publish. Duplicate RC detection built in.'],
-    ]
-)
-
-add_heading('Inventory Management APIs', level=2)
-add_table(
-    ['API', 'What It Does'],
-    [
-        ['Manual Vehicle CRUD', 'Add, edit, delete vehicles with full details \u2014 make, model, variant, year, price, mileage, color, condition, photos'],
-        ['Image Upload', 'Upload vehicle photos to cloud storage with CDN delivery'],
-        ['Cyepro DMS Sync', 'Import inventory directly from Cyepro dealer management system. Server-side proxy with pagination, filtering, and price mapping. Includes diagnostic/test endpoint.'],
-        ['AI Description Generator', 'Uses Claude AI to auto-generate professional vehicle listing descriptions from specs. Rate-limited, input-sanitized.'],
-        ['Used Vehicle Price Offers', 'Set custom pricing on used vehicles from any source (manual or Cyepro)'],
-    ]
-)
-
-add_heading('Lead & CRM APIs', level=2)
-add_table(
-    ['API', 'What It Does'],
-    [
-        ['Lead Submission', 'Captures inquiries from dealer website. 5-minute duplicate detection. Auto-notifies dealer via SMS and email. Auto-forwards to Cyepro CRM if configured.'],
-        ['Test Drive Booking', 'Customers book test drives with preferred date/time. Creates both lead and booking records.'],
-        ['Lead Management', 'List, filter, and update lead status (new \u2192 contacted \u2192 qualified \u2192 converted \u2192 lost) with priority tracking'],
-    ]
-)
-
-add_heading('Service & Booking APIs', level=2)
-add_table(
-    ['API', 'What It Does'],
-    [
-        ['Car Service Booking', 'Customers book service appointments \u2014 general service, body repair, AC service, etc. Supports home pickup. Rate-limited.'],
-        ['2W/3W Service Booking', 'Dedicated service booking for bikes and autos'],
-        ['Service Centers', 'Manage multiple service center locations with working hours, images, and pricing tiers'],
-    ]
-)
-
-add_heading('Customer Engagement APIs', level=2)
-add_table(
-    ['API', 'What It Does'],
-    [
-        ['Review Submission', 'Customers submit reviews (rate-limited to 5/day per IP). Auto-approve or manual moderation.'],
-        ['Review Moderation', 'Dealers approve/reject/flag reviews, reply to them, feature best ones on homepage'],
-        ['Google Review Sync', 'Import reviews from Google Maps/Places automatically using Place ID'],
-        ['Sell/Exchange Requests', 'Customers submit their vehicle for sale \u2014 with photos, expected price, preferred inspection slot. Auto-emails confirmation. When dealer approves, auto-creates inventory listing.'],
-        ['Customer Panel', 'Customers look up their history (inquiries, test drives, sell requests) by phone/email'],
-        ['Push Notifications', 'Subscribe visitors to web push. Dealers broadcast notifications (new arrivals, price drops, announcements).'],
-    ]
-)
-
-add_heading('Payment & Subscription APIs', level=2)
-add_table(
-    ['API', 'What It Does'],
-    [
-        ['Razorpay Subscription', 'Create subscriptions for Pro/Premium plans. Handles trial periods.'],
-        ['Payment Verification', 'Verify Razorpay payments with signature validation. Idempotent \u2014 prevents duplicate charges.'],
-        ['Vehicle Booking Payments', 'Customers pay booking amounts online for 2W/3W vehicles. Order creation + payment verification.'],
-        ['Razorpay Webhooks', 'Handles subscription lifecycle events \u2014 activated, charged, cancelled, payment failed. Deduplication built in.'],
-    ]
-)
-
-add_heading('Domain Management APIs', level=2)
-add_table(
-    ['API', 'What It Does'],
-    [
-        ['Subdomain Creation', 'Auto-generates a free subdomain from business name + city'],
-        ['Custom Domain Connect', 'Connect your own domain. Registers on Vercel. Returns DNS records to configure.'],
-        ['DNS Verification', 'Verify A and CNAME records are configured correctly. Saves verification history.'],
-        ['Domain Search', 'Search available domains for purchase (Premium tier)'],
-        ['Domain Monitoring', 'Cron job checks SSL certificates and domain expiry every 12 hours'],
-        ['Domain Resolution', 'Edge middleware resolves subdomain/custom domain to dealer slug with Redis caching'],
-    ]
-)
-
-add_heading('Marketplace & Social APIs', level=2)
-add_table(
-    ['API', 'What It Does'],
-    [
-        ['Cross-Dealer Marketplace', 'Search across all dealers\u2019 inventory \u2014 filter by make, fuel, condition, body type, price, location'],
-        ['Social Media Auto-Post', 'Auto-post vehicle listings to Facebook Page, Instagram Business, and Twitter/X'],
-    ]
-)
-
-add_heading('Auth & Account APIs', level=2)
-add_table(
-    ['API', 'What It Does'],
-    [
-        ['OTP Login', 'Send OTP to email for passwordless authentication. Rate-limited.'],
-        ['Registration Check', 'Verify email/phone availability before signup'],
-        ['Account Deletion', 'GDPR-compliant account deletion with PII anonymization'],
-    ]
-)
-
-add_heading('Admin & System APIs', level=2)
-add_table(
-    ['API', 'What It Does'],
-    [
-        ['Admin Dashboard', 'List all dealers, manage catalog, deploy templates'],
-        ['Template Deployment', 'Push template + brand updates to dealer sites with ISR revalidation'],
-        ['Health Check', 'Monitor Supabase, Razorpay, Vercel connectivity'],
-        ['API Credit Tracking', 'Track per-dealer API usage and costs (RC lookups, etc.)'],
-    ]
-)
-
-add_heading('Utility APIs', level=2)
-add_table(
-    ['API', 'What It Does'],
-    [
-        ['Finance Pre-Check', 'Redirect to finance partner for loan eligibility'],
-        ['FASTag Recharge', 'Redirect to FASTag recharge partner'],
-        ['Brand Catalog', 'Get models for specific make with preview data'],
-    ]
-)
-
-add_line()
-
-# --- External Service Integrations ---
-add_heading('External Service Integrations')
-add_table(
-    ['Service', 'Purpose'],
-    [
-        ['Supabase', 'Database (PostgreSQL), Auth, Storage, Edge Functions'],
-        ['Razorpay', 'Payments, subscriptions, webhooks'],
-        ['Surepass', 'RC number lookup, challan status'],
-        ['Rapidor', 'RC lookup fallback provider'],
-        ['NHTSA', 'VIN number decoding'],
-        ['Cyepro DMS', 'Dealer management system inventory sync'],
-        ['Claude AI (Anthropic)', 'Vehicle description generation'],
-        ['Cloudflare', 'DNS management, domain verification'],
-        ['GoDaddy', 'Domain registration'],
-        ['Vercel', 'Hosting, deployment, edge functions'],
-        ['Upstash Redis', 'Domain caching, rate limiting'],
-        ['Google Places', 'Review sync from Google Maps'],
-        ['Meta Graph API', 'Facebook & Instagram posting'],
-        ['Twitter/X API', 'Twitter posting'],
-        ['Resend', 'Transactional emails'],
-        ['Sentry', 'Error monitoring'],
-        ['Google Maps', 'Location embedding'],
-    ]
-)
-
-add_line()
-
-# --- API Statistics ---
-add_heading('API Statistics')
-add_bullet('85+ API endpoints')
-add_bullet('3 vehicle categories with dedicated APIs each')
-add_bullet('12+ external service integrations')
-add_bullet('Rate limiting on all critical endpoints')
-add_bullet('Redis caching for performance')
-add_bullet('Idempotency on payment operations')
-add_bullet('Credit tracking for paid API calls')
-add_bullet('JWT authentication on all protected routes')
-add_bullet('Row-level security \u2014 dealers only access their own data')
-
-add_line()
-
-# --- Payment & Pricing Model ---
-add_heading('Payment & Pricing Model')
-add_bullet('Dealers can start with a free plan (subdomain website with core features)')
-add_bullet('Upgrade to Pro/Premium/Enterprise for custom domains, advanced analytics, and priority support')
-add_bullet('RC lookups charged at \u20b93 per call with usage dashboard')
-add_bullet('Vehicle booking payments collected online')
-add_bullet('All payments processed securely through Razorpay with webhook-based lifecycle management')
-
-add_line()
-
-# --- Why Dealers Should Use This ---
-add_heading('Why Dealers Should Use This')
-add_table(
-    ['Without Dealer Site Pro', 'With Dealer Site Pro'],
-    [
-        ['No website or an outdated one', 'Professional site live in minutes'],
-        ['Leads tracked on paper/WhatsApp', 'Full CRM with priority & status tracking'],
-        ['No online inventory', 'Searchable catalog with filters & photos'],
-        ['Customers can\u2019t find you on Google', 'SEO-optimized pages that rank locally'],
-        ['Pay agencies lakhs for a basic site', 'Start free, upgrade when ready'],
-        ['Separate tools for everything', 'One dashboard for inventory, leads, reviews, analytics'],
-        ['No customer engagement tools', 'EMI calculator, test drive booking, push notifications'],
-        ['Manual vehicle data entry', 'RC lookup auto-fills details in seconds'],
-        ['Can\u2019t verify vehicle history', 'Surepass shows challans, insurance, fitness status'],
-        ['No social media presence', 'Auto-post listings to Facebook, Instagram, Twitter'],
-        ['No analytics', 'Track views, leads, conversions, traffic sources'],
-    ]
-)
-
-add_line()
-
-# --- Technical Highlights ---
-add_heading('Key Technical Highlights (For Technical Stakeholders)')
-add_bullet('Built on modern web stack \u2014 Next.js, Supabase, TypeScript')
-add_bullet('Multi-tenant architecture \u2014 one platform serves unlimited dealers')
-add_bullet('Server-rendered pages for fast loading and SEO')
-add_bullet('Edge caching for instant domain resolution')
-add_bullet('Row-level security \u2014 each dealer only sees their own data')
-add_bullet('Integrates with Surepass (RC verification), Razorpay (payments), Cloudflare (DNS), and Cyepro (DMS)')
-add_bullet('40+ database tables, 85+ API endpoints, 142 UI components')
-
-add_line()
-
-# --- In One Line ---
-add_heading('In One Line')
-p = doc.add_paragraph()
-run = p.add_run('Dealer Site Pro is the Shopify for Indian car, bike, and auto dealerships \u2014 everything a dealer needs to get online, manage inventory, capture leads, and grow their business, all from one platform.')
-run.bold = True
-run.font.size = Pt(12)
-
-# Save
-output_path = r"C:\Users\Ravi Abhinav\Desktop\dealer-site-pro\docs\Dealer-Site-Pro-Client-Overview.docx"
-doc.save(output_path)
-print(f"Saved to {output_path}")
+def fetch_dealers(only=None) -> list:
+    """Onboarded, active dealers with their brands and services (PostgREST embedding)."""
+    headers = AUTH
+    dealers, offset = [], 0
+    while True:
+        url = (f"{SUPABASE_URL}/rest/v1/dealers"
+               f"?select=id,dealership_name,location,subdomain,slug,style_template,"
+               f"dealer_brands(brand_name,is_primary),dealer_services(service_name,is_active)"
+               f"&onboarding_complete=eq.true&is_active=eq.true&order=created_at"
+               f"&limit={PAGE_SIZE}&offset={offset}")
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=60) as resp:
+            rows = json.loads(resp.read())
+        for row in rows:
+            dealers.append({
+                **{k: row.get(k) for k in ("id", "dealership_name", "location", "subdomain", "slug", "style_template")},
+                "brands": row.get("dealer_brands") or [],
+                "services": [s["service_name"] for s in row.get("dealer_services") or [] if s.get("is_active", True)],
+            })
+        if len(rows) < PAGE_SIZE:
+            break
+        offset += PAGE_SIZE
+    return [d for d in dealers if not only or d.get("slug") in only or d.get("subdomain") in only]
+
+
+def load_dealers(path: Path, only=None) -> list:
+    """JSON list in fetch_dealers() shape (brands: [{brand_name, is_primary}], services: [name])."""
+    dealers = json.loads(path.read_text())
+    return [d for d in dealers if not only or d.get("slug") in only or d.get("subdomain") in only]
+
+
+def render_all(dealers, template: bytes, out_dir: Path = None, zip_path: Path = None, workers: int = WORKERS):
+    """Render across a process pool, writing each document as soon as it is ready."""
+    archive = zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) if zip_path else None  # .docx is already deflated
+    if out_dir:
+        out_dir.mkdir(parents=True, exist_ok=True)
+    written, start = 0, time.time()
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(template,)) as pool:
+            for name, data in pool.map(render_dealer, dealers, chunksize=8):
+                if archive:
+                    archive.writestr(name, data)
+                else:
+                    tmp = out_dir / f".{name}.tmp"
+                    tmp.write_bytes(data)
+                    tmp.replace(out_dir / name)
+                written += 1
+                if written % 100 == 0:
+                    print(f"  {written}/{len(dealers)} ({written / (time.time() - start):.0f} docs/s)")
+    finally:
+        if archive:
+            archive.close()
+    print(f"  Rendered {written} overviews in {time.time() - start:.1f}s \u2192 {zip_path or out_dir}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the Dealer Site Pro client overview (generic or per dealer)")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--all", action="store_true", help="Every onboarded dealer from Supabase")
+    source.add_argument("--dealers", type=Path, metavar="JSON", help="Dealers from a JSON file instead of Supabase")
+    parser.add_argument("--only", action="append", metavar="SLUG", help="Limit to these dealer slugs/subdomains")
+    parser.add_argument("--out", type=Path, default=DEALER_OUTPUT, help="Directory for per-dealer documents")
+    parser.add_argument("--zip", type=Path, help="Write per-dealer documents into this zip instead")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    args = parser.parse_args()
+
+    template = build_template()
+    if not (args.all or args.dealers):
+        from docx import Document
+
+        GENERIC_OUTPUT.parent.mkdir(parents=True, exist_ok=True)
+        doc = Document(io.BytesIO(template))
+        anchor = next(p for p in doc.paragraphs if p.text == DEALER_ANCHOR)._p
+        anchor.getparent().remove(anchor)
+        doc.save(GENERIC_OUTPUT)
+        print(f"Saved to {GENERIC_OUTPUT}")
+        return
+
+    if args.all and not SERVICE_KEY:
+        parser.error("--all needs SUPABASE_SERVICE_ROLE_KEY")
+    dealers = load_dealers(args.dealers, args.only) if args.dealers else fetch_dealers(args.only)
+    print(f"  Dealers: {len(dealers)}  Workers: {args.workers}")
+    if dealers:
+        render_all(dealers, template, None if args.zip else args.out, args.zip, args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+#!/usr/bin/env python3
+"""
+image_qa.py
+
+One QA pass over every car image: each file is read and decoded once, and
+all metrics come from that single decode:
+
+  - width / height / bytes / format
+  - background class from border pixels (same rule as detect_non_white_bg.py)
+  - 16×16 average hash (same as dedupe_4w_gallery_metadata.py) + sha256
+  - sharpness: variance of the Laplacian on a ≤512 px greyscale copy
+  - truncation / decode errors (full decode, not just the header)
+
+Writes one report (scripts/image_qa_report.json). The older outputs are
+views of it: --legacy also rewrites scripts/low_quality_images.json and
+scripts/non_white_bg_images.json in their existing formats, and
+find_low_quality.py / detect_non_white_bg.py now derive from this module.
+
+Usage:
+  python3 scripts/image_qa.py                 # all categories
+  python3 scripts/image_qa.py 2w 3w --legacy
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
+
+PROJECT_ROOT = Path(__file__).parent.parent
+REPORT_JSON  = Path(__file__).parent / "image_qa_report.json"
+LOW_QUALITY_JSON = Path(__file__).parent / "low_quality_images.json"
+NON_WHITE_JSON   = Path(__file__).parent / "non_white_bg_images.json"
+
+DIRS = {
+    "4w": PROJECT_ROOT / "public" / "assets" / "cars",
+    "4w-new": PROJECT_ROOT / "public" / "data" / "brand-model-images" / "4w",
+    "2w": PROJECT_ROOT / "public" / "data" / "brand-model-images" / "2w",
+    "3w": PROJECT_ROOT / "public" / "data" / "brand-model-images" / "3w",
+    "4w-gallery": PROJECT_ROOT / "public" / "data" / "brand-model-images" / "4w-galleries",
+}
+EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp", ".avif")
+WORKERS    = os.cpu_count() or 4
+
+# Low quality (find_low_quality.py)
+MIN_WIDTH, MIN_HEIGHT, MIN_KB = 600, 400, 30
+# Background (detect_non_white_bg.py)
+WHITE_THRESHOLD = 220
+SAMPLE_SIZE     = 15
+# Sharpness: Laplacian variance below this on the ≤512 px copy looks soft
+SHARPNESS_MIN   = 40.0
+SHARPNESS_SIDE  = 512
+HASH_SIZE       = 16
+
+
+# ── Metrics on one decoded image ─────────────────────────────────────────────
+
+def _border_sample(rgb: "np.ndarray") -> "np.ndarray":
+    """
+    The pixels detect_non_white_bg.py sampled: four SAMPLE_SIZE² corner
+    blocks plus a diagonal run through each edge midpoint (coordinates
+    clamped, duplicates kept). Returns an (n, 3) array.
+    """
+    import numpy as np
+
+    h, w = rgb.shape[:2]
+    s = SAMPLE_SIZE
+    span = np.arange(min(s, w)), np.arange(min(s, h))
+    xs, ys = [], []
+    for x0, y0 in ((0, 0), (w - s, 0), (0, h - s), (w - s, h - s)):
+        gx, gy = np.meshgrid(np.clip(x0 + span[0], 0, w - 1), np.clip(y0 + span[1], 0, h - 1), indexing="ij")
+        xs.append(gx.ravel())
+        ys.append(gy.ravel())
+    offsets = np.arange(-s, s)
+    for x, y in ((w // 2, 0), (w // 2, h - 1), (0, h // 2), (w - 1, h // 2)):
+        xs.append(np.clip(x + offsets, 0, w - 1))
+        ys.append(np.clip(y + offsets, 0, h - 1))
+    return rgb[np.concatenate(ys), np.concatenate(xs)]
+
+
+def background(rgb: "np.ndarray") -> dict:
+    import numpy as np
+
+    h, w = rgb.shape[:2]
+    if w < 10 or h < 10:
+        return {"class": "too_small", "avg_rgb": [0, 0, 0], "white_pct": 0.0}
+    pixels = _border_sample(rgb).astype(np.float64)
+    avg = pixels.mean(axis=0)
+    white_pct = float((pixels >= WHITE_THRESHOLD).all(axis=1).mean() * 100)
+    if (avg >= WHITE_THRESHOLD).all():
+        cls = "white"
+    elif (avg >= 200).all() and white_pct >= 40:
+        cls = "light"  # light grey studio shots count as white
+    else:
+        cls = "non-white"
+    return {"class": cls, "avg_rgb": avg.tolist(), "white_pct": white_pct}
+
+
+def average_hash(gray: "Image.Image") -> str:
+    import numpy as np
+
+    pixels = np.asarray(gray.resize((HASH_SIZE, HASH_SIZE)), dtype=np.float64).ravel()
+    bits = "".join("1" if p >= pixels.mean() else "0" for p in pixels)
+    return f"{int(bits, 2):0{HASH_SIZE * HASH_SIZE // 4}x}"
+
+
+def sharpness(gray: "Image.Image") -> float:
+    """Variance of the 4-neighbour Laplacian on a copy scaled to ≤SHARPNESS_SIDE px."""
+    import numpy as np
+
+    small = gray.copy()
+    small.thumbnail((SHARPNESS_SIDE, SHARPNESS_SIDE))
+    g = np.asarray(small, dtype=np.float64)
+    if g.shape[0] < 3 or g.shape[1] < 3:
+        return 0.0
+    lap = g[1:-1, :-2] + g[1:-1, 2:] + g[:-2, 1:-1] + g[2:, 1:-1] - 4 * g[1:-1, 1:-1]
+    return float(lap.var())
+
+
+def inspect(path: str) -> dict:
+    """All metrics for one file from a single read + decode."""
+    import numpy as np
+    from PIL import Image
+
+    data = Path(path).read_bytes()
+    row = {
+        "path": str(Path(path).relative_to(PROJECT_ROOT)),
+        "bytes": len(data),
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "error": None,
+    }
+    try:
+        img = Image.open(io.BytesIO(data))
+        row.update(format=img.format, width=img.width, height=img.height)
+        img.load()
+    except Exception as e:
+        row["error"] = f"{'truncated' if 'truncated' in str(e) else 'decode'}: {e}"
+        return row
+
+    if img.mode == "P" and "transparency" in img.info:
+        img = img.convert("RGBA")
+    rgb_img = img.convert("RGB")
+    gray = rgb_img.convert("L")
+    row["background"] = background(np.asarray(rgb_img))
+    row["ahash"] = average_hash(gray)
+    row["sharpness"] = round(sharpness(gray), 2)
+    return row
+
+
+# ── Run / report ─────────────────────────────────────────────────────────────
+
+def list_images(categories) -> "list[tuple[str, Path]]":
+    files = []
+    for cat in categories:
+        root = DIRS[cat]
+        if not root.exists():
+            print(f"  ⚠ {cat}: directory not found")
+            continue
+        files += [(cat, p) for p in sorted(root.rglob("*")) if p.suffix.lower() in EXTENSIONS]
+    return files
+
+
+def run_qa(categories=None, workers: int = WORKERS) -> dict:
+    categories = list(categories or DIRS)
+    files = list_images(categories)
+    print(f"  Inspecting {len(files)} images ({', '.join(categories)})...")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        rows = list(pool.map(inspect, [str(p) for _, p in files], chunksize=32))
+    for (cat, path), row in zip(files, rows):
+        rel = path.relative_to(DIRS[cat])
+        row.update(category=cat, brand=rel.parts[0] if len(rel.parts) > 1 else "", file=path.name)
+        row["flags"] = flags(row)
+
+    report = {
+        "categories": categories,
+        "thresholds": {
+            "min_width": MIN_WIDTH, "min_height": MIN_HEIGHT, "min_kb": MIN_KB,
+            "white_threshold": WHITE_THRESHOLD, "sharpness_min": SHARPNESS_MIN,
+        },
+        "summary": summarize(rows),
+        "images": rows,
+    }
+    return report
+
+
+def flags(row: dict) -> "list[str]":
+    if row["error"]:
+        return ["truncated" if row["error"].startswith("truncated") else "decode_error"]
+    out = []
+    if row["width"] < MIN_WIDTH or row["height"] < MIN_HEIGHT or row["bytes"] / 1024 < MIN_KB:
+        out.append("low_quality")
+    if row["background"]["class"] == "non-white":
+        out.append("non_white_bg")
+    if row["sharpness"] < SHARPNESS_MIN:
+        out.append("blurry")
+    return out
+
+
+def summarize(rows) -> dict:
+    counts = {}
+    for row in rows:
+        for flag in row.get("flags", flags(row)):
+            counts[flag] = counts.get(flag, 0) + 1
+    by_hash = {}
+    for row in rows:
+        if row.get("ahash"):
+            by_hash.setdefault(row["ahash"], []).append(row["path"])
+    return {
+        "images": len(rows),
+        "flags": counts,
+        "duplicate_ahash_groups": sum(1 for paths in by_hash.values() if len(paths) > 1),
+    }
+
+
+# ── Legacy views ─────────────────────────────────────────────────────────────
+
+def derive_low_quality(report: dict) -> dict:
+    """scripts/low_quality_images.json: 2W/3W low-res or small files, grouped by brand."""
+    grouped = {}
+    for row in report["images"]:
+        if row["category"] not in ("2w", "3w") or row["error"]:
+            continue
+        if Path(row["file"]).suffix.lower() not in (".png", ".jpg", ".jpeg", ".webp"):
+            continue
+        if "low_quality" in row["flags"]:
+            grouped.setdefault(row["brand"], []).append(row["path"])
+    return grouped
+
+
+def derive_non_white_bg(report: dict) -> list:
+    """scripts/non_white_bg_images.json: flagged jpg/png per brand+slug, first category wins."""
+    seen, out = set(), []
+    for row in report["images"]:
+        if row["category"] not in ("4w", "4w-new", "2w", "3w") or row["error"]:
+            continue
+        if Path(row["file"]).suffix.lower() not in (".jpg", ".jpeg", ".png"):
+            continue
+        bg = row["background"]
+        if bg["class"] in ("white", "light"):
+            continue
+        slug = Path(row["file"]).stem
+        key = f"{row['brand']}/{slug}"
+        if key in seen:
+            continue
+        seen.add(key)
+        r, g, b = bg["avg_rgb"]
+        reason = bg["class"] if bg["class"] == "too_small" else (
+            f"non-white (avg RGB: {r:.0f},{g:.0f},{b:.0f}, {bg['white_pct']:.0f}% white pixels)")
+        out.append({
+            "category": row["category"],
+            "brand": row["brand"],
+            "file": row["file"],
+            "slug": slug,
+            "path": row["path"],  # repo-relative, like low_quality_images.json
+            "reason": reason,
+            "avg_rgb": bg["avg_rgb"],
+        })
+    return out
+
+
+def write_legacy(report: dict):
+    categories = set(report["categories"])
+    if {"2w", "3w"} <= categories:
+        LOW_QUALITY_JSON.write_text(json.dumps(derive_low_quality(report), indent=2))
+    if {"4w", "4w-new", "2w", "3w"} <= categories:
+        NON_WHITE_JSON.write_text(json.dumps(derive_non_white_bg(report), indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Single-decode image QA report")
+    parser.add_argument("categories", nargs="*", metavar="CATEGORY",
+                        help=f"Subset of {', '.join(DIRS)} (default: all)")
+    parser.add_argument("--legacy", action="store_true",
+                        help="Also rewrite low_quality_images.json / non_white_bg_images.json")
+    parser.add_argument("--output", type=Path, default=REPORT_JSON)
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    args = parser.parse_args()
+    unknown = set(args.categories) - set(DIRS)
+    if unknown:
+        parser.error(f"unknown categories: {', '.join(sorted(unknown))}")
+
+    report = run_qa(args.categories, args.workers)
+    args.output.write_text(json.dumps(report, indent=1))
+    if args.legacy:
+        write_legacy(report)
+
+    summary = report["summary"]
+    print(f"  Images:  {summary['images']}")
+    for flag, count in sorted(summary["flags"].items()):
+        print(f"  {flag:<14} {count}")
+    print(f"  Near-duplicate groups (ahash): {summary['duplicate_ahash_groups']}")
+    print(f"  Report:  {args.output}")
+
+
+if __name__ == "__main__":
+    main()
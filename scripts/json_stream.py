@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+json_stream.py
+
+Incremental JSON reader for the large brand files in public/data.
+
+The reader walks a document token by token and only materializes the values
+the caller asks for, so peak memory stays proportional to the largest single
+value read (one variant) plus one read chunk — never the whole file.
+
+Usage:
+  from json_stream import JSONStreamReader
+
+  with path.open(encoding="utf-8") as fp:
+      reader = JSONStreamReader(fp)
+      for key in reader.iter_object():
+          if key == "items":
+              for item in reader.iter_values():
+                  ...
+          else:
+              reader.skip_value()
+"""
+
+import json
+
+CHUNK_SIZE = 64 * 1024
+_WHITESPACE = " \t\n\r"
+_SCALAR_END = _WHITESPACE + ",]}"
+_DECODER = json.JSONDecoder()
+
+
+class JSONStreamReader:
+    """
+    Pull-style reader over a text file object.
+
+    iter_object() yields each member key with the reader positioned on the
+    member value; iter_array() yields once per element positioned on it. The
+    caller must consume that value (read_value, skip_value, or a nested
+    iter_object/iter_array) before advancing the generator.
+    """
+
+    def __init__(self, fp, chunk_size: int = CHUNK_SIZE):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    # ── Buffer management ────────────────────────────────────────────────────
+
+    def _fill(self, size: int = 0) -> bool:
+        """Append at least one chunk to the buffer, dropping consumed text."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(max(size, self._chunk_size))
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _skip_ws(self):
+        while True:
+            buf, pos = self._buf, self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf) or not self._fill():
+                return
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ('' at end of input)."""
+        self._skip_ws()
+        return self._buf[self._pos] if self._pos < len(self._buf) else ""
+
+    def _expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buf, self._pos)
+        self._pos += 1
+
+    # ── Values ───────────────────────────────────────────────────────────────
+
+    def read_value(self):
+        """Decode and return the complete value at the current position."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Most likely the value straddles the end of the buffer; grow
+                # geometrically so a large value is not re-scanned per chunk.
+                if self._fill(len(self._buf) - self._pos):
+                    continue
+                raise
+            # A number (or literal) ending exactly at the buffer edge may be
+            # truncated — only trust it once more input or EOF is seen.
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+    def skip_value(self):
+        """
+        Consume the value at the current position without keeping it. Strings,
+        numbers and literals are scanned past, not decoded (nor validated).
+        """
+        char = self.peek()
+        if char == "{":
+            for _ in self.iter_object():
+                self.skip_value()
+        elif char == "[":
+            for _ in self.iter_array():
+                self.skip_value()
+        elif char == '"':
+            self._skip_string()
+        else:
+            while True:
+                buf, pos = self._buf, self._pos
+                while pos < len(buf) and buf[pos] not in _SCALAR_END:
+                    pos += 1
+                self._pos = pos
+                if pos < len(buf) or not self._fill():
+                    return
+
+    def _skip_string(self):
+        """Move past the string starting at the current position (an unescaped closing quote)."""
+        search = self._pos + 1
+        while True:
+            buf = self._buf
+            end = buf.find('"', search)
+            while end != -1:
+                backslashes = 0
+                while buf[end - 1 - backslashes] == "\\":
+                    backslashes += 1
+                if backslashes % 2 == 0:
+                    self._pos = end + 1
+                    return
+                end = buf.find('"', end + 1)
+            scanned = len(buf) - self._pos
+            if not self._fill():
+                raise json.JSONDecodeError("Unterminated string", self._buf, self._pos)
+            search = scanned  # _fill moved the opening quote to index 0
+
+    # ── Containers ───────────────────────────────────────────────────────────
+
+    def iter_object(self):
+        """Yield member keys of the object at the current position."""
+        self._expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise json.JSONDecodeError("Expecting property name", self._buf, self._pos)
+            key = self.read_value()
+            self._expect(":")
+            yield key
+            sep = self.peek()
+            self._pos += 1
+            if sep == "}":
+                return
+            if sep != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buf, self._pos - 1)
+
+    def iter_array(self):
+        """Yield once per element of the array at the current position."""
+        self._expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield
+            sep = self.peek()
+            self._pos += 1
+            if sep == "]":
+                return
+            if sep != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buf, self._pos - 1)
+
+    def iter_values(self):
+        """Yield each decoded element of the array at the current position."""
+        for _ in self.iter_array():
+            yield self.read_value()
@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+local_supabase.py
+
+A small local stand-in for the parts of Supabase the media scripts talk to,
+so storage tooling can be exercised without touching production:
+
+  Storage    GET | POST  /storage/v1/bucket                  (POST {id|name, public} creates one)
+             GET         /storage/v1/bucket/{bucket}
+             POST        /storage/v1/object/list/{bucket}    {prefix, limit, offset}
+             GET | HEAD  /storage/v1/object/public/{bucket}/{key}  (ETag / If-None-Match, Range)
+             GET | HEAD  /storage/v1/object/authenticated/{bucket}/{key}
+             POST | PUT  /storage/v1/object/{bucket}/{key}   (x-upsert)
+             DELETE      /storage/v1/object/{bucket}         {prefixes: [...]}
+             POST        /storage/v1/object/move             {bucketId, sourceKey, destinationKey}
+  PostgREST  GET         /rest/v1/car_catalog?select=…&{col}=eq.…&limit=&offset=
+             PATCH       /rest/v1/car_catalog?{col}=eq.…     (Prefer: return=representation)
+
+Objects are plain files under --root/{bucket}/{key}; every top-level
+directory of --root is a bucket. car_catalog rows are read from a JSON list
+(--catalog); PATCHes change them in memory. Point a script at it through
+SUPABASE_URL.
+
+Network conditions are simulated per request, so throughput changes can be
+measured reproducibly without production: --latency-ms (+ --jitter-ms) before
+each response, --bandwidth capping request and response bodies per
+connection, and --error-rate answering that share of requests with an
+injected 429/5xx (429 carries Retry-After). Fault draws come from a seeded
+generator (--seed).
+
+Usage:
+  python3 scripts/local_supabase.py --root /tmp/supabase --catalog rows.json
+  python3 scripts/local_supabase.py --root /tmp/supabase --latency-ms 40 --bandwidth 2M --error-rate 0.02
+  SUPABASE_URL=http://127.0.0.1:54321 python3 scripts/storage_gc.py
+"""
+
+import argparse
+import fnmatch
+import json
+import mimetypes
+import random
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+DEFAULT_PORT = 54321
+CHUNK        = 64 * 1024   # body bytes per write/read when bandwidth is capped
+
+
+# ── PostgREST filters ────────────────────────────────────────────────────────
+
+def _like(value, pattern: str, fold: bool = False) -> bool:
+    if value is None:
+        return False
+    pattern = pattern.replace("%", "*")  # PostgREST accepts both
+    return fnmatch.fnmatchcase(str(value).lower() if fold else str(value), pattern.lower() if fold else pattern)
+
+
+def row_matches(row: dict, column: str, expr: str) -> bool:
+    """One PostgREST filter (eq, neq, like, ilike, in, is, with not. prefix) against a row."""
+    if expr.startswith("not."):
+        return not row_matches(row, column, expr[4:])
+    op, _, arg = expr.partition(".")
+    value = row.get(column)
+    if op == "eq":
+        return value is not None and str(value) == arg
+    if op == "neq":
+        return value is not None and str(value) != arg
+    if op == "like":
+        return _like(value, arg)
+    if op == "ilike":
+        return _like(value, arg, fold=True)
+    if op == "in":
+        return value is not None and str(value) in [v.strip('"') for v in arg.strip("()").split(",")]
+    if op == "is":
+        return {"null": value is None, "true": value is True, "false": value is False}.get(arg, False)
+    raise ValueError(f"unsupported filter: {column}={expr}")
+
+
+def query_rows(rows: list, params: "list[tuple[str, str]]") -> list:
+    """Apply filters, order, offset/limit and select to rows (query params in order)."""
+    select, limit, offset, order = None, None, 0, None
+    for key, value in params:
+        if key == "select":
+            select = [c.strip() for c in value.split(",") if c.strip()]
+        elif key == "limit":
+            limit = int(value)
+        elif key == "offset":
+            offset = int(value)
+        elif key == "order":
+            order = value
+        else:
+            rows = [r for r in rows if row_matches(r, key, value)]
+    if order:
+        column, _, direction = order.partition(".")
+        rows = sorted(rows, key=lambda r: (r.get(column) is None, r.get(column)), reverse=direction == "desc")
+    rows = rows[offset:None if limit is None else offset + limit]
+    if select and select != ["*"]:
+        rows = [{c: r.get(c) for c in select} for r in rows]
+    return rows
+
+
+def update_rows(rows: list, params: "list[tuple[str, str]]", changes: dict) -> list:
+    """PATCH semantics: apply changes to every row matching all filters; returns the updated rows."""
+    filters = [(k, v) for k, v in params if k not in ("select", "limit", "offset", "order")]
+    updated = []
+    for row in rows:
+        if all(row_matches(row, column, expr) for column, expr in filters):
+            row.update(changes)
+            updated.append(row)
+    return updated
+
+
+# ── Network conditions ───────────────────────────────────────────────────────
+
+def parse_rate(value: str) -> int:
+    """'2M' / '512k' / '1000000' → bytes per second."""
+    units = {"k": 1024, "m": 1024 ** 2, "g": 1024 ** 3}
+    value = value.strip().lower().rstrip("b/s")
+    if value and value[-1] in units:
+        return int(float(value[:-1]) * units[value[-1]])
+    return int(value)
+
+
+class Conditions:
+    """Latency, bandwidth cap and fault injection applied to every request."""
+
+    def __init__(self, latency_ms: float = 0, jitter_ms: float = 0, bandwidth: int = 0,
+                 error_rate: float = 0.0, error_statuses=(429, 503), retry_after: int = 1, seed: int = 0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.injected = 0
+
+    def delay(self) -> float:
+        with self._lock:
+            jitter = self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        return (self.latency_ms + jitter) / 1000
+
+    def fault(self) -> "int | None":
+        """Status to answer with instead of handling the request, or None."""
+        with self._lock:
+            self.requests += 1
+            if self.error_rate and self._rng.random() < self.error_rate:
+                self.injected += 1
+                return self._rng.choice(self.error_statuses)
+        return None
+
+    def transfer_seconds(self, nbytes: int) -> float:
+        return nbytes / self.bandwidth if self.bandwidth else 0.0
+
+
+# ── Storage ──────────────────────────────────────────────────────────────────
+
+def object_info(path: Path, name: str) -> dict:
+    stat = path.stat()
+    modified = datetime.fromtimestamp(stat.st_mtime, timezone.utc).isoformat().replace("+00:00", "Z")
+    return {
+        "name": name,
+        "id": f"{stat.st_ino:x}",
+        "updated_at": modified,
+        "created_at": modified,
+        "last_accessed_at": modified,
+        "metadata": {
+            "eTag": f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"',
+            "size": stat.st_size,
+            "mimetype": mimetypes.guess_type(name)[0] or "application/octet-stream",
+            "cacheControl": "max-age=3600",
+            "lastModified": modified,
+            "contentLength": stat.st_size,
+            "httpStatusCode": 200,
+        },
+    }
+
+
+class Handler(BaseHTTPRequestHandler):
+    server: "LocalSupabase"
+
+    def log_message(self, *args):
+        if self.server.verbose:
+            super().log_message(*args)
+
+    def _reply(self, status: int, body=b"", content_type: str = "application/json", headers=None):
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if body and self.command != "HEAD":
+            self._write(body)
+
+    def _error(self, status: int, message: str, headers=None):
+        self._reply(status, {"statusCode": str(status), "error": message, "message": message}, headers=headers)
+
+    def _write(self, data: bytes):
+        conditions = self.server.conditions
+        if not conditions.bandwidth:
+            return self.wfile.write(data)
+        for start in range(0, len(data), CHUNK):
+            chunk = data[start:start + CHUNK]
+            self.wfile.write(chunk)
+            time.sleep(conditions.transfer_seconds(len(chunk)))
+
+    def _body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return b""
+        data = self.rfile.read(length)
+        time.sleep(self.server.conditions.transfer_seconds(length))
+        return data
+
+    def _simulate(self) -> bool:
+        """Apply latency; answer with an injected fault instead when one is drawn. True if handled."""
+        conditions = self.server.conditions
+        delay = conditions.delay()
+        if delay:
+            time.sleep(delay)
+        status = conditions.fault()
+        if status is None:
+            return False
+        self._body()  # drain, so the connection stays usable
+        headers = {"Retry-After": str(conditions.retry_after)} if status == 429 else None
+        self._error(status, "injected fault", headers)
+        return True
+
+    def _object_path(self, bucket: str, key: str) -> "Path | None":
+        root = self.server.root
+        path = (root / bucket / key).resolve()
+        if root.resolve() not in path.parents or not (root / bucket).is_dir():
+            return None
+        return path
+
+    # ── Routes ────────────────────────────────────────────────────────────────
+
+    def do_GET(self):
+        if self._simulate():
+            return
+        parsed = urllib.parse.urlsplit(self.path)
+        path = urllib.parse.unquote(parsed.path)
+        if path == "/storage/v1/bucket":
+            buckets = sorted(p.name for p in self.server.root.iterdir() if p.is_dir())
+            return self._reply(200, [{"id": b, "name": b, "public": True} for b in buckets])
+        if path.startswith("/storage/v1/bucket/"):
+            bucket = path[len("/storage/v1/bucket/"):].strip("/")
+            if "/" in bucket or not (self.server.root / bucket).is_dir():
+                return self._error(404, "Bucket not found")
+            return self._reply(200, {"id": bucket, "name": bucket, "public": True})
+        for prefix in ("/storage/v1/object/public/", "/storage/v1/object/authenticated/"):
+            if path.startswith(prefix):
+                return self._serve_object(path[len(prefix):])
+        if path.startswith("/rest/v1/car_catalog"):
+            params = urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+            try:
+                with self.server.lock:
+                    rows = query_rows(self.server.catalog, params)
+            except ValueError as e:
+                return self._error(400, str(e))
+            return self._reply(200, rows)
+        self._error(404, "not found")
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        if self._simulate():
+            return
+        path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        if path == "/storage/v1/bucket":
+            return self._create_bucket(json.loads(self._body() or b"{}"))
+        if path.startswith("/storage/v1/object/list/"):
+            return self._list(path[len("/storage/v1/object/list/"):], json.loads(self._body() or b"{}"))
+        if path == "/storage/v1/object/move":
+            return self._move(json.loads(self._body() or b"{}"))
+        if path.startswith("/storage/v1/object/"):
+            return self._upload(path[len("/storage/v1/object/"):])
+        self._error(404, "not found")
+
+    do_PUT = do_POST
+
+    def do_PATCH(self):
+        if self._simulate():
+            return
+        parsed = urllib.parse.urlsplit(self.path)
+        if not urllib.parse.unquote(parsed.path).startswith("/rest/v1/car_catalog"):
+            return self._error(404, "not found")
+        params = urllib.parse.parse_qsl(parsed.query, keep_blank_values=True)
+        try:
+            changes = json.loads(self._body() or b"{}")
+            with self.server.lock:
+                updated = update_rows(self.server.catalog, params, changes)
+                representation = [dict(row) for row in updated]
+        except ValueError as e:
+            return self._error(400, str(e))
+        if "return=representation" in self.headers.get("Prefer", ""):
+            return self._reply(200, representation)
+        self._reply(204)
+
+    def do_DELETE(self):
+        if self._simulate():
+            return
+        path = urllib.parse.unquote(urllib.parse.urlsplit(self.path).path)
+        if not path.startswith("/storage/v1/object/"):
+            return self._error(404, "not found")
+        bucket = path[len("/storage/v1/object/"):].strip("/")
+        prefixes = json.loads(self._body() or b"{}").get("prefixes") or []
+        deleted = []
+        with self.server.lock:
+            for key in prefixes:
+                target = self._object_path(bucket, key)
+                if target and target.is_file():
+                    info = object_info(target, key)
+                    target.unlink()
+                    deleted.append(info)
+        self._reply(200, deleted)
+
+    # ── Storage operations ────────────────────────────────────────────────────
+
+    def _create_bucket(self, body: dict):
+        bucket = body.get("id") or body.get("name") or ""
+        if not bucket or "/" in bucket or bucket.startswith("."):
+            return self._error(400, "Invalid bucket name")
+        with self.server.lock:
+            target = self.server.root / bucket
+            if target.is_dir():
+                # Supabase answers a duplicate with 400 and a 409 body
+                return self._reply(400, {"statusCode": "409", "error": "Duplicate",
+                                         "message": "The resource already exists"})
+            target.mkdir()
+        self._reply(200, {"name": bucket})
+
+    def _serve_object(self, bucket_key: str):
+        """GET/HEAD with ETag revalidation (If-None-Match → 304) and single byte ranges (→ 206)."""
+        bucket, _, key = bucket_key.partition("/")
+        target = self._object_path(bucket, key)
+        if not target or not target.is_file():
+            return self._error(404, "Object not found")
+        meta = object_info(target, key)["metadata"]
+        headers = {"ETag": meta["eTag"], "Last-Modified": meta["lastModified"], "Accept-Ranges": "bytes"}
+        if self.headers.get("If-None-Match") == meta["eTag"]:
+            self.send_response(304)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", "0")
+            return self.end_headers()
+
+        data = target.read_bytes() if self.command == "GET" else b""
+        status, size = 200, meta["size"]
+        byte_range = self.headers.get("Range", "")
+        if self.command == "GET" and byte_range.startswith("bytes=") and size:
+            first, _, last = byte_range[6:].partition("-")
+            first = int(first or 0)
+            last = min(int(last) if last else size - 1, size - 1)
+            data, status = data[first:last + 1], 206
+            headers["Content-Range"] = f"bytes {first}-{last}/{size}"
+        self.send_response(status)
+        self.send_header("Content-Type", meta["mimetype"])
+        self.send_header("Content-Length", str(len(data) if self.command == "GET" else size))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if data:
+            self._write(data)
+
+    def _list(self, bucket: str, body: dict):
+        prefix = (body.get("prefix") or "").strip("/")
+        folder = self._object_path(bucket, prefix) if prefix else self.server.root / bucket
+        if folder is None or not (self.server.root / bucket).is_dir():
+            return self._error(404, "Bucket not found")
+        entries = []
+        if folder.is_dir():
+            for child in sorted(folder.iterdir(), key=lambda p: p.name):
+                if child.is_dir():
+                    entries.append({"name": child.name, "id": None, "updated_at": None,
+                                    "created_at": None, "last_accessed_at": None, "metadata": None})
+                elif not child.name.startswith(".upload-"):
+                    entries.append(object_info(child, child.name))
+        offset = int(body.get("offset") or 0)
+        limit = int(body.get("limit") or 100)
+        self._reply(200, entries[offset:offset + limit])
+
+    def _upload(self, bucket_key: str):
+        bucket, _, key = bucket_key.partition("/")
+        data = self._body()
+        target = self._object_path(bucket, key)
+        if not key or target is None:
+            return self._error(404, "Bucket not found")
+        upsert = self.headers.get("x-upsert", "").lower() == "true"
+        with self.server.lock:
+            if target.exists() and not upsert:
+                return self._error(400, "The resource already exists")
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f".upload-{threading.get_ident()}-{target.name}")
+            tmp.write_bytes(data)
+            tmp.replace(target)
+        self._reply(200, {"Key": f"{bucket}/{key}"})
+
+    def _move(self, body: dict):
+        bucket = body.get("bucketId", "")
+        source = self._object_path(bucket, body.get("sourceKey", ""))
+        dest = self._object_path(bucket, body.get("destinationKey", ""))
+        with self.server.lock:
+            if not source or not source.is_file() or dest is None:
+                return self._error(404, "Object not found")
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            source.replace(dest)
+        self._reply(200, {"message": "Successfully moved"})
+
+
+class LocalSupabase(ThreadingHTTPServer):
+    request_queue_size = 128
+    daemon_threads = True
+
+    def __init__(self, address, root: Path, catalog: "list | None" = None, verbose: bool = False,
+                 conditions: "Conditions | None" = None):
+        super().__init__(address, Handler)
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.catalog = catalog or []
+        self.verbose = verbose
+        self.conditions = conditions or Conditions()
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Supabase Storage/PostgREST stand-in")
+    parser.add_argument("--root", type=Path, required=True, help="Directory holding one folder per bucket")
+    parser.add_argument("--catalog", type=Path, help="JSON list of car_catalog rows")
+    parser.add_argument("--bucket", action="append", default=[], help="Create this bucket if missing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Added before every response")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Uniform extra latency, 0..N ms")
+    parser.add_argument("--bandwidth", type=parse_rate, default=0,
+                        help="Per-connection body rate, e.g. 2M or 512k bytes/s (default: unlimited)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with a fault")
+    parser.add_argument("--error-status", type=int, action="append",
+                        help="Fault status to inject (repeatable; default 429 and 503)")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds on injected 429s")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for jitter and fault draws")
+    args = parser.parse_args()
+
+    for bucket in args.bucket:
+        (args.root / bucket).mkdir(parents=True, exist_ok=True)
+    catalog = json.loads(args.catalog.read_text()) if args.catalog else []
+    conditions = Conditions(args.latency_ms, args.jitter_ms, args.bandwidth, args.error_rate,
+                            args.error_status or (429, 503), args.retry_after, args.seed)
+    server = LocalSupabase((args.host, args.port), args.root, catalog, args.verbose, conditions)
+    print(f"  Serving {args.root} ({len(catalog)} car_catalog rows) at {server.url}")
+    if args.latency_ms or args.jitter_ms or args.bandwidth or args.error_rate:
+        print(f"  Conditions: {args.latency_ms:g}+{args.jitter_ms:g} ms, "
+              f"{args.bandwidth or 'unlimited'} B/s, {args.error_rate:.1%} faults (seed {args.seed})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(f"  {conditions.requests} requests, {conditions.injected} injected faults")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""
+media_tools
+
+Shared pieces of the media scripts and the `media-tools` command that runs
+them. Nothing here imports Pillow, NumPy or python-docx: a subcommand pulls
+those in only when it runs.
+
+  media_tools.config   Supabase URL / service key / auth headers, repo paths
+  media_tools.net      keep-alive HTTP client reused across calls in a process
+  media_tools.slugs    slug rules mirrored from the TypeScript data layer
+  media_tools.cli      `media-tools <command>` entry point
+
+Install (editable, so subcommands keep running the scripts in place):
+  pip install -e scripts
+"""
+
+__version__ = "0.1.0"
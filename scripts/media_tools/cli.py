@@ -0,0 +1,148 @@
+"""
+media-tools: one entry point for the media scripts.
+
+Each subcommand runs its script in-process exactly as `python3 scripts/<file>`
+would (same argv, same __main__ block), so script options and docs stay
+valid. Nothing is imported until a subcommand is chosen: `media-tools
+--help` and `media-tools config` load only the standard library, and a
+subcommand loads only what its own script needs. Scripts import numpy, PIL
+and docx inside the functions that use them, so `<command> --help` stays
+at interpreter start-up cost too. Scripts without an
+argparse parser get their docstring on --help instead of being run.
+
+Usage:
+  media-tools --help
+  media-tools migrate --plan
+  media-tools gc --bucket vehicle-images
+  SUPABASE_URL=http://127.0.0.1:54321 media-tools upload --cat 2w
+  python3 -m media_tools audit          # without installing, from scripts/
+"""
+
+import sys
+
+from media_tools import __version__
+from media_tools.config import SCRIPTS_DIR
+
+# name → (script under scripts/, one-line summary); grouped for --help
+COMMANDS = {
+    "Storage": {
+        "upload":          ("upload_brand_images_to_supabase.py", "Upload public/data/brand-model-images to Storage"),
+        "migrate":         ("migrate_car_images_to_supabase.py", "Move car_catalog CDN images into Storage (--plan for an ETA)"),
+        "publish":         ("publish_hashed_images.py", "Publish images under content-hashed keys and repoint references"),
+        "gc":              ("storage_gc.py", "Report, quarantine or delete unreferenced Storage objects"),
+        "verify-links":    ("verify_image_links.py", "Check that every published image URL resolves"),
+        "local-supabase":  ("local_supabase.py", "Run the local Storage/PostgREST stand-in"),
+    },
+    "Scraping": {
+        "scrape-3w":       ("scrape_upload_3w_missing.py", "Scrape and upload missing 3W model images"),
+        "fix-3w":          ("fix_3w_missing_images.py", "Repair 3W slug mismatches and missing images"),
+        "heroes":          ("build_hero_images.py", "Refresh brand hero images from hero_manifest.json"),
+    },
+    "Images": {
+        "audit":           ("image_qa.py", "Single-pass image QA report (size, background, blur, duplicates)"),
+        "low-quality":     ("find_low_quality.py", "List 2W/3W images below the quality floor"),
+        "non-white-bg":    ("detect_non_white_bg.py", "List images without a white background"),
+        "dedupe":          ("dedupe_4w_gallery_metadata.py", "Drop duplicate images from 4W gallery metadata"),
+        "placeholders":    ("build_gallery_placeholders.py", "Write LQIP/size placeholders into gallery metadata"),
+        "swatches":        ("build_color_swatches.py", "Write dominant paint swatches into colour-variant metadata"),
+        "gallery-index":   ("build_gallery_index.py", "Compile gallery metadata into per-brand index files"),
+        "hero-renditions": ("build_hero_renditions.py", "Breakpoint AVIF/WebP renditions of brand heroes"),
+        "logo-sprites":    ("build_logo_sprites.py", "Pack brand logos into sprite sheets"),
+    },
+    "Data": {
+        "car-index":       ("build_car_data_index.py", "Build the typed CAR_DATA.tsv filter index"),
+        "spec-store":      ("build_spec_store.py", "Typed 2W/3W spec columns (.npz) with sort indexes; --where to query"),
+        "model-shards":    ("build_model_shards.py", "Minified per-model shards of the 4W brand files"),
+        "search-index":    ("build_search_index.py", "Typo-tolerant brand/model/variant typeahead index; --query to try it"),
+        "car-data":        ("build_car_data.py", "Incrementally regenerate CAR_DATA.tsv / CAR_DATA_TABLE.md with a row diff"),
+        "cdn-urls":        ("cdn_urls.py", "Group CardDekho CDN URLs in a file by photo"),
+        "cache":           ("blob_cache.py", "Inspect or trim the shared download cache"),
+        "client-overview": ("generate-client-overview-docx.py", "Render the client overview .docx (per dealer with --all)"),
+    },
+}
+BUILTINS = {
+    "config": "Print the resolved Supabase URL, key status and paths",
+}
+
+
+def _scripts() -> dict:
+    return {name: spec for group in COMMANDS.values() for name, spec in group.items()}
+
+
+def print_help():
+    width = max(len(name) for name in [*_scripts(), *BUILTINS]) + 2
+    lines = [f"usage: media-tools <command> [options]   (v{__version__})", ""]
+    for group, commands in [*COMMANDS.items(), ("Built-in", {k: (None, v) for k, v in BUILTINS.items()})]:
+        lines.append(f"{group}:")
+        lines += [f"  {name:<{width}}{summary}" for name, (_, summary) in commands.items()]
+        lines.append("")
+    lines.append("Run `media-tools <command> --help` for a command's options.")
+    print("\n".join(lines))
+
+
+def show_config():
+    from media_tools import config
+    print(f"  SUPABASE_URL: {config.SUPABASE_URL}"
+          f"{'' if config.SUPABASE_URL == config.PRODUCTION_URL else '  (not production)'}")
+    print(f"  Service key:  {'set' if config.SERVICE_KEY else 'not set (SUPABASE_SERVICE_ROLE_KEY)'}")
+    print(f"  Scripts:      {config.SCRIPTS_DIR}")
+    print(f"  Public data:  {config.DATA_DIR}")
+
+
+def script_usage(path) -> str:
+    """Module docstring of a script, read without executing it."""
+    import ast
+
+    doc = ast.get_docstring(ast.parse(path.read_text()))
+    return doc or f"{path.name} takes no options."
+
+
+def run_script(script: str, args: "list[str]") -> int:
+    """Run scripts/<script> as __main__ with args; returns its exit status."""
+    import runpy
+
+    path = SCRIPTS_DIR / script
+    if not path.exists():
+        print(f"media-tools: {path} not found (install with `pip install -e scripts` so commands run in place)",
+              file=sys.stderr)
+        return 2
+    if {"-h", "--help"} & set(args) and "argparse" not in path.read_text():
+        print(script_usage(path))  # argv-less scripts would run for real on --help
+        return 0
+    if str(SCRIPTS_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPTS_DIR))  # scripts import their siblings by module name
+    sys.argv = [str(path), *args]
+    try:
+        runpy.run_path(str(path), run_name="__main__")
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: "list[str] | None" = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help", "help"):
+        print_help()
+        return 0
+    if argv[0] == "--version":
+        print(__version__)
+        return 0
+
+    command, args = argv[0], argv[1:]
+    if command == "config":
+        show_config()
+        return 0
+    scripts = _scripts()
+    if command not in scripts:
+        close = [name for name in scripts if name.startswith(command[:3])]
+        hint = f" (did you mean {', '.join(close)}?)" if close else ""
+        print(f"media-tools: unknown command '{command}'{hint}; see media-tools --help", file=sys.stderr)
+        return 2
+    return run_script(scripts[command][0], args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+Supabase and repo configuration shared by the media scripts.
+
+Config (env):
+  SUPABASE_URL               default: production project
+  SUPABASE_SERVICE_ROLE_KEY  default: empty (read-only public access)
+"""
+
+import os
+from pathlib import Path
+from urllib.parse import quote
+
+PRODUCTION_URL = "https://llsvbyeumrfngjvbedbz.supabase.co"
+SUPABASE_URL   = os.environ.get("SUPABASE_URL", PRODUCTION_URL).rstrip("/")
+SERVICE_KEY    = os.environ.get("SUPABASE_SERVICE_ROLE_KEY", "")
+AUTH           = {"Authorization": f"Bearer {SERVICE_KEY}", "apikey": SERVICE_KEY}
+
+SCRIPTS_DIR  = Path(__file__).resolve().parent.parent
+PROJECT_ROOT = SCRIPTS_DIR.parent
+PUBLIC_DIR   = PROJECT_ROOT / "public"
+DATA_DIR     = PUBLIC_DIR / "data"
+
+PUBLIC_MARKER = "/storage/v1/object/public/"
+
+# Stable keys are overwritten in place (x-upsert) and the 2W/3W catalog builds
+# URLs to them directly, so they must revalidate; only content-hashed keys
+# (publish_hashed_images.py) are cached as immutable.
+STABLE_CACHE_CONTROL = "public, max-age=3600"
+
+
+def require_service_key():
+    """Exit unless SUPABASE_SERVICE_ROLE_KEY is set; for scripts that write to storage or the DB."""
+    if not SERVICE_KEY:
+        raise SystemExit(f"  SUPABASE_SERVICE_ROLE_KEY is not set (needed to write to {SUPABASE_URL})")
+
+
+def public_url(bucket: str, key: str, origin: "str | None" = None) -> str:
+    """Public object URL for bucket/key (on SUPABASE_URL unless origin is given)."""
+    return f"{origin or SUPABASE_URL}{PUBLIC_MARKER}{bucket}/{quote(key)}"
@@ -0,0 +1,151 @@
+"""
+Keep-alive HTTP client shared within a process.
+
+Each thread keeps one persistent http.client connection per scheme://host,
+so a script making thousands of Storage/PostgREST calls pays for TCP/TLS
+setup once per worker instead of once per request. A connection the server
+has dropped is reopened and the request retried once: always for idempotent
+methods, and for POST/PATCH only when the reused connection failed before
+the request was written, so a write is never applied twice. GET/HEAD follow
+up to MAX_REDIRECTS redirects, and the usual *_proxy environment variables
+are honoured like urllib did.
+
+Usage:
+  from media_tools.net import request
+
+  status, body = request("GET", url, headers=AUTH)
+  status, body = request("POST", url, json_body={"prefix": ""}, headers=AUTH)
+"""
+
+import http.client
+import json
+import ssl
+import threading
+import urllib.parse
+import urllib.request
+from base64 import b64encode
+
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+REDIRECT_STATUSES  = {301, 302, 303, 307, 308}
+MAX_REDIRECTS      = 5
+CREDENTIAL_HEADERS = {"authorization", "apikey", "cookie"}
+
+_local = threading.local()
+_ssl_context = None
+_proxies = None
+
+
+def _proxy_for(scheme: str, netloc: str) -> "urllib.parse.SplitResult | None":
+    """The proxy from http_proxy/https_proxy (minus no_proxy hosts), or None."""
+    global _proxies
+    if _proxies is None:
+        _proxies = urllib.request.getproxies()
+    proxy = _proxies.get(scheme)
+    if not proxy or urllib.request.proxy_bypass(netloc.rpartition("@")[2]):
+        return None
+    return urllib.parse.urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+
+
+def _proxy_auth(proxy: "urllib.parse.SplitResult") -> dict:
+    if proxy.username is None:
+        return {}
+    user = urllib.parse.unquote(proxy.username)
+    password = urllib.parse.unquote(proxy.password or "")
+    return {"Proxy-Authorization": "Basic " + b64encode(f"{user}:{password}".encode()).decode()}
+
+
+def _connection(scheme: str, netloc: str, timeout: float) -> http.client.HTTPConnection:
+    global _ssl_context
+    conns = _local.__dict__.setdefault("conns", {})
+    conn = conns.get((scheme, netloc))
+    if conn is None:
+        proxy = _proxy_for(scheme, netloc)
+        host = f"{proxy.hostname}:{proxy.port or 80}" if proxy else netloc
+        if scheme == "https":
+            _ssl_context = _ssl_context or ssl.create_default_context()
+            conn = http.client.HTTPSConnection(host, timeout=timeout, context=_ssl_context)
+            if proxy:
+                conn.set_tunnel(netloc, headers=_proxy_auth(proxy))
+        else:
+            conn = http.client.HTTPConnection(host, timeout=timeout)
+        # Plain-HTTP requests through a proxy carry the absolute URL instead.
+        conn.proxy_headers = _proxy_auth(proxy) if proxy and scheme != "https" else None
+        conns[(scheme, netloc)] = conn
+    conn.timeout = timeout
+    if conn.sock is not None:
+        conn.sock.settimeout(timeout)
+    return conn
+
+
+def _drop(scheme: str, netloc: str):
+    conn = _local.__dict__.get("conns", {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def request(method: str, url: str, data: "bytes | None" = None, headers: "dict | None" = None,
+            json_body=None, timeout: float = 60) -> "tuple[int, bytes]":
+    """
+    One request over this thread's connection to the URL's host. Never
+    raises: network errors come back as (0, message bytes), like the
+    scripts' urllib helpers did.
+    """
+    status, _, body = request_with_headers(method, url, data, headers, json_body, timeout)
+    return status, body
+
+
+def request_with_headers(method: str, url: str, data: "bytes | None" = None, headers: "dict | None" = None,
+                         json_body=None, timeout: float = 60) -> "tuple[int, dict, bytes]":
+    """request(), also returning the response headers (lower-cased names; {} on a network error)."""
+    headers = dict(headers or {})
+    if json_body is not None:
+        data = json.dumps(json_body).encode()
+        headers.setdefault("Content-Type", "application/json")
+
+    origin = urllib.parse.urlsplit(url)[:2]
+    for _ in range(MAX_REDIRECTS + 1):
+        status, resp_headers, body = _send(method, url, data, headers, timeout)
+        location = resp_headers.get("location")
+        if method not in ("GET", "HEAD") or status not in REDIRECT_STATUSES or not location:
+            break
+        url = urllib.parse.urljoin(url, location)
+        if urllib.parse.urlsplit(url)[:2] != origin:
+            # Don't hand the service key to whichever host the redirect names
+            headers = {k: v for k, v in headers.items() if k.lower() not in CREDENTIAL_HEADERS}
+    return status, resp_headers, body
+
+
+def _send(method: str, url: str, data: "bytes | None", headers: dict,
+          timeout: float) -> "tuple[int, dict, bytes]":
+    parts = urllib.parse.urlsplit(url)
+    path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+    for attempt in (0, 1):
+        reused = written = False
+        try:
+            conn = _connection(parts.scheme, parts.netloc, timeout)
+            reused = conn.sock is not None
+            if conn.proxy_headers is not None:
+                conn.request(method, url, body=data, headers={**headers, **conn.proxy_headers})
+            else:
+                conn.request(method, path, body=data, headers=headers)
+            written = True
+            resp = conn.getresponse()
+            body = resp.read()
+            if resp.will_close:
+                _drop(parts.scheme, parts.netloc)
+            return resp.status, {k.lower(): v for k, v in resp.getheaders()}, body
+        except (http.client.HTTPException, OSError) as e:
+            _drop(parts.scheme, parts.netloc)
+            # A reused connection may have been closed by the server between
+            # calls. Resending is only safe if the method is idempotent or the
+            # server cannot have seen the request yet.
+            safe = method in IDEMPOTENT_METHODS or (reused and not written)
+            if attempt or not safe or isinstance(e, TimeoutError):
+                return 0, {}, str(e).encode()
+
+
+def close_all():
+    """Close this thread's connections."""
+    for key in list(_local.__dict__.get("conns", {})):
+        _drop(*key)
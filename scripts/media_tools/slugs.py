@@ -0,0 +1,21 @@
+"""Slug rules that must match the TypeScript data layer exactly."""
+
+import re
+
+
+def to_slug_ts(s: str) -> str:
+    """Replicate three-wheelers.ts toSlug function exactly."""
+    s = s.lower()
+    s = re.sub(r'[^a-z0-9\s-]', '', s)
+    s = re.sub(r'\s+', '-', s)
+    s = re.sub(r'-+', '-', s)
+    return s
+
+
+def model_to_slug(model: str) -> str:
+    """Replicate brand-model-images.ts modelToSlug function exactly."""
+    s = model.lower()
+    s = re.sub(r'\.', '', s)
+    s = re.sub(r'[^a-z0-9]+', '-', s)
+    s = re.sub(r'^-|-$', '', s)
+    return s
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+pipeline_metrics.py
+
+Per-stage throughput and latency metrics shared by the migration and upload
+scripts. Each HTTP call is recorded against a (stage, host) pair — e.g.
+("download", "stimg.cardekho.com") or ("upload", "….supabase.co") — so a run
+can show which side actually limits it.
+
+Exposes the same data three ways:
+  - progress_line(): one-line live status for the console
+  - summary() / write_json(): JSON summary at the end of a run
+  - write_prometheus(): node_exporter textfile-collector format
+
+Usage:
+  from pipeline_metrics import PipelineMetrics
+
+  metrics = PipelineMetrics("migrate", total=len(urls))
+  with metrics.timed("download", url) as call:
+      status, body = _http("GET", url)
+      call.nbytes, call.ok = len(body), status == 200
+  metrics.retry("download", url, wait_seconds=2.0)
+  metrics.item_done()
+  print(metrics.progress_line())
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import urlparse
+
+# Latency histogram upper bounds, in seconds (Prometheus-style, +Inf implied)
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def host_of(url: str) -> str:
+    return urlparse(url).netloc or url
+
+
+def _fmt_bytes(n: float) -> str:
+    if n < 1024:
+        return f"{n:.0f} B"
+    for unit in ("KB", "MB"):
+        n /= 1024
+        if n < 1024:
+            return f"{n:.1f} {unit}"
+    return f"{n / 1024:.1f} GB"
+
+
+def _fmt_duration(seconds: float) -> str:
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class _Series:
+    """Latency histogram plus byte/error/retry counters for one (stage, host)."""
+
+    __slots__ = ("buckets", "count", "seconds", "nbytes", "errors", "retries", "retry_seconds")
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.seconds = 0.0
+        self.nbytes = 0
+        self.errors = 0
+        self.retries = 0
+        self.retry_seconds = 0.0
+
+    def observe(self, seconds: float, nbytes: int, ok: bool):
+        index = len(BUCKETS)
+        for i, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                index = i
+                break
+        self.buckets[index] += 1
+        self.count += 1
+        self.seconds += seconds
+        self.nbytes += nbytes
+        if not ok:
+            self.errors += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bucket bound holding the q-th observation (capped at the last bucket)."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets[:-1]):
+            seen += n
+            if seen >= rank:
+                return BUCKETS[i]
+        return BUCKETS[-1]
+
+
+class _Call:
+    """Filled in by the caller inside PipelineMetrics.timed()."""
+
+    __slots__ = ("nbytes", "ok")
+
+    def __init__(self):
+        self.nbytes = 0
+        self.ok = True
+
+
+class PipelineMetrics:
+    """Thread-safe metrics registry for one pipeline run."""
+
+    def __init__(self, pipeline: str, total: int = 0):
+        self.pipeline = pipeline
+        self.total = total
+        self.done = 0
+        self.failed = 0
+        self.queue_depth = 0
+        self.in_flight = 0
+        self.started = time.monotonic()
+        self._series: "dict[tuple[str, str], _Series]" = {}
+        self._lock = threading.Lock()
+
+    def _get(self, stage: str, host: str) -> _Series:
+        key = (stage, host)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _Series()
+        return series
+
+    # ── Recording ────────────────────────────────────────────────────────────
+
+    def observe(self, stage: str, url: str, seconds: float, nbytes: int = 0, ok: bool = True):
+        with self._lock:
+            self._get(stage, host_of(url)).observe(seconds, nbytes, ok)
+
+    @contextmanager
+    def timed(self, stage: str, url: str):
+        """Time the enclosed call; set .nbytes / .ok on the yielded object."""
+        call = _Call()
+        with self._lock:
+            self.in_flight += 1
+        start = time.monotonic()
+        try:
+            yield call
+        except Exception:
+            call.ok = False
+            raise
+        finally:
+            elapsed = time.monotonic() - start
+            with self._lock:
+                self.in_flight -= 1
+                self._get(stage, host_of(url)).observe(elapsed, call.nbytes, call.ok)
+
+    def retry(self, stage: str, url: str, wait_seconds: float = 0.0):
+        """Count a retry of stage against url, plus the back-off spent before it."""
+        with self._lock:
+            series = self._get(stage, host_of(url))
+            series.retries += 1
+            series.retry_seconds += wait_seconds
+
+    def item_done(self, ok: bool = True):
+        with self._lock:
+            self.done += 1
+            if not ok:
+                self.failed += 1
+
+    def set_queue_depth(self, depth: int):
+        self.queue_depth = depth
+
+    # ── Reporting ────────────────────────────────────────────────────────────
+
+    def _stage_totals(self) -> dict:
+        """Aggregate series across hosts: {stage: _Series}."""
+        totals = {}
+        for (stage, _host), series in self._series.items():
+            agg = totals.setdefault(stage, _Series())
+            agg.buckets = [a + b for a, b in zip(agg.buckets, series.buckets)]
+            agg.count += series.count
+            agg.seconds += series.seconds
+            agg.nbytes += series.nbytes
+            agg.errors += series.errors
+            agg.retries += series.retries
+            agg.retry_seconds += series.retry_seconds
+        return totals
+
+    def progress_line(self) -> str:
+        with self._lock:
+            elapsed = max(time.monotonic() - self.started, 1e-9)
+            totals = self._stage_totals()
+            done, total = self.done, self.total
+            parts = [f"Progress: {done}/{total}" if total else f"Progress: {done}"]
+            rate = done / elapsed
+            parts.append(f"{rate:.1f}/s")
+            for stage, series in totals.items():
+                parts.append(
+                    f"{stage} {_fmt_bytes(series.nbytes / elapsed)}/s "
+                    f"p50 {series.quantile(0.5) * 1000:.0f}ms"
+                )
+            retries = sum(s.retries for s in totals.values())
+            if retries:
+                parts.append(f"retries {retries}")
+            parts.append(f"queue {self.queue_depth}")
+            if total and rate > 0 and done < total:
+                parts.append(f"ETA {_fmt_duration((total - done) / rate)}")
+        return "  " + " | ".join(parts)
+
+    def summary(self) -> dict:
+        with self._lock:
+            elapsed = time.monotonic() - self.started
+            busy = sum(s.seconds for s in self._series.values()) or 1e-9
+            stages = {}
+            for (stage, host), series in sorted(self._series.items()):
+                stages.setdefault(stage, {})[host] = {
+                    "requests": series.count,
+                    "errors": series.errors,
+                    "retries": series.retries,
+                    "retry_wait_seconds": round(series.retry_seconds, 3),
+                    "bytes": series.nbytes,
+                    "seconds": round(series.seconds, 3),
+                    "share_of_busy_time": round(series.seconds / busy, 3),
+                    "bytes_per_sec": round(series.nbytes / elapsed, 1) if elapsed else 0.0,
+                    "p50_ms": series.quantile(0.5) * 1000,
+                    "p95_ms": series.quantile(0.95) * 1000,
+                    "histogram": dict(zip([str(b) for b in BUCKETS] + ["+Inf"], series.buckets)),
+                }
+            return {
+                "pipeline": self.pipeline,
+                "elapsed_seconds": round(elapsed, 3),
+                "items": {"total": self.total, "done": self.done, "failed": self.failed},
+                "items_per_sec": round(self.done / elapsed, 2) if elapsed else 0.0,
+                "stages": stages,
+            }
+
+    def print_summary(self):
+        data = self.summary()
+        print(f"  Elapsed: {_fmt_duration(data['elapsed_seconds'])} "
+              f"({data['items_per_sec']} items/s)")
+        for stage, hosts in data["stages"].items():
+            for host, s in hosts.items():
+                print(f"  {stage:<10} {host:<32} {s['requests']:>6} req  "
+                      f"{_fmt_bytes(s['bytes_per_sec'])}/s  p50 {s['p50_ms']:.0f}ms  "
+                      f"p95 {s['p95_ms']:.0f}ms  busy {s['share_of_busy_time'] * 100:.0f}%  "
+                      f"retries {s['retries']} ({s['retry_wait_seconds']:.0f}s waited)  "
+                      f"errors {s['errors']}")
+
+    def write_json(self, path: Path):
+        Path(path).write_text(json.dumps(self.summary(), indent=2))
+
+    def write_prometheus(self, path: Path):
+        """Write a textfile-collector file atomically (write temp, rename)."""
+        base = f'pipeline="{self.pipeline}"'
+        lines = [
+            "# HELP pipeline_request_duration_seconds HTTP call latency per stage and host.",
+            "# TYPE pipeline_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            series_items = sorted(self._series.items())
+            for (stage, host), s in series_items:
+                labels = f'{base},stage="{stage}",host="{host}"'
+                cumulative = 0
+                for bound, n in zip([str(b) for b in BUCKETS] + ["+Inf"], s.buckets):
+                    cumulative += n
+                    lines.append(f'pipeline_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"pipeline_request_duration_seconds_sum{{{labels}}} {s.seconds:.6f}")
+                lines.append(f"pipeline_request_duration_seconds_count{{{labels}}} {s.count}")
+            for name, attr, help_text in (
+                ("pipeline_bytes_total", "nbytes", "Bytes transferred per stage and host."),
+                ("pipeline_retries_total", "retries", "Retried calls per stage and host."),
+                ("pipeline_errors_total", "errors", "Failed calls per stage and host."),
+                ("pipeline_retry_wait_seconds_total", "retry_seconds", "Back-off time before retries."),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for (stage, host), s in series_items:
+                    lines.append(f'{name}{{{base},stage="{stage}",host="{host}"}} {getattr(s, attr)}')
+            lines += [
+                "# TYPE pipeline_items_done gauge",
+                f"pipeline_items_done{{{base}}} {self.done}",
+                "# TYPE pipeline_items_total gauge",
+                f"pipeline_items_total{{{base}}} {self.total}",
+                "# TYPE pipeline_queue_depth gauge",
+                f"pipeline_queue_depth{{{base}}} {self.queue_depth}",
+            ]
+        path = Path(path)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text("\n".join(lines) + "\n")
+        tmp.replace(path)
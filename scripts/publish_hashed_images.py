@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+publish_hashed_images.py
+
+Publishes images under content-hashed object keys, which are the only keys
+served with a one-year `immutable` Cache-Control:
+
+  2w/honda/activa.jpg  →  2w/honda/activa.3f9a2c1b7e4d5a60.jpg
+
+Uploaders keep writing stable keys (x-upsert, short STABLE_CACHE_CONTROL);
+those stay the source of truth. For every published reference this script hashes the bytes behind the
+stable key, uploads them under the hashed key (never overwritten, so nothing
+ever needs a purge) and repoints the reference:
+
+  - public/data/vehicle-image-urls.json   (vehicle-images bucket)
+  - car_catalog.image_url                 (car-images bucket)
+  - 4W gallery metadata.json              (local files → brand-model-images/4w-galleries/…;
+                                           placeholders are re-keyed to the new URLs)
+
+A reference that is already hashed is re-checked against its stable key:
+unchanged bytes keep the URL, changed bytes get a new one. storage_gc.py
+keeps the stable key behind every hashed reference; if one is gone anyway
+the published object stays as it is.
+
+Nothing is repointed until every hashed object is uploaded. The switch is one
+step: new manifests are staged next to the originals, car_catalog rows are
+patched by id, then the staged files are moved in with os.replace. If a patch
+fails, rows already patched are reverted and the staged files dropped. A
+journal (scripts/.publish_journal.json) covers a crash mid-switch: it lists
+the patches plus every manifest with its staged copy and a backup of the
+original, and the next run reverts the DB and restores the backups first.
+Superseded objects are left for storage_gc.py.
+
+Usage:
+  python3 scripts/publish_hashed_images.py --dry-run            # hash a sample, upload nothing
+  python3 scripts/publish_hashed_images.py
+  python3 scripts/publish_hashed_images.py --only vehicle,gallery
+"""
+
+import argparse
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+import time
+import urllib.parse
+from pathlib import Path
+
+from adaptive_concurrency import RetryLater, is_retryable, run_with_retries
+from media_tools.config import AUTH, PRODUCTION_URL, PUBLIC_DIR, PUBLIC_MARKER, SUPABASE_URL
+from media_tools.net import request
+
+VEHICLE_URLS = PUBLIC_DIR / "data" / "vehicle-image-urls.json"
+GALLERY_ROOT = PUBLIC_DIR / "data" / "brand-model-images" / "4w-galleries"
+JOURNAL      = Path(__file__).parent / ".publish_journal.json"
+
+GALLERY_BUCKET = "brand-model-images"
+GALLERY_FIELDS = ("hero", "exterior", "interior", "feature", "colorImages")
+LOCAL_PREFIX   = "/data/brand-model-images/"
+SOURCES        = ("vehicle", "catalog", "gallery")
+
+DIGEST_LEN    = 16     # hex chars of sha256 in the key (same fingerprint as gallery placeholders)
+WORKERS       = 16
+MAX_ATTEMPTS  = 3
+RETRY_DELAY   = 1.5
+CATALOG_PAGE  = 1000
+PATCH_ID_BATCH = 200   # ids per PATCH (keeps the query string short)
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_HASHED = re.compile(rf"\.([0-9a-f]{{{DIGEST_LEN}}})(\.[A-Za-z0-9]+)$")
+
+
+# ── Keys ─────────────────────────────────────────────────────────────────────
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:DIGEST_LEN]
+
+
+def hashed_key(key: str, digest: str) -> str:
+    """'2w/honda/activa.jpg' → '2w/honda/activa.{digest}.jpg'."""
+    stem, dot, ext = stable_key(key).rpartition(".")
+    return f"{stem}.{digest}.{ext}" if dot else f"{ext}.{digest}"
+
+
+def stable_key(key: str) -> str:
+    """Strip a content hash from key ('…/activa.3f9a…60.jpg' → '…/activa.jpg'); other keys unchanged."""
+    return _HASHED.sub(r"\2", key)
+
+
+def key_digest(key: str) -> "str | None":
+    match = _HASHED.search(key)
+    return match.group(1) if match else None
+
+
+def split_public_url(url: str) -> "tuple[str, str, str] | None":
+    """Public object URL → (origin, bucket, key)."""
+    if PUBLIC_MARKER not in url:
+        return None
+    origin, tail = url.split(PUBLIC_MARKER, 1)
+    bucket, _, key = urllib.parse.unquote(tail.split("?", 1)[0]).partition("/")
+    return (origin, bucket, key) if key else None
+
+
+def public_url(origin: str, bucket: str, key: str) -> str:
+    return f"{origin}{PUBLIC_MARKER}{bucket}/{urllib.parse.quote(key)}"
+
+
+# ── HTTP ─────────────────────────────────────────────────────────────────────
+
+def _request(method: str, url: str, data: "bytes | None" = None, headers: "dict | None" = None,
+             timeout: int = 60) -> "tuple[int, bytes]":
+    return request(method, url, data, {**AUTH, **(headers or {})}, timeout=timeout)
+
+
+def download_stable(bucket: str, key: str) -> "bytes | None":
+    """Current bytes of a stable key, read past the CDN (authenticated endpoint). None if missing."""
+    url = f"{SUPABASE_URL}/storage/v1/object/authenticated/{bucket}/{urllib.parse.quote(key)}"
+    status, body = _request("GET", url)
+    if status == 200:
+        return body
+    if is_retryable(status):
+        raise RetryLater(status, "download", url)
+    return None
+
+
+def upload_immutable(bucket: str, key: str, data: bytes) -> bool:
+    """Create bucket/key unless it exists. Content-addressed, so an existing object is the same bytes."""
+    url = f"{SUPABASE_URL}/storage/v1/object/{bucket}/{urllib.parse.quote(key)}"
+    mime = mimetypes.guess_type(key)[0] or "application/octet-stream"
+    status, body = _request("POST", url, data, {"Content-Type": mime, "Cache-Control": CACHE_CONTROL})
+    if status in (200, 201) or (status in (400, 409) and b"exists" in body.lower()):
+        return True
+    if is_retryable(status):
+        raise RetryLater(status, "upload", url)
+    print(f"  Upload failed ({status}) {bucket}/{key}: {body[:120]!r}")
+    return False
+
+
+# ── References ───────────────────────────────────────────────────────────────
+
+def _gallery_values(metadata: dict):
+    for field in GALLERY_FIELDS:
+        values = metadata.get(field) or []
+        yield from ([values] if isinstance(values, str) else values)
+
+
+def source_of(ref: str) -> "tuple | None":
+    """
+    Where a reference's current bytes come from, as a hashable job:
+      ("remote", bucket, stable key)  — Supabase object behind a public URL
+      ("local", bucket, stable key)   — file under public/data/brand-model-images/
+    """
+    parsed = split_public_url(ref)
+    if parsed:
+        _, bucket, key = parsed
+        if bucket == GALLERY_BUCKET and key.startswith("4w-galleries/"):
+            return "local", bucket, stable_key(key)  # published gallery image: local file stays the source
+        return "remote", bucket, stable_key(key)
+    if ref.startswith(LOCAL_PREFIX):
+        return "local", GALLERY_BUCKET, urllib.parse.unquote(ref[len(LOCAL_PREFIX):].split("?", 1)[0])
+    return None
+
+
+def load_catalog_rows() -> "list[dict]":
+    rows, offset = [], 0
+    while True:
+        status, body = _request("GET", f"{SUPABASE_URL}/rest/v1/car_catalog?select=id,image_url"
+                                       f"&image_url=not.is.null&order=id&limit={CATALOG_PAGE}&offset={offset}")
+        if status != 200:
+            raise RuntimeError(f"car_catalog query failed ({status}): {body[:200]!r}")
+        page = json.loads(body)
+        rows += [row for row in page if PUBLIC_MARKER in (row.get("image_url") or "")]
+        if len(page) < CATALOG_PAGE:
+            return rows
+        offset += CATALOG_PAGE
+
+
+def load_galleries() -> "list[tuple[Path, str, dict]]":
+    return [(path, raw, json.loads(raw))
+            for path in sorted(GALLERY_ROOT.rglob("metadata.json"))
+            for raw in [path.read_text()]]
+
+
+# ── Publish ──────────────────────────────────────────────────────────────────
+
+def publish_source(job: tuple, attempt: int, upload: bool = True) -> "tuple[str, str] | None":
+    """Hash (and upload) one source. Returns (digest, hashed key) or None if the source is missing."""
+    kind, bucket, key = job
+    if kind == "local":
+        path = PUBLIC_DIR / LOCAL_PREFIX.strip("/") / key
+        data = path.read_bytes() if path.is_file() else None
+    else:
+        data = download_stable(bucket, key)
+    if not data:
+        return None
+    digest = content_digest(data)
+    new_key = hashed_key(key, digest)
+    if upload and not upload_immutable(bucket, new_key, data):
+        return None
+    return digest, new_key
+
+
+def new_ref(ref: str, published: dict) -> str:
+    """The reference after publishing (unchanged when its source is missing or identical)."""
+    job = source_of(ref)
+    result = published.get(job) if job else None
+    if not result:
+        return ref
+    digest, new_key = result
+    parsed = split_public_url(ref)
+    if parsed and key_digest(parsed[2]) == digest:
+        return ref
+    # Keep the reference's origin: a staging/local SUPABASE_URL serves the same keys
+    origin = parsed[0] if parsed else PRODUCTION_URL
+    return public_url(origin, job[1], new_key)
+
+
+def rewrite_gallery(metadata: dict, mapping: dict) -> dict:
+    """Swap image references and carry placeholders over to the new keys."""
+    out = dict(metadata)
+    for field in GALLERY_FIELDS:
+        value = metadata.get(field)
+        if isinstance(value, str):
+            out[field] = mapping.get(value, value)
+        elif isinstance(value, list):
+            out[field] = [mapping.get(v, v) if isinstance(v, str) else v for v in value]
+
+    placeholders = metadata.get("placeholders")
+    if placeholders:
+        # Placeholders are keyed by gallery-relative tail for local paths, by full URL once published
+        rekeyed = {}
+        for old in _gallery_values(metadata):
+            if old not in mapping:
+                continue
+            old_key = old if old.startswith("http") else old.split("/4w-galleries/", 1)[1].split("/", 2)[2]
+            if old_key in placeholders:
+                rekeyed[old_key] = mapping[old]
+        out["placeholders"] = {rekeyed.get(k, k): v for k, v in placeholders.items()}
+    return out
+
+
+def _dump(metadata: dict, trailing_newline: bool) -> str:
+    return json.dumps(metadata, indent=2, ensure_ascii=False) + ("\n" if trailing_newline else "")
+
+
+# ── Switch (stage → patch → replace) ─────────────────────────────────────────
+
+def patch_catalog(pairs: "list[tuple[list, str, str]]") -> "list[tuple[list, str, str]]":
+    """
+    Apply (ids, expected url, new url) patches. Returns the ones applied;
+    stops at the first failure.
+    """
+    applied = []
+    headers = {"Content-Type": "application/json", "Prefer": "return=minimal"}
+    for ids, expected, new in pairs:
+        id_list = ",".join(str(i) for i in ids)
+        url = (f"{SUPABASE_URL}/rest/v1/car_catalog?id=in.({id_list})"
+               f"&image_url=eq.{urllib.parse.quote(expected, safe='')}")
+        status, body = _request("PATCH", url, json.dumps({"image_url": new}).encode(), headers)
+        if status not in (200, 204):
+            print(f"  DB patch failed ({status}): {body[:200]!r}")
+            break
+        applied.append((ids, expected, new))
+    return applied
+
+
+def revert_catalog(applied: "list[tuple[list, str, str]]") -> bool:
+    reverse = [(ids, new, old) for ids, old, new in reversed(applied)]
+    return len(patch_catalog(reverse)) == len(reverse)
+
+
+def _drop(paths):
+    for path in paths:
+        Path(path).unlink(missing_ok=True)
+
+
+def recover_journal():
+    """Undo a switch that died part-way: revert the DB patches and put every original manifest back."""
+    if not JOURNAL.exists():
+        return
+    journal = json.loads(JOURNAL.read_text())
+    print(f"  Found an unfinished publish from {journal['started']}; reverting its DB patches and manifests...")
+    if not revert_catalog([tuple(p) for p in journal["patches"]]):
+        raise SystemExit("  Could not revert car_catalog; fix it by hand, then delete " + str(JOURNAL))
+    for path, staged, backup in journal.get("files", []):
+        # The original may or may not have been replaced yet; restoring the backup is right
+        # either way. A missing backup was already restored by an interrupted recovery.
+        if Path(backup).exists():
+            os.replace(backup, path)
+        Path(staged).unlink(missing_ok=True)
+    JOURNAL.unlink()
+
+
+def switch(files: "dict[Path, str]", patches: "list[tuple[list, str, str]]") -> bool:
+    """Stage every file, patch the DB, then move the files in. All or nothing."""
+    entries = []  # (path, staged copy, backup of the original)
+    for path, text in files.items():
+        tmp = path.with_name(f".{path.name}.publish")
+        backup = path.with_name(f".{path.name}.orig")
+        tmp.write_text(text)
+        shutil.copy2(path, backup)
+        entries.append((path, tmp, backup))
+
+    JOURNAL.write_text(json.dumps({
+        "started": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "patches": patches,
+        "files": [[str(p) for p in entry] for entry in entries],
+    }))
+    applied = patch_catalog(patches)
+    if len(applied) != len(patches):
+        if not revert_catalog(applied):
+            raise SystemExit(f"  Revert failed; the journal {JOURNAL} lists the patches to undo")
+        JOURNAL.unlink()
+        _drop(p for _, tmp, backup in entries for p in (tmp, backup))
+        return False
+
+    for path, tmp, _ in entries:
+        os.replace(tmp, path)
+    # Journal before backups, so recovery never finds a journal whose backups are gone
+    JOURNAL.unlink()
+    _drop(backup for _, _, backup in entries)
+    return True
+
+
+# ── Main ─────────────────────────────────────────────────────────────────────
+
+def run(sources=SOURCES, dry_run: bool = False, workers: int = WORKERS):
+    print("\n=== Publish content-hashed images ===\n")
+    print(f"  Supabase: {SUPABASE_URL}")
+    print(f"  Sources:  {', '.join(sources)}\n")
+    if not dry_run:
+        recover_journal()
+
+    vehicle_raw = VEHICLE_URLS.read_text() if "vehicle" in sources else "{}"
+    vehicle = json.loads(vehicle_raw)
+    catalog = load_catalog_rows() if "catalog" in sources else []
+    galleries = load_galleries() if "gallery" in sources else []
+
+    refs = set(vehicle.values()) | {row["image_url"] for row in catalog}
+    for _, _, metadata in galleries:
+        refs.update(v for v in _gallery_values(metadata) if isinstance(v, str))
+    jobs = sorted({job for job in map(source_of, refs) if job})
+    print(f"  References: {len(refs)}  Sources to hash: {len(jobs)}")
+
+    published, missing = {}, 0
+    if dry_run:
+        jobs = jobs[:10]
+
+    def task(job, attempt):
+        return publish_source(job, attempt, upload=not dry_run)
+
+    for job, result in run_with_retries(jobs, task, max_workers=workers,
+                                        max_attempts=MAX_ATTEMPTS, base_delay=RETRY_DELAY):
+        if result:
+            published[job] = result
+        else:
+            missing += 1
+    mapping = {ref: new_ref(ref, published) for ref in refs}
+    changed = {old: new for old, new in mapping.items() if old != new}
+    print(f"  Hashed: {len(published)}  Missing source: {missing}  References to repoint: {len(changed)}")
+
+    if dry_run:
+        for old, new in list(changed.items())[:10]:
+            print(f"  {old}\n    → {new}")
+        print("\n  [DRY RUN] Only the first 10 sources were hashed; nothing was uploaded or repointed.")
+        return
+
+    files = {}
+    new_vehicle = {k: changed.get(v, v) for k, v in vehicle.items()}
+    if new_vehicle != vehicle:
+        files[VEHICLE_URLS] = _dump(new_vehicle, vehicle_raw.endswith("\n"))
+    for path, raw, metadata in galleries:
+        updated = rewrite_gallery(metadata, changed)
+        if updated != metadata:
+            files[path] = _dump(updated, raw.endswith("\n"))
+
+    by_url = {}
+    for row in catalog:
+        if row["image_url"] in changed:
+            by_url.setdefault(row["image_url"], []).append(row["id"])
+    patches = [(ids[i:i + PATCH_ID_BATCH], old, changed[old])
+               for old, ids in by_url.items() for i in range(0, len(ids), PATCH_ID_BATCH)]
+
+    if not files and not patches:
+        print("\n  Everything is already published.")
+        return
+    print(f"\n  Switching: {len(files)} files, {sum(len(p[0]) for p in patches)} car_catalog rows...")
+    if not switch(files, patches):
+        raise SystemExit("  Switch aborted; DB reverted and manifests untouched. Hashed objects stay for the next run.")
+    print("  Done. Superseded objects are left for storage_gc.py.\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Publish images under content-hashed keys and repoint references")
+    parser.add_argument("--only", help=f"Comma-separated subset of: {', '.join(SOURCES)}")
+    parser.add_argument("--dry-run", action="store_true", help="Hash a sample and show the repoints; no uploads")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    args = parser.parse_args()
+
+    sources = tuple(s.strip() for s in args.only.split(",")) if args.only else SOURCES
+    unknown = set(sources) - set(SOURCES)
+    if unknown:
+        parser.error(f"unknown source(s): {', '.join(sorted(unknown))}")
+    run(sources, dry_run=args.dry_run, workers=args.workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -16,20 +16,18 @@ import json
 import re
 import time
 import urllib.request
-import urllib.error
 from pathlib import Path
 from typing import Optional, List
 
+from blob_cache import looks_like_image, shared_cache
+from media_tools.config import AUTH, SUPABASE_URL, require_service_key
+from media_tools.net import request
+from media_tools.slugs import model_to_slug
+
 PROJECT_ROOT = Path(__file__).parent.parent
 URLS_JSON    = PROJECT_ROOT / "public/data/vehicle-image-urls.json"
 BRAND_MODEL_IMAGES_3W = PROJECT_ROOT / "public/data/brand-model-images/3w"
 
-SUPABASE_URL = "https://llsvbyeumrfngjvbedbz.supabase.co"
-SUPABASE_SERVICE_KEY = (
-    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
-    "eyJpc3MiOiJzdXBhYmFzZSIsInJlZiI6Imxsc3ZieWV1bXJmbmdqdmJlZGJ6Iiwicm9sZSI6InNlcnZpY2Vfcm9sZSIsImlhdCI6MTc3MTMwODMxNywiZXhwIjoyMDg2ODg0MzE3fQ."
-    "NUlqttWkhTpQEcTCLQ7GPLkQvEpoW-6g4UuEPkYJnaE"
-)
 BUCKET = "vehicle-images"
 MIN_IMAGE_BYTES = 20_000
 
@@ -58,16 +56,24 @@ def fetch_page_images(page_url: str) -> List[str]:
         return []
 
 
+def _download(url: str) -> bytes:
+    req = urllib.request.Request(url, headers=HEADERS)
+    with urllib.request.urlopen(req, timeout=20) as r:
+        return r.read()
+
+
+def _is_image(data: bytes) -> bool:
+    return looks_like_image(data, MIN_IMAGE_BYTES)
+
+
 def try_fetch_image(url: str) -> Optional[bytes]:
-    """Fetch an image URL, return bytes if >=MIN_IMAGE_BYTES, else None."""
+    """Fetch an image URL (via the shared blob cache), return bytes if an image >=MIN_IMAGE_BYTES, else None."""
     try:
-        req = urllib.request.Request(url, headers=HEADERS)
-        with urllib.request.urlopen(req, timeout=20) as r:
-            data = r.read()
-        if len(data) >= MIN_IMAGE_BYTES:
+        # validated before caching, so error pages are never stored for the URL
+        data = shared_cache().fetch(url, _download, validate=_is_image)
+        if data:
             return data
-        else:
-            print(f"      Too small ({len(data):,} bytes): {url}")
+        print(f"      Not an image or under {MIN_IMAGE_BYTES:,} bytes: {url}")
     except Exception as e:
         print(f"      Fetch image failed: {e}")
     return None
@@ -76,22 +82,9 @@ def try_fetch_image(url: str) -> Optional[bytes]:
 def supabase_upload(path_in_bucket: str, image_bytes: bytes) -> str:
     """Upload bytes to Supabase Storage (upsert), return public URL."""
     url = f"{SUPABASE_URL}/storage/v1/object/{BUCKET}/{path_in_bucket}"
-    req = urllib.request.Request(
-        url,
-        data=image_bytes,
-        method="POST",
-        headers={
-            "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}",
-            "Content-Type": "image/jpeg",
-            "x-upsert": "true",
-        },
-    )
-    try:
-        with urllib.request.urlopen(req) as resp:
-            pass
-    except urllib.error.HTTPError as e:
-        body = e.read().decode()
-        raise RuntimeError(f"Upload failed ({e.code}): {body}")
+    status, body = request("POST", url, image_bytes, {**AUTH, "Content-Type": "image/jpeg", "x-upsert": "true"})
+    if status not in (200, 201):
+        raise RuntimeError(f"Upload failed ({status}): {body.decode(errors='replace')}")
     return f"{SUPABASE_URL}/storage/v1/object/public/{BUCKET}/{path_in_bucket}"
 
 
@@ -105,6 +98,7 @@ def get_first_brand_image(all_imgs: List[str], brand_frag: str) -> Optional[str]
 
 
 def main():
+    require_service_key()
     with open(URLS_JSON) as f:
         urls: dict = json.load(f)
 
@@ -232,13 +226,6 @@ def main():
     # ─────────────────────────────────────────────────────────────────────────
     # DYNAMIC BRANDS — missing local files
     # ─────────────────────────────────────────────────────────────────────────
-    # modelToSlug: lower, remove periods, non-alphanumeric → hyphen, trim hyphens
-    def model_to_slug(m: str) -> str:
-        s = m.lower()
-        s = re.sub(r'\.', '', s)
-        s = re.sub(r'[^a-z0-9]+', '-', s)
-        return s.strip('-')
-
     dynamic_missing = [
         # (brand_id, model_name, [(page_url, img_frag)])
         ("yc-ev", "Yatri Cart", [
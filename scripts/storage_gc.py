@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+storage_gc.py
+
+Finds objects in the Supabase Storage buckets that nothing references any
+more (left behind by x-upsert uploads after slug renames, re-scrapes, …)
+and reports, quarantines or deletes them.
+
+References, collected into one in-memory set of (bucket, key):
+  - public/data/vehicle-image-urls.json            (public URLs)
+  - car_catalog.image_url                          (all rows, paginated)
+  - 4W gallery metadata.json files                 (any public URL or
+                                                    /data/brand-model-images/… path)
+  - public/data/brand-model-images/{2w,3w,4w}      (the local tree
+                                                    upload_brand_images_to_supabase.py mirrors)
+  - 2W/3W catalog keys                             (vehicle-images/{2w,3w}/{brandId}/{slug}.{jpg,png,webp},
+                                                    which the catalog routes and getScrapedImageUrls
+                                                    build from public/data/{2w,3w}, brand-models.json
+                                                    and the static 3W catalog; brandId is both the
+                                                    JSON brandId and brandNameToId of the brand name)
+  - the stable key behind every content-hashed ref (publish_hashed_images.py re-hashes from it)
+
+Objects under dealer-assets/ are uploaded by dealers and referenced from the
+dealer tables, which this script does not read; they are never orphans.
+
+Buckets are listed concurrently (one request per folder page), then every
+listed key is checked against the set.
+
+Default is a dry run: per-bucket counts and reclaimable bytes, plus a JSON
+report (scripts/storage_gc_report.json). --quarantine moves orphans under
+_quarantine/{stamp}/ in the same bucket (reversible); --delete removes them in
+batches. Destructive modes refuse to run if any reference source failed to
+load, skip objects younger than --min-age-hours, and stop if a bucket would
+lose MAX_ORPHAN_SHARE or more of its objects unless --force is given.
+
+Point SUPABASE_URL at scripts/local_supabase.py to try it safely.
+
+Usage:
+  python3 scripts/storage_gc.py                          # dry run, all buckets
+  python3 scripts/storage_gc.py --bucket vehicle-images --quarantine
+  python3 scripts/storage_gc.py --purge-quarantine 14    # delete quarantines older than 14 days
+"""
+
+import argparse
+import json
+import re
+import time
+import urllib.parse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from media_tools.config import AUTH, DATA_DIR, PROJECT_ROOT, PUBLIC_MARKER, SUPABASE_URL
+from media_tools.net import request
+from media_tools.slugs import model_to_slug
+from publish_hashed_images import stable_key
+
+VEHICLE_URLS = DATA_DIR / "vehicle-image-urls.json"
+MIRROR_DIR   = DATA_DIR / "brand-model-images"
+GALLERY_ROOT = MIRROR_DIR / "4w-galleries"
+BRAND_MODELS = PROJECT_ROOT / "lib" / "data" / "brand-models.json"
+THREE_W_TS   = PROJECT_ROOT / "lib" / "data" / "three-wheelers.ts"
+BRAND_MAP_TS = PROJECT_ROOT / "lib" / "utils" / "brand-model-images.ts"
+REPORT_JSON  = Path(__file__).parent / "storage_gc_report.json"
+
+BUCKETS      = ["car-images", "brand-model-images", "vehicle-images"]
+MIRROR_CATS  = ["2w", "3w", "4w"]
+WORKERS      = 16
+LIST_PAGE    = 1000
+DELETE_BATCH = 1000
+CATALOG_PAGE = 1000
+IMAGE_EXTENSIONS = ("jpg", "png", "webp")   # getScrapedImageUrls tries each
+QUARANTINE_PREFIX = "_quarantine/"
+PROTECTED_PREFIXES = ("dealer-assets/",)   # dealer uploads, referenced from tables not read here
+MIN_AGE_HOURS     = 24     # never touch objects this fresh (uploads may be mid-flight)
+MAX_ORPHAN_SHARE  = 0.5    # refuse to remove this share of a bucket or more without --force
+
+LOCAL_PREFIX  = "/data/brand-model-images/"
+
+
+def _request(method: str, url: str, payload=None, timeout: int = 60, auth: "dict | None" = None) -> "tuple[int, bytes]":
+    return request(method, url, headers=AUTH if auth is None else auth, json_body=payload, timeout=timeout)
+
+
+# ── References ───────────────────────────────────────────────────────────────
+
+def parse_ref(value: str) -> "tuple[str, str] | None":
+    """Public object URL or local brand-model-images path → (bucket, key)."""
+    if PUBLIC_MARKER in value:
+        tail = value.split(PUBLIC_MARKER, 1)[1].split("?", 1)[0].split("#", 1)[0]
+        bucket, _, key = urllib.parse.unquote(tail).partition("/")
+        return (bucket, key) if key else None
+    if value.startswith(LOCAL_PREFIX):
+        return "brand-model-images", urllib.parse.unquote(value[len(LOCAL_PREFIX):].split("?", 1)[0])
+    return None
+
+
+def _walk_strings(node):
+    if isinstance(node, str):
+        yield node
+    elif isinstance(node, dict):
+        for value in node.values():
+            yield from _walk_strings(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _walk_strings(value)
+
+
+def refs_from_strings(values) -> "set[tuple[str, str]]":
+    return {ref for ref in map(parse_ref, values) if ref}
+
+
+def fetch_catalog_urls() -> "list[str]":
+    urls, offset = [], 0
+    while True:
+        status, body = _request("GET", f"{SUPABASE_URL}/rest/v1/car_catalog?select=image_url"
+                                       f"&image_url=not.is.null&order=id&limit={CATALOG_PAGE}&offset={offset}")
+        if status != 200:
+            raise RuntimeError(f"car_catalog query failed ({status}): {body[:200]!r}")
+        rows = json.loads(body)
+        urls += [row["image_url"] for row in rows if row.get("image_url")]
+        if len(rows) < CATALOG_PAGE:
+            return urls
+        offset += CATALOG_PAGE
+
+
+def _brand_folder_map(cat: str) -> "dict[str, str]":
+    """BRAND_FOLDER_MAP_{2W,3W} from brand-model-images.ts (brandNameToId's lookup tables)."""
+    name = f"BRAND_FOLDER_MAP_{cat.upper()}"
+    block = re.search(rf"{name}[^{{]*\{{(.*?)\n\}}", BRAND_MAP_TS.read_text(), re.S)
+    if not block:
+        raise RuntimeError(f"{name} not found in {BRAND_MAP_TS}")
+    return dict(re.findall(r'"([^"]+)":\s*"([^"]+)"', block.group(1)))
+
+
+def _brand_id(brand: str, folders: "dict[str, str]") -> str:
+    """brandNameToId(brand, cat) for the category whose folder map is given."""
+    lower = brand.lower().strip()
+    return folders.get(lower) or re.sub(r"[^a-z0-9]+", "-", lower).strip("-")
+
+
+def catalog_vehicle_keys() -> "set[tuple[str, str]]":
+    """
+    vehicle-images keys the 2W/3W catalog builds at runtime instead of reading
+    them from a manifest: app/api/{admin,dashboard}/catalog/route.ts (data
+    files, JSON brandId) and the static catalogs / getScrapedImageUrls
+    (brandNameToId of the brand name, every IMAGE_EXTENSIONS fallback).
+    """
+    folders = {cat: _brand_folder_map(cat) for cat in ("2w", "3w")}
+
+    def keys_for(cat, brand_ids, model):
+        slug = model_to_slug(model)
+        if not slug:
+            return set()
+        return {("vehicle-images", f"{cat}/{brand_id}/{slug}.{ext}")
+                for brand_id in brand_ids if brand_id for ext in IMAGE_EXTENSIONS}
+
+    keys = set()
+    for cat in ("2w", "3w"):
+        for path in sorted((DATA_DIR / cat).glob("*.json")):
+            raw = json.loads(path.read_text())
+            if not isinstance(raw, dict):
+                continue
+            brand_ids = {raw.get("brandId") or path.stem}
+            if raw.get("brand"):
+                brand_ids.add(_brand_id(raw["brand"], folders[cat]))
+            for vehicle in raw.get("vehicles") or []:
+                for field in ("model", "variant_name"):
+                    model = str(vehicle.get(field) or "").strip()
+                    keys |= keys_for(cat, brand_ids, model.split("/")[0].strip() if cat == "3w" else model)
+
+    for group in json.loads(BRAND_MODELS.read_text()).get("threeWheelers", []):
+        models = group.get("models") or []
+        if isinstance(models, dict):
+            models = [m for ms in models.values() if isinstance(ms, list) for m in ms]
+        for model in models:
+            keys |= keys_for("3w", {_brand_id(group["brand"], folders["3w"])}, model)
+    for brand, model in re.findall(r"brand: '([^']+)', model: '([^']+)'", THREE_W_TS.read_text()):
+        keys |= keys_for("3w", {_brand_id(brand, folders["3w"])}, model)
+    return keys
+
+
+def load_references() -> "tuple[set, dict, list]":
+    """Returns (refs, per-source counts, failed source names)."""
+    refs, counts, failed = set(), {}, []
+
+    def add(name, loader):
+        try:
+            found = loader()
+        except Exception as e:
+            print(f"  ❌ {name}: {e}")
+            failed.append(name)
+            return
+        counts[name] = len(found)
+        refs.update(found)
+
+    add("vehicle-image-urls.json", lambda: refs_from_strings(json.loads(VEHICLE_URLS.read_text()).values()))
+    add("car_catalog.image_url", lambda: refs_from_strings(fetch_catalog_urls()))
+    add("gallery metadata", lambda: refs_from_strings(
+        s for meta in GALLERY_ROOT.rglob("metadata.json") for s in _walk_strings(json.loads(meta.read_text()))
+    ))
+    add("brand-model-images mirror", lambda: {
+        ("brand-model-images", p.relative_to(MIRROR_DIR).as_posix())
+        for cat in MIRROR_CATS for p in (MIRROR_DIR / cat).rglob("*") if p.is_file()
+    })
+    add("2W/3W catalog keys", catalog_vehicle_keys)
+    add("stable keys of hashed refs", lambda: {(b, stable_key(k)) for b, k in refs if stable_key(k) != k})
+    return refs, counts, failed
+
+
+# ── Listing ──────────────────────────────────────────────────────────────────
+
+def list_folder(bucket: str, prefix: str, base_url: str = None, auth: dict = None) -> "tuple[list[dict], list[str]]":
+    """One folder, all pages. Returns (objects with full keys, subfolder prefixes)."""
+    objects, folders, offset = [], [], 0
+    while True:
+        status, body = _request("POST", f"{base_url or SUPABASE_URL}/storage/v1/object/list/{bucket}", {
+            "prefix": prefix, "limit": LIST_PAGE, "offset": offset,
+            "sortBy": {"column": "name", "order": "asc"},
+        }, auth=auth)
+        if status != 200:
+            raise RuntimeError(f"list {bucket}/{prefix} failed ({status}): {body[:200]!r}")
+        entries = json.loads(body)
+        for entry in entries:
+            key = f"{prefix}/{entry['name']}" if prefix else entry["name"]
+            if entry.get("id") is None:
+                folders.append(key)
+            else:
+                meta = entry.get("metadata") or {}
+                objects.append({"key": key, "size": int(meta.get("size") or 0),
+                                "updated_at": entry.get("updated_at") or entry.get("created_at")})
+        if len(entries) < LIST_PAGE:
+            return objects, folders
+        offset += LIST_PAGE
+
+
+def list_bucket(bucket: str, workers: int = WORKERS, base_url: str = None, auth: dict = None) -> "list[dict]":
+    """
+    Every object in bucket; folders are listed concurrently as they are
+    discovered. base_url / auth default to this module's SUPABASE_URL / AUTH.
+    """
+    objects = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(list_folder, bucket, "", base_url, auth)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                found, folders = future.result()
+                objects += found
+                pending |= {pool.submit(list_folder, bucket, folder, base_url, auth) for folder in folders}
+    return objects
+
+
+def _age_hours(stamp: "str | None", now: datetime) -> float:
+    if not stamp:
+        return float("inf")
+    try:
+        return (now - datetime.fromisoformat(stamp.replace("Z", "+00:00"))).total_seconds() / 3600
+    except ValueError:
+        return float("inf")
+
+
+# ── Actions ──────────────────────────────────────────────────────────────────
+
+def delete_objects(bucket: str, keys: "list[str]") -> int:
+    deleted = 0
+    for start in range(0, len(keys), DELETE_BATCH):
+        batch = keys[start:start + DELETE_BATCH]
+        status, body = _request("DELETE", f"{SUPABASE_URL}/storage/v1/object/{bucket}", {"prefixes": batch})
+        if status != 200:
+            print(f"  ❌ delete batch in {bucket} failed ({status}): {body[:200]!r}")
+            continue
+        deleted += len(json.loads(body))
+    return deleted
+
+
+def quarantine_objects(bucket: str, keys: "list[str]", stamp: str, workers: int = WORKERS) -> int:
+    def move(key):
+        status, _ = _request("POST", f"{SUPABASE_URL}/storage/v1/object/move", {
+            "bucketId": bucket, "sourceKey": key, "destinationKey": f"{QUARANTINE_PREFIX}{stamp}/{key}",
+        })
+        return status == 200
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return sum(pool.map(move, keys))
+
+
+def expired_quarantine(objects: "list[dict]", days: int, now: datetime) -> "list[str]":
+    """Quarantined keys whose batch stamp (_quarantine/YYYYmmddTHHMMSS/…) is older than days."""
+    cutoff = now - timedelta(days=days)
+    keys = []
+    for obj in objects:
+        stamp = obj["key"][len(QUARANTINE_PREFIX):].split("/", 1)[0]
+        try:
+            if datetime.strptime(stamp, "%Y%m%dT%H%M%S").replace(tzinfo=timezone.utc) < cutoff:
+                keys.append(obj["key"])
+        except ValueError:
+            continue
+    return keys
+
+
+def collect(buckets, refs, min_age_hours: float, workers: int) -> dict:
+    now = datetime.now(timezone.utc)
+    report = {}
+    for bucket in buckets:
+        start = time.time()
+        objects = list_bucket(bucket, workers)
+        live = [o for o in objects if not o["key"].startswith(QUARANTINE_PREFIX)]
+        orphans = [o for o in live
+                   if (bucket, o["key"]) not in refs and not o["key"].startswith(PROTECTED_PREFIXES)]
+        eligible = [o for o in orphans if _age_hours(o["updated_at"], now) >= min_age_hours]
+        listed = {o["key"] for o in live}
+        by_prefix = {}
+        for o in eligible:
+            prefix = "/".join(o["key"].split("/")[:2])
+            by_prefix[prefix] = by_prefix.get(prefix, 0) + o["size"]
+        report[bucket] = {
+            "objects": len(live),
+            "bytes": sum(o["size"] for o in live),
+            "referenced": len(live) - len(orphans),
+            "orphans": len(eligible),
+            "too_recent": len(orphans) - len(eligible),
+            "reclaimable_bytes": sum(o["size"] for o in eligible),
+            "quarantined": [o for o in objects if o["key"].startswith(QUARANTINE_PREFIX)],
+            "dangling_refs": sorted(k for b, k in refs if b == bucket and k not in listed),
+            "orphan_bytes_by_prefix": dict(sorted(by_prefix.items(), key=lambda kv: -kv[1])),
+            "orphan_keys": sorted(o["key"] for o in eligible),
+            "list_seconds": round(time.time() - start, 2),
+        }
+    return report
+
+
+def _mb(n: int) -> str:
+    return f"{n / 1_048_576:.1f} MB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Garbage-collect unreferenced Supabase Storage objects")
+    parser.add_argument("--bucket", action="append", help=f"Limit to these buckets (default: {', '.join(BUCKETS)})")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--quarantine", action="store_true", help=f"Move orphans under {QUARANTINE_PREFIX}")
+    action.add_argument("--delete", action="store_true", help="Delete orphans")
+    action.add_argument("--purge-quarantine", type=int, metavar="DAYS",
+                        help="Delete quarantined objects older than DAYS")
+    parser.add_argument("--min-age-hours", type=float, default=MIN_AGE_HOURS)
+    parser.add_argument("--force", action="store_true", help=f"Allow removing >= {MAX_ORPHAN_SHARE * 100:.0f}%% of a bucket")
+    parser.add_argument("--report", type=Path, default=REPORT_JSON)
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    args = parser.parse_args()
+    buckets = args.bucket or BUCKETS
+
+    print(f"  Storage: {SUPABASE_URL}")
+    refs, counts, failed = load_references()
+    for name, count in counts.items():
+        print(f"  refs  {name:<28} {count:>7}")
+    print(f"  refs  {'total (deduped)':<28} {len(refs):>7}")
+
+    report = collect(buckets, refs, args.min_age_hours, args.workers)
+    args.report.write_text(json.dumps({"sources": counts, "failed_sources": failed, "buckets": report}, indent=1))
+
+    print(f"\n  {'bucket':<20} {'objects':>8} {'orphans':>8} {'reclaimable':>12} {'dangling':>9}")
+    for bucket, row in report.items():
+        print(f"  {bucket:<20} {row['objects']:>8} {row['orphans']:>8} {_mb(row['reclaimable_bytes']):>12} "
+              f"{len(row['dangling_refs']):>9}")
+    total = sum(r["reclaimable_bytes"] for r in report.values())
+    print(f"\n  Reclaimable: {_mb(total)}   Report: {args.report}")
+
+    if args.purge_quarantine is not None:
+        now = datetime.now(timezone.utc)
+        for bucket, row in report.items():
+            keys = expired_quarantine(row["quarantined"], args.purge_quarantine, now)
+            print(f"  {bucket}: purged {delete_objects(bucket, keys)}/{len(keys)} quarantined objects")
+        return
+    if not (args.quarantine or args.delete):
+        print("  Dry run — pass --quarantine or --delete to act on orphans.")
+        return
+
+    if failed:
+        print(f"  Refusing to modify storage: reference sources failed to load ({', '.join(failed)})")
+        raise SystemExit(1)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S")
+    for bucket, row in report.items():
+        keys = row["orphan_keys"]
+        if not keys:
+            continue
+        if row["objects"] and len(keys) / row["objects"] >= MAX_ORPHAN_SHARE and not args.force:
+            print(f"  ⚠ {bucket}: {len(keys)}/{row['objects']} objects unreferenced — skipped (use --force)")
+            continue
+        if args.delete:
+            print(f"  {bucket}: deleted {delete_objects(bucket, keys)}/{len(keys)}")
+        else:
+            print(f"  {bucket}: quarantined {quarantine_objects(bucket, keys, stamp, args.workers)}/{len(keys)} "
+                  f"under {QUARANTINE_PREFIX}{stamp}/")
+
+
+if __name__ == "__main__":
+    main()
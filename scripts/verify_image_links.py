@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+verify_image_links.py
+
+Checks that every published image URL still resolves:
+
+  - public/data/vehicle-image-urls.json     (2W/3W/4W Supabase URLs)
+  - car_catalog.image_url                   (via PostgREST)
+  - 4W gallery metadata.json paths          (on disk under public/, or against
+                                             --site-base when given)
+
+Requests run on asyncio with a small pool of persistent connections per host
+(http.client in worker threads, so keep-alive is reused across checks). Each
+host gets its own --pool-size threads, so the pool size is the real per-host
+concurrency and one slow host cannot starve the others. Each URL gets a
+HEAD; hosts that refuse HEAD get a one-byte ranged GET instead.
+ETags from the last run are kept in scripts/.link_health_cache.json and sent
+as If-None-Match, so unchanged objects come back as cheap 304s.
+
+The report (scripts/link_health_report.json) groups results by
+category/brand. Exit status is 1 when anything is broken, so the script can
+gate a deploy.
+
+Usage:
+  python3 scripts/verify_image_links.py
+  python3 scripts/verify_image_links.py --skip-catalog --pool-size 16
+  python3 scripts/verify_image_links.py --site-base https://dealer.indrav.in
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import ssl
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from media_tools.config import AUTH, PRODUCTION_URL, PUBLIC_DIR, SUPABASE_URL
+
+VEHICLE_URLS = PUBLIC_DIR / "data" / "vehicle-image-urls.json"
+GALLERY_ROOT = PUBLIC_DIR / "data" / "brand-model-images" / "4w-galleries"
+CACHE_JSON   = Path(__file__).parent / ".link_health_cache.json"
+REPORT_JSON  = Path(__file__).parent / "link_health_report.json"
+
+POOL_SIZE     = 12     # persistent connections per host
+TIMEOUT       = 20
+MAX_REDIRECTS = 3
+CATALOG_PAGE  = 1000
+GALLERY_FIELDS = ("hero", "exterior", "interior", "feature", "colorImages")
+HEAD_REFUSED  = {403, 405, 501}   # some CDNs reject HEAD outright; retry as ranged GET
+
+USER_AGENT = "dealer-site-pro-link-check/1.0"
+
+
+# ── Connection pool ──────────────────────────────────────────────────────────
+
+class HostPool:
+    """
+    Up to size keep-alive connections to one scheme://host, handed out via an
+    asyncio queue, and size threads to drive them (asyncio's default executor
+    is shared and sized by CPU count, which would cap every host's pool).
+    """
+
+    def __init__(self, scheme: str, netloc: str, size: int):
+        self.scheme, self.netloc = scheme, netloc
+        self.idle = asyncio.Queue()
+        for _ in range(size):
+            self.idle.put_nowait(None)  # opened lazily
+        self.executor = ThreadPoolExecutor(max_workers=size, thread_name_prefix=f"link-check-{netloc}")
+
+    def _connect(self):
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.netloc, timeout=TIMEOUT, context=ssl.create_default_context())
+        return http.client.HTTPConnection(self.netloc, timeout=TIMEOUT)
+
+    def _exchange(self, conn, method: str, path: str, headers: dict):
+        """Blocking request on conn (reconnecting once if the server dropped it)."""
+        for attempt in (0, 1):
+            conn = conn or self._connect()
+            try:
+                conn.request(method, path, headers=headers)
+                resp = conn.getresponse()
+                # A ranged GET that the server ignores would stream the whole object: drop the connection
+                if method == "GET" and resp.status == 200:
+                    conn.close()
+                    return None, resp.status, dict(resp.getheaders())
+                resp.read()
+                return conn, resp.status, dict(resp.getheaders())
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                conn = None
+                if attempt:
+                    raise
+
+    async def request(self, method: str, path: str, headers: dict) -> "tuple[int, dict]":
+        conn = await self.idle.get()
+        try:
+            conn, status, resp_headers = await asyncio.get_running_loop().run_in_executor(
+                self.executor, self._exchange, conn, method, path, headers)
+            return status, {k.lower(): v for k, v in resp_headers.items()}
+        except Exception:
+            conn = None
+            raise
+        finally:
+            self.idle.put_nowait(conn)
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        while not self.idle.empty():
+            conn = self.idle.get_nowait()
+            if conn is not None:
+                conn.close()
+
+
+class Checker:
+    def __init__(self, pool_size: int, cache: dict):
+        self.pool_size = pool_size
+        self.pools = {}
+        self.cache = cache
+
+    def pool(self, scheme: str, netloc: str) -> HostPool:
+        key = (scheme, netloc)
+        if key not in self.pools:
+            self.pools[key] = HostPool(scheme, netloc, self.pool_size)
+        return self.pools[key]
+
+    def close(self):
+        for pool in self.pools.values():
+            pool.close()
+
+    async def check(self, url: str) -> dict:
+        started = time.perf_counter()
+        headers = {"User-Agent": USER_AGENT}
+        cached = self.cache.get(url)
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+
+        current, method, status, resp = url, "HEAD", 0, {}
+        try:
+            for _ in range(MAX_REDIRECTS + 1):
+                parts = urllib.parse.urlsplit(current)
+                path = parts.path + (f"?{parts.query}" if parts.query else "")
+                pool = self.pool(parts.scheme, parts.netloc)
+                status, resp = await pool.request(method, path, headers)
+                if method == "HEAD" and status in HEAD_REFUSED:
+                    method = "GET"
+                    status, resp = await pool.request(method, path, {**headers, "Range": "bytes=0-0"})
+                if status in (301, 302, 303, 307, 308) and resp.get("location"):
+                    current = urllib.parse.urljoin(current, resp["location"])
+                    continue
+                break
+        except Exception as e:
+            return {"url": url, "ok": False, "status": 0, "error": str(e)[:200],
+                    "ms": round((time.perf_counter() - started) * 1000)}
+
+        ok = status in (200, 206, 304)
+        etag = (resp.get("etag") or (cached or {}).get("etag")) if ok else None
+        content_type = resp.get("content-type", "")
+        row = {"url": url, "ok": ok, "status": status, "method": method,
+               "ms": round((time.perf_counter() - started) * 1000)}
+        if ok and status != 304 and content_type and not content_type.startswith(("image/", "application/octet-stream")):
+            row.update(ok=False, error=f"not an image ({content_type})")
+        if current != url:
+            row["final_url"] = current
+        if row["ok"] and etag:
+            self.cache[url] = {"etag": etag}
+        else:
+            self.cache.pop(url, None)
+        return row
+
+
+# ── URL sources ──────────────────────────────────────────────────────────────
+
+def vehicle_urls() -> "list[tuple[str, str, str]]":
+    """(category, brand, url) from vehicle-image-urls.json; keys look like '3w/bajaj/model.jpg'."""
+    rows = []
+    for key, url in json.loads(VEHICLE_URLS.read_text()).items():
+        parts = key.split("/")
+        rows.append((parts[0], parts[1] if len(parts) > 2 else "", url))
+    return rows
+
+
+def catalog_urls() -> "list[tuple[str, str, str]]":
+    headers = AUTH
+    rows, offset = [], 0
+    while True:
+        url = (f"{SUPABASE_URL}/rest/v1/car_catalog?select=id,make,image_url&image_url=not.is.null"
+               f"&order=id&limit={CATALOG_PAGE}&offset={offset}")
+        with urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=60) as resp:
+            page = json.loads(resp.read())
+        rows += [("4w-catalog", row.get("make") or "", row["image_url"]) for row in page if row.get("image_url")]
+        if len(page) < CATALOG_PAGE:
+            return rows
+        offset += CATALOG_PAGE
+
+
+def gallery_paths() -> "list[tuple[str, str, str]]":
+    rows = []
+    for meta_path in sorted(GALLERY_ROOT.rglob("metadata.json")):
+        brand = meta_path.relative_to(GALLERY_ROOT).parts[0]
+        metadata = json.loads(meta_path.read_text())
+        for field in GALLERY_FIELDS:
+            values = metadata.get(field) or []
+            for value in [values] if isinstance(values, str) else values:
+                if isinstance(value, str) and value:
+                    rows.append(("4w-gallery", brand, value))
+    return rows
+
+
+# ── Run ──────────────────────────────────────────────────────────────────────
+
+def check_local(path: str) -> dict:
+    target = PUBLIC_DIR / urllib.parse.unquote(path.split("?", 1)[0]).lstrip("/")
+    ok = target.is_file() and target.stat().st_size > 0
+    return {"url": path, "ok": ok, "status": 200 if ok else 404, "method": "FILE", "ms": 0}
+
+
+async def verify(entries, pool_size: int, cache: dict, site_base: "str | None") -> "list[dict]":
+    checker = Checker(pool_size, cache)
+    unique = {}
+    for _, _, url in entries:
+        unique.setdefault(url, None)
+
+    async def one(url):
+        if SUPABASE_URL != PRODUCTION_URL and url.startswith(PRODUCTION_URL):
+            # Staging / local stand-in: same keys, different origin
+            row = await checker.check(SUPABASE_URL + url[len(PRODUCTION_URL):])
+            row["url"] = url
+            return row
+        if url.startswith("/"):
+            if not site_base:
+                return check_local(url)
+            row = await checker.check(site_base.rstrip("/") + url)
+            row["url"] = url
+            return row
+        return await checker.check(url)
+
+    try:
+        return await asyncio.gather(*(one(url) for url in unique))
+    finally:
+        checker.close()
+
+
+def group_report(entries, results: "list[dict]") -> dict:
+    by_url = {row["url"]: row for row in results}
+    groups = {}
+    for category, brand, url in entries:
+        group = groups.setdefault(category, {}).setdefault(brand or "(none)", {"ok": 0, "broken": []})
+        row = by_url[url]
+        if row["ok"]:
+            group["ok"] += 1
+        else:
+            group["broken"].append({k: row[k] for k in ("url", "status", "error") if k in row})
+    return groups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify every published image URL resolves")
+    parser.add_argument("--skip-catalog", action="store_true", help="Do not query car_catalog")
+    parser.add_argument("--skip-gallery", action="store_true")
+    parser.add_argument("--site-base", help="Check gallery paths over HTTP against this origin instead of disk")
+    parser.add_argument("--pool-size", type=int, default=POOL_SIZE, help="Connections per host")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore stored ETags")
+    parser.add_argument("--report", type=Path, default=REPORT_JSON)
+    args = parser.parse_args()
+
+    entries = vehicle_urls()
+    if not args.skip_catalog:
+        entries += catalog_urls()
+    if not args.skip_gallery:
+        entries += gallery_paths()
+
+    cache = {} if args.no_cache or not CACHE_JSON.exists() else json.loads(CACHE_JSON.read_text())
+    start = time.time()
+    results = asyncio.run(verify(entries, args.pool_size, cache, args.site_base))
+    elapsed = time.time() - start
+    CACHE_JSON.write_text(json.dumps(cache, indent=0, sort_keys=True))
+
+    groups = group_report(entries, results)
+    broken = [r for r in results if not r["ok"]]
+    revalidated = sum(1 for r in results if r["status"] == 304)
+    args.report.write_text(json.dumps({
+        "checked": len(results), "broken": len(broken), "seconds": round(elapsed, 1), "groups": groups,
+    }, indent=1))
+
+    for category, brands in sorted(groups.items()):
+        bad = {b: g for b, g in brands.items() if g["broken"]}
+        total = sum(g["ok"] + len(g["broken"]) for g in brands.values())
+        print(f"  {'❌' if bad else '✅'} {category:<12} {total:>6} refs  {sum(len(g['broken']) for g in bad.values())} broken")
+        for brand, group in sorted(bad.items()):
+            print(f"       {brand:<24} {len(group['broken'])} broken (e.g. {group['broken'][0]['url']})")
+    print(f"\n  {len(results)} unique URLs in {elapsed:.1f}s ({revalidated} unchanged by ETag), "
+          f"{len(broken)} broken. Report: {args.report}")
+    if broken:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()